@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import os
+
 import streamlit as st
 import numpy as np
 from numpy.typing import NDArray
 import matplotlib.pyplot as plt
-import time
 from matplotlib.ticker import EngFormatter
 
+from laserpad.cache import enable_cache
+from laserpad.progress import BackgroundRun, Cancelled
 from laserpad.geometry import build_radial_mesh
 from laserpad.solver import solve_transient
 from laserpad.beam_profiles import uniform_beam, gaussian_beam, donut_beam
@@ -16,6 +19,8 @@ from laserpad.beam_profiles import uniform_beam, gaussian_beam, donut_beam
 
 def main() -> None:
     st.title("M3: Beam-Shape Transient Heat-Up")
+    # Reruns with unchanged inputs (e.g. after a slider tweak) hit the cache.
+    enable_cache(os.environ.get("LASERPAD_CACHE_DIR"))
 
     r_in = st.number_input("r_inner (mm)", value=0.5) / 1000.0
     r_out = st.number_input("r_outer (mm)", value=1.5) / 1000.0
@@ -36,6 +41,9 @@ def main() -> None:
     max_iter = st.number_input(
         "Max iterations per step", value=1000, min_value=1, step=1
     )
+    scheme = st.selectbox(
+        "Time integration", ["explicit", "implicit", "crank-nicolson"]
+    )
     allow_unstable = st.checkbox("Ignore stability limit")
 
     if dt_ms < 0.01:
@@ -66,40 +74,47 @@ def main() -> None:
             def src(r: NDArray[np.float_]) -> NDArray[np.float_]:
                 return donut_beam(r, r1, r2, q0)
 
+        previous = st.session_state.get("m3_job")
+        if previous is not None:
+            previous[0].cancel()
+        job = BackgroundRun(
+            solve_transient,
+            r_centres,
+            dr,
+            0.0,
+            k,
+            rho_cp,
+            t_max,
+            dt,
+            src,
+            max_steps=int(max_iter),
+            allow_unstable=allow_unstable,
+            scheme=scheme,
+        )
+        st.session_state["m3_job"] = (job, r_centres, beam_type)
+
+    if st.session_state.get("m3_job") is not None:
+        job, r_centres, beam_type = st.session_state["m3_job"]
+        if st.button("Cancel run"):
+            job.cancel()
         progress = st.progress(0)
         status = st.empty()
-        start = time.perf_counter()
-
-        def cb(i: int, total: int) -> None:
-            frac = i / total
-            progress.progress(int(frac * 100))
-            elapsed = time.perf_counter() - start
-            est_total = elapsed / frac if frac else 0.0
-            remaining = est_total - elapsed
-            status.text(
-                f"Iteration {i}/{total} — elapsed {elapsed:.1f}s, ETA {remaining:.1f}s"
-            )
-
+        # The solver runs in a worker thread and this loop only polls it, so
+        # pressing Cancel reruns the script and the rerun cancels the run.
+        while not job.wait(0.1):
+            progress.progress(int(job.fraction * 100))
+            status.text(job.status_text())
+        progress.empty()
+        st.session_state["m3_job"] = None
         try:
-            times, T = solve_transient(
-                r_centres,
-                dr,
-                0.0,
-                k,
-                rho_cp,
-                t_max,
-                dt,
-                src,
-                max_steps=int(max_iter),
-                allow_unstable=allow_unstable,
-                progress_cb=cb,
-            )
+            times, T = job.result()
+        except Cancelled:
+            status.warning(f"Cancelled after {job.elapsed:.1f}s")
+            return
         except ValueError as exc:
-            progress.empty()
             status.error(str(exc))
             return
-        progress.empty()
-        status.success(f"Completed in {time.perf_counter() - start:.1f}s")
+        status.success(f"Completed in {job.elapsed:.1f}s")
         st.session_state["m3_results"] = (r_centres, times, T, beam_type)
 
     if st.session_state["m3_results"] is not None:
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import os
+
 import streamlit as st
 import numpy as np
-import time
 
+from laserpad.cache import enable_cache
+from laserpad.progress import BackgroundRun, Cancelled
 from laserpad.geometry import build_stack_mesh
 from laserpad.solver import solve_transient_2d
 from laserpad.plot import plot_stack_temperature
@@ -13,6 +16,8 @@ from laserpad.plot import plot_stack_temperature
 
 def main() -> None:
     st.title("M4: Multilayer Stack-Up")
+    # Reruns with unchanged inputs (e.g. after a slider tweak) hit the cache.
+    enable_cache(os.environ.get("LASERPAD_CACHE_DIR"))
 
     r_in = st.number_input("r_inner (mm)", value=0.5) / 1000.0
     r_out = st.number_input("r_outer (mm)", value=1.5) / 1000.0
@@ -26,6 +31,7 @@ def main() -> None:
     max_iter = st.number_input(
         "Max iterations per step", value=1000, min_value=1, step=1
     )
+    scheme = st.selectbox("Time integration", ["explicit", "adi", "implicit"])
     allow_unstable = st.checkbox("Ignore stability limit")
 
     if dt_ms < 0.01:
@@ -39,40 +45,47 @@ def main() -> None:
         )
         height = pad_th + sub_th
         q_flux = power_W / (2.0 * np.pi * r_in * height)
+        previous = st.session_state.get("m4_job")
+        if previous is not None:
+            previous[0].cancel()
+        job = BackgroundRun(
+            solve_transient_2d,
+            r_centres,
+            dr,
+            z_centres,
+            dz,
+            mat_idx,
+            q_flux,
+            n_t,
+            dt,
+            max_steps=int(max_iter),
+            allow_unstable=allow_unstable,
+            scheme=scheme,
+        )
+        st.session_state["m4_job"] = (job, r_centres, z_centres)
+
+    if st.session_state.get("m4_job") is not None:
+        job, r_centres, z_centres = st.session_state["m4_job"]
+        if st.button("Cancel run"):
+            job.cancel()
         progress = st.progress(0)
         status = st.empty()
-        start = time.perf_counter()
-
-        def cb(i: int, total: int) -> None:
-            frac = i / total
-            progress.progress(int(frac * 100))
-            elapsed = time.perf_counter() - start
-            est_total = elapsed / frac if frac else 0.0
-            remaining = est_total - elapsed
-            status.text(
-                f"Iteration {i}/{total} — elapsed {elapsed:.1f}s, ETA {remaining:.1f}s"
-            )
-
+        # The solver runs in a worker thread and this loop only polls it, so
+        # pressing Cancel reruns the script and the rerun cancels the run.
+        while not job.wait(0.1):
+            progress.progress(int(job.fraction * 100))
+            status.text(job.status_text())
+        progress.empty()
+        st.session_state["m4_job"] = None
         try:
-            times, T = solve_transient_2d(
-                r_centres,
-                dr,
-                z_centres,
-                dz,
-                mat_idx,
-                q_flux,
-                n_t,
-                dt,
-                max_steps=int(max_iter),
-                allow_unstable=allow_unstable,
-                progress_cb=cb,
-            )
+            times, T = job.result()
+        except Cancelled:
+            status.warning(f"Cancelled after {job.elapsed:.1f}s")
+            return
         except ValueError as exc:
-            progress.empty()
             status.error(str(exc))
             return
-        progress.empty()
-        status.success(f"Completed in {time.perf_counter() - start:.1f}s")
+        status.success(f"Completed in {job.elapsed:.1f}s")
         t_idx = st.slider("Time index", 0, len(times) - 1, 0)
         fig = plot_stack_temperature(r_centres, z_centres, T[t_idx])
         st.pyplot(fig)
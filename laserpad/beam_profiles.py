@@ -1,4 +1,9 @@
-"""Beam profile factories for distributed heat sources."""
+"""Beam profile factories for distributed heat sources.
+
+Beam parameters may be arrays that broadcast against ``r``; e.g.
+``gaussian_beam(r, q, sigmas[:, None])`` returns one profile per sigma, which
+is how batched solver runs are set up.
+"""
 
 from __future__ import annotations
 
@@ -7,23 +12,28 @@ from numpy.typing import NDArray
 from typing import cast
 
 
-def uniform_beam(r: NDArray[np.float_], q0: float) -> NDArray[np.float_]:
+def uniform_beam(
+    r: NDArray[np.float_], q0: float | NDArray[np.float_]
+) -> NDArray[np.float_]:
     """Return constant heat flux q'' = q0 across all radii."""
-    return cast(NDArray[np.float_], np.full_like(r, q0, dtype=float))
+    return cast(NDArray[np.float_], q0 * np.ones_like(r, dtype=float))
 
 
 def gaussian_beam(
-    r: NDArray[np.float_], peak_q: float, sigma: float
+    r: NDArray[np.float_],
+    peak_q: float | NDArray[np.float_],
+    sigma: float | NDArray[np.float_],
 ) -> NDArray[np.float_]:
     """Return a Gaussian heat-flux profile."""
     return cast(NDArray[np.float_], peak_q * np.exp(-0.5 * (r / sigma) ** 2))
 
 
 def donut_beam(
-    r: NDArray[np.float_], inner_r: float, outer_r: float, q0: float
+    r: NDArray[np.float_],
+    inner_r: float | NDArray[np.float_],
+    outer_r: float | NDArray[np.float_],
+    q0: float | NDArray[np.float_],
 ) -> NDArray[np.float_]:
     """Return a simple ring-shaped heat-flux profile."""
-    profile: NDArray[np.float_] = np.zeros_like(r, dtype=float)
     mask = (r >= inner_r) & (r <= outer_r)
-    profile[mask] = q0
-    return profile
+    return cast(NDArray[np.float_], np.where(mask, q0, 0.0).astype(float))
@@ -0,0 +1,271 @@
+"""Content-addressed cache of transient solver results.
+
+The solvers hash their resolved numeric inputs (mesh, material properties,
+evaluated beam profile, boundary conditions, time settings, output
+schedule...) with :func:`stable_hash` and look the key up in a
+:class:`ResultCache`: an in-memory LRU tier, optionally backed by a
+size-capped directory of ``.npz`` files shared between processes. Caching is
+off until a default cache is installed with :func:`enable_cache` (or a cache
+is passed to a solver), after which identical runs return immediately.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .events import EventRecord
+from .geometry import SectorSymmetry
+from .results import TransientResult
+
+# Bump when the meaning of cached inputs or the file layout changes.
+CACHE_VERSION = 1
+
+
+def stable_hash(*parts: Any) -> str:
+    """Return a hex digest of ``parts`` that is stable across processes.
+
+    Arrays hash by dtype, shape and contents; mappings by sorted items;
+    dataclasses and plain objects (e.g. events, waveforms, material tables)
+    by type name and attributes. Callables cannot be hashed; evaluate them
+    first.
+    """
+
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for part in parts:
+        _update(digest, part)
+    return digest.hexdigest()
+
+
+def _update(digest: Any, value: Any) -> None:
+    if value is None or isinstance(value, (bool, int, float, str, np.generic)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"array:{value.dtype.str}:{value.shape};".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b"dict{")
+        for key in sorted(value, key=str):
+            _update(digest, str(key))
+            _update(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}[".encode())
+        for item in value:
+            _update(digest, item)
+        digest.update(b"]")
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        _update(
+            digest,
+            (type(value).__qualname__, dataclasses.asdict(value)),
+        )
+    elif callable(value):
+        raise TypeError(f"Cannot hash callable {value!r}; evaluate it first")
+    elif hasattr(value, "__dict__"):
+        _update(digest, (type(value).__qualname__, vars(value)))
+    else:
+        raise TypeError(f"Cannot hash {type(value).__name__} values")
+
+
+def _nbytes(result: TransientResult) -> int:
+    arrays = [result.times, result.T, result.probe_times, *result.probes.values()]
+    if result.error_estimate is not None:
+        arrays.append(result.error_estimate)
+    return sum(np.asarray(a).nbytes for a in arrays)
+
+
+def _freeze(result: TransientResult) -> TransientResult:
+    """Make the arrays of a cached result read-only, as it is shared."""
+    arrays = [result.times, result.T, result.probe_times, *result.probes.values()]
+    if result.error_estimate is not None:
+        arrays.append(result.error_estimate)
+    for array in arrays:
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+    return result
+
+
+class ResultCache:
+    """Two-tier LRU cache of :class:`~laserpad.results.TransientResult` objects.
+
+    The memory tier holds up to ``max_memory_bytes`` of results. With a
+    ``directory`` every result is also written there as ``<key>.npz``; the
+    least recently used files are deleted once they exceed
+    ``max_disk_bytes``, and a memory miss is served from disk when possible.
+    Cached results are shared, so their arrays are read-only.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 256 * 2**20,
+        directory: str | os.PathLike[str] | None = None,
+        max_disk_bytes: int = 2**30,
+    ) -> None:
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, tuple[TransientResult, int]] = OrderedDict()
+        self._memory_bytes = 0
+
+    def get(self, key: str) -> TransientResult | None:
+        """Return the result stored under ``key``, or ``None``."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        result = self._load(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: TransientResult) -> None:
+        """Store ``result`` under ``key`` in both tiers."""
+        if not isinstance(result.T, np.ndarray):
+            return  # Runs streamed to a frame store already live on disk.
+        _freeze(result)
+        self._remember(key, result)
+        self._save(key, result)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self.directory is not None:
+            for path in self.directory.glob("*.npz"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, result: TransientResult) -> None:
+        size = _nbytes(result)
+        if size > self.max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+        self._memory[key] = (result, size)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.npz"
+
+    def _save(self, key: str, result: TransientResult) -> None:
+        if self.directory is None:
+            return
+        meta: dict[str, Any] = {"probes": list(result.probes)}
+        if result.event is not None:
+            meta["event"] = dataclasses.asdict(result.event)
+        if result.sector is not None:
+            meta["sector"] = dataclasses.asdict(result.sector)
+        arrays = {
+            "times": result.times,
+            "T": np.asarray(result.T),
+            "probe_times": result.probe_times,
+            "meta": np.array(json.dumps(meta)),
+        }
+        for i, values in enumerate(result.probes.values()):
+            arrays[f"probe_{i}"] = values
+        if result.error_estimate is not None:
+            arrays["error_estimate"] = result.error_estimate
+        # Write to a temporary file first so readers never see partial data.
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, self._path(key))
+        self._evict_disk()
+
+    def _load(self, key: str) -> TransientResult | None:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                meta = json.loads(str(data["meta"]))
+                result = TransientResult(
+                    times=data["times"],
+                    T=data["T"],
+                    probe_times=data["probe_times"],
+                    probes={
+                        name: data[f"probe_{i}"]
+                        for i, name in enumerate(meta["probes"])
+                    },
+                    error_estimate=(
+                        data["error_estimate"] if "error_estimate" in data else None
+                    ),
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+        if "event" in meta:
+            result.event = EventRecord(**meta["event"])
+        if "sector" in meta:
+            result.sector = SectorSymmetry(**meta["sector"])
+        os.utime(path)
+        return _freeze(result)
+
+    def _evict_disk(self) -> None:
+        assert self.directory is not None
+        files = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+_DEFAULT_CACHE: ResultCache | None = None
+
+
+def enable_cache(
+    directory: str | os.PathLike[str] | None = None, **options: Any
+) -> ResultCache:
+    """Install (or return the installed) default cache used by the solvers.
+
+    Calling again with the same ``directory`` returns the existing cache, so
+    scripts that rerun in one process (Streamlit apps) keep their entries.
+    ``options`` are passed to :class:`ResultCache`.
+    """
+
+    global _DEFAULT_CACHE
+    wanted = Path(directory) if directory is not None else None
+    if _DEFAULT_CACHE is None or _DEFAULT_CACHE.directory != wanted:
+        _DEFAULT_CACHE = ResultCache(directory=directory, **options)
+    return _DEFAULT_CACHE
+
+
+def disable_cache() -> None:
+    """Remove the default cache; solvers then always recompute."""
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = None
+
+
+def resolve_cache(cache: ResultCache | bool | None) -> ResultCache | None:
+    """Return the cache a solver should use for its ``cache`` argument."""
+    if cache is None or cache is True:
+        return _DEFAULT_CACHE
+    if cache is False:
+        return None
+    return cache
@@ -0,0 +1,172 @@
+"""Periodic checkpoints of fixed-step transient runs.
+
+A solver given ``checkpoint=path`` writes the complete marching state (the
+current field, step index and time, the frames and probe samples recorded so
+far, event history and the delivered heat) to ``path`` every
+``checkpoint_interval`` seconds of wall time. Calling the solver again with
+the same inputs and path resumes from the last checkpoint and yields the
+same result as an uninterrupted run; the file is removed once the run
+completes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .waveforms import Waveform
+
+
+@dataclass
+class Checkpoint:
+    """Marching state after ``step`` steps, as read by :func:`load_checkpoint`.
+
+    Attributes
+    ----------
+    key:
+        Hash of the solver inputs the checkpoint belongs to.
+    step, time:
+        Number of completed steps and the simulated time [s] reached.
+    field:
+        Temperature field after ``step`` steps.
+    delivered:
+        Integral of the power multiplier up to ``time`` [s], i.e. the
+        position within the power waveform (``time`` at constant power).
+    energy_in:
+        Heat delivered so far [J] (per case for batched runs; per metre of
+        pad height for the 1-D radial model).
+    n_frames:
+        Number of frames saved so far.
+    recorder, events:
+        Arrays restoring the frame/probe recorder and the event monitor.
+    """
+
+    key: str
+    step: int
+    time: float
+    field: NDArray[np.float_]
+    delivered: float
+    energy_in: NDArray[np.float_]
+    n_frames: int
+    recorder: dict[str, NDArray[Any]]
+    events: dict[str, NDArray[Any]]
+
+
+def load_checkpoint(path: str | os.PathLike[str]) -> Checkpoint:
+    """Read the checkpoint written to ``path``."""
+    with np.load(path) as data:
+        meta = json.loads(str(data["meta"]))
+        arrays = {name: data[name] for name in data.files if name != "meta"}
+    return Checkpoint(
+        key=meta["key"],
+        step=meta["step"],
+        time=meta["time"],
+        field=arrays.pop("field"),
+        delivered=meta["delivered"],
+        energy_in=arrays.pop("energy_in"),
+        n_frames=meta["n_frames"],
+        recorder={
+            name[9:]: value
+            for name, value in arrays.items()
+            if name.startswith("recorder_")
+        },
+        events={
+            name[7:]: value
+            for name, value in arrays.items()
+            if name.startswith("events_")
+        },
+    )
+
+
+class Checkpointer:
+    """Write checkpoints of one run to ``path`` and load them back.
+
+    ``key`` identifies the run (a hash of its inputs); a checkpoint of a
+    different run at ``path`` is rejected rather than resumed. ``heat_rate``
+    is the heat input [W] at a power multiplier of 1 and ``power`` the
+    run's waveform, used to report the delivered energy. Checkpoints are
+    written only after steps that are multiples of ``stride``, where the
+    stepper holds no state beyond the field (e.g. property refreshes).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        key: str,
+        *,
+        interval: float = 600.0,
+        stride: int = 1,
+        heat_rate: ArrayLike = 0.0,
+        power: Waveform | None = None,
+    ) -> None:
+        if interval < 0:
+            raise ValueError("checkpoint_interval must be non-negative")
+        self.path = Path(path)
+        self.key = key
+        self.interval = interval
+        self.stride = stride
+        self.heat_rate = np.asarray(heat_rate, dtype=float)
+        self.power = power
+        self.resumed: Checkpoint | None = None
+        if self.path.exists():
+            self.resumed = load_checkpoint(self.path)
+            if self.resumed.key != key:
+                raise ValueError(
+                    f"Checkpoint {self.path} was written by a run with other inputs"
+                )
+        self._last = time.perf_counter()
+
+    def due(self, step: int) -> bool:
+        """Whether a checkpoint should be written after ``step`` steps."""
+        return (
+            step % self.stride == 0
+            and time.perf_counter() - self._last >= self.interval
+        )
+
+    def save(
+        self,
+        step: int,
+        t: float,
+        field: NDArray[np.float_],
+        recorder: dict[str, NDArray[Any]],
+        events: dict[str, NDArray[Any]],
+        n_frames: int,
+    ) -> None:
+        """Atomically replace the checkpoint with the state after ``step``."""
+        if self.power is None:
+            delivered = t
+        else:
+            delivered = float(self.power.integral(t) - self.power.integral(0.0))
+        meta = {
+            "key": self.key,
+            "step": step,
+            "time": t,
+            "delivered": delivered,
+            "n_frames": n_frames,
+        }
+        arrays = {
+            "meta": np.array(json.dumps(meta)),
+            "field": field,
+            "energy_in": self.heat_rate * delivered,
+        }
+        arrays.update({f"recorder_{k}": v for k, v in recorder.items()})
+        arrays.update({f"events_{k}": v for k, v in events.items()})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a torn file.
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.path.parent)
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, self.path)
+        self._last = time.perf_counter()
+
+    def discard(self) -> None:
+        """Remove the checkpoint of a completed run."""
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,216 @@
+"""Stopping events for the transient solvers.
+
+An event is a scalar function ``g`` of the marching state; it *fires* when
+``g`` changes sign between two accepted steps, the march stops there and the
+crossing time is found by linear interpolation of ``g``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+_DIRECTIONS = ("rising", "falling", "either")
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """Which event stopped a run, when it fired and at which step."""
+
+    name: str
+    time: float
+    step: int
+
+
+class Event:
+    """Base class for stopping events.
+
+    Subclasses implement :meth:`value`; ``direction`` selects which sign
+    changes of the value count as a crossing.
+    """
+
+    name: str = "event"
+    direction: str = "rising"
+    # Probe names the event reads; resolved to cells by the solver.
+    probes: tuple[str, ...] = ()
+    # Whether value() needs the field of the previous step.
+    needs_previous: bool = False
+
+    def value(
+        self,
+        t: float,
+        field: NDArray[np.float_],
+        probe_values: dict[str, float],
+        prev_t: float | None,
+        prev_field: NDArray[np.float_] | None,
+    ) -> float | None:
+        """Return the event function at ``t`` (``None`` if not yet defined)."""
+        raise NotImplementedError
+
+
+class ProbeThreshold(Event):
+    """Fire when a named probe crosses ``threshold`` [°C].
+
+    For example ``ProbeThreshold("pad", 217.0)`` stops a heat-up when the pad
+    surface reaches the solder melting point.
+    """
+
+    def __init__(
+        self,
+        probe: str,
+        threshold: float,
+        *,
+        direction: str = "rising",
+        name: str | None = None,
+    ) -> None:
+        if direction not in _DIRECTIONS:
+            raise ValueError(f"Unknown direction {direction!r}")
+        self.probe = probe
+        self.threshold = threshold
+        self.direction = direction
+        self.probes = (probe,)
+        self.name = name or f"{probe} >= {threshold:g}"
+
+    def value(
+        self,
+        t: float,
+        field: NDArray[np.float_],
+        probe_values: dict[str, float],
+        prev_t: float | None,
+        prev_field: NDArray[np.float_] | None,
+    ) -> float:
+        return probe_values[self.probe] - self.threshold
+
+
+class MaxTemperature(Event):
+    """Fire when the hottest cell exceeds ``limit`` [°C]."""
+
+    def __init__(self, limit: float, *, name: str | None = None) -> None:
+        self.limit = limit
+        self.name = name or f"max T >= {limit:g}"
+
+    def value(
+        self,
+        t: float,
+        field: NDArray[np.float_],
+        probe_values: dict[str, float],
+        prev_t: float | None,
+        prev_field: NDArray[np.float_] | None,
+    ) -> float:
+        return float(np.max(field)) - self.limit
+
+
+class SteadyState(Event):
+    """Fire when the largest ``|dT/dt|`` drops below ``tol`` [K/s]."""
+
+    needs_previous = True
+
+    def __init__(self, tol: float, *, name: str | None = None) -> None:
+        if tol <= 0:
+            raise ValueError("tol must be positive")
+        self.tol = tol
+        self.name = name or f"steady (|dT/dt| < {tol:g} K/s)"
+
+    def value(
+        self,
+        t: float,
+        field: NDArray[np.float_],
+        probe_values: dict[str, float],
+        prev_t: float | None,
+        prev_field: NDArray[np.float_] | None,
+    ) -> float | None:
+        if prev_field is None or prev_t is None or t <= prev_t:
+            return None
+        rate = float(np.max(np.abs(field - prev_field))) / (t - prev_t)
+        return self.tol - rate
+
+
+class EventMonitor:
+    """Evaluate events after every accepted step of a march.
+
+    The marched fields are temperatures relative to ``offset``; events see
+    absolute temperatures.
+    """
+
+    def __init__(
+        self,
+        events: Sequence[Event],
+        probe_cells: dict[str, int],
+        offset: float = 0.0,
+    ) -> None:
+        for event in events:
+            missing = [p for p in event.probes if p not in probe_cells]
+            if missing:
+                raise ValueError(
+                    f"Event {event.name!r} needs undefined probe(s) {missing}"
+                )
+        self.events = list(events)
+        self.offset = offset
+        self._cells = probe_cells
+        self._values: list[float | None] = [None] * len(self.events)
+        self._prev_t: float | None = None
+        self._prev_field: NDArray[np.float_] | None = None
+        self._keep_field = any(event.needs_previous for event in self.events)
+        self._absolute: NDArray[np.float_] | None = None
+
+    def state(self) -> dict[str, NDArray[np.float_]]:
+        """Return the history needed to continue monitoring, as arrays."""
+        return {
+            "values": np.array(
+                [np.nan if g is None else g for g in self._values], dtype=float
+            ),
+            "prev_t": np.array(np.nan if self._prev_t is None else self._prev_t),
+            "prev_field": (
+                np.empty(0) if self._prev_field is None else self._prev_field
+            ),
+        }
+
+    def restore(self, state: dict[str, NDArray[np.float_]]) -> None:
+        """Continue from a history returned by :meth:`state`."""
+        self._values = [None if np.isnan(g) else float(g) for g in state["values"]]
+        prev_t = float(state["prev_t"])
+        self._prev_t = None if np.isnan(prev_t) else prev_t
+        prev_field = state["prev_field"]
+        self._prev_field = prev_field.copy() if prev_field.size else None
+
+    def update(
+        self, step: int, t: float, field: NDArray[np.float_]
+    ) -> EventRecord | None:
+        """Record the state after ``step`` and return the first event fired."""
+        if not self.events:
+            return None
+        if self.offset:
+            if self._absolute is None:
+                self._absolute = np.empty(field.shape)
+            field = np.add(field, self.offset, out=self._absolute)
+        flat = field.reshape(-1)
+        probe_values = {name: float(flat[i]) for name, i in self._cells.items()}
+        fired: EventRecord | None = None
+        for k, event in enumerate(self.events):
+            g = event.value(t, field, probe_values, self._prev_t, self._prev_field)
+            g_prev = self._values[k]
+            self._values[k] = g
+            if g is None or g_prev is None or self._prev_t is None:
+                continue
+            rising = g_prev < 0.0 <= g
+            falling = g_prev > 0.0 >= g
+            crossed = (
+                rising
+                if event.direction == "rising"
+                else falling if event.direction == "falling" else rising or falling
+            )
+            if not crossed:
+                continue
+            t_cross = self._prev_t + (t - self._prev_t) * g_prev / (g_prev - g)
+            if fired is None or t_cross < fired.time:
+                fired = EventRecord(event.name, t_cross, step)
+        self._prev_t = t
+        if self._keep_field:
+            if self._prev_field is None:
+                self._prev_field = field.copy()
+            else:
+                self._prev_field[...] = field
+        return fired
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, cast, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple, cast
 import json
 from pathlib import Path
-import yaml  # type: ignore
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 import numpy as np
 
+from .materials import MaterialTable, material_table
+
 
 def get_annular_pad_properties(
     r_inner_mm: float,
@@ -19,7 +21,10 @@ def get_annular_pad_properties(
     density: float = 8960.0,
     cp: float = 385.0,
 ) -> dict[str, float]:
-    """Return area, volume, mass and heat capacity for an annular pad."""
+    """Return area, volume, mass and heat capacity for an annular pad.
+
+    The dimensions may also be arrays, giving one entry per pad.
+    """
 
     r_in = r_inner_mm * 1e-3
     r_out = r_outer_mm * 1e-3
@@ -60,24 +65,56 @@ def get_pad_properties(
     )
 
 
+def _graded_faces(
+    start: float, stop: float, n: int, growth: float
+) -> NDArray[np.float_]:
+    """Return ``n + 1`` faces from ``start`` to ``stop``, each cell ``growth``
+    times as wide as the previous one.
+    """
+    if growth <= 0:
+        raise ValueError("growth must be positive")
+    cumulative = np.concatenate([[0.0], np.cumsum(growth ** np.arange(n, dtype=float))])
+    faces = start + (stop - start) * cumulative / cumulative[-1]
+    faces[-1] = stop
+    return faces
+
+
+def _cells(
+    faces: NDArray[np.float_],
+) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
+    """Return the centres and widths of the cells between ``faces``."""
+    return 0.5 * (faces[:-1] + faces[1:]), np.diff(faces)
+
+
 def build_radial_mesh(
-    r_inner_m: float, r_outer_m: float, n_r: int
-) -> tuple[NDArray[np.float_], float]:
-    """Returns (r_centres, dr) for a uniform 1-D cylindrical mesh."""
+    r_inner_m: float, r_outer_m: float, n_r: int, *, growth: float = 1.0
+) -> tuple[NDArray[np.float_], float | NDArray[np.float_]]:
+    """Returns (r_centres, dr) for a 1-D cylindrical mesh.
+
+    The mesh is uniform by default. With ``growth != 1`` the cell widths grow
+    geometrically by that factor from ``r_inner_m`` outwards (e.g. ``1.1``
+    refines the cells where the flux enters) and ``dr`` is an array of the
+    ``n_r`` cell widths, which the solvers accept in place of a spacing.
+    """
     if n_r <= 0:
         raise ValueError("n_r must be positive")
     if r_outer_m <= r_inner_m:
         raise ValueError("r_outer_m must be larger than r_inner_m")
 
-    dr = (r_outer_m - r_inner_m) / n_r
-    r_centres = r_inner_m + (np.arange(n_r) + 0.5) * dr
-    return r_centres, dr
+    if growth == 1.0:
+        dr = (r_outer_m - r_inner_m) / n_r
+        r_centres = r_inner_m + (np.arange(n_r) + 0.5) * dr
+        return r_centres, dr
+    return _cells(_graded_faces(r_inner_m, r_outer_m, n_r, growth))
 
 
 def load_materials(path: str = "materials.yaml") -> Dict[str, Dict[str, float]]:
-    """Return material properties dictionary from a YAML file."""
-    data = yaml.safe_load(Path(path).read_text())
-    return cast(Dict[str, Dict[str, float]], data)
+    """Return material properties dictionary from a YAML file.
+
+    The file is parsed through the cached registry of
+    :func:`~laserpad.materials.material_table`.
+    """
+    return material_table(path).as_dict()
 
 
 def build_stack_mesh(
@@ -86,19 +123,56 @@ def build_stack_mesh(
     n_r: int,
     pad_th: float,
     sub_th: float,
-    n_z: int,
-) -> tuple[NDArray[np.float_], float, NDArray[np.float_], float, NDArray[np.str_]]:
-    """Return 2-D r-z mesh centres and material index grid."""
+    n_z: int | tuple[int, int],
+    *,
+    materials: MaterialTable | None = None,
+    growth: float = 1.0,
+) -> tuple[
+    NDArray[np.float_],
+    float | NDArray[np.float_],
+    NDArray[np.float_],
+    float | NDArray[np.float_],
+    NDArray[np.uint8],
+]:
+    """Return 2-D r-z mesh centres and material index grid.
+
+    The grid holds ``uint8`` material ids of ``materials`` (by default the
+    table of ``materials.yaml``), e.g. ``table.k[mat_idx]`` gives the
+    conductivity of every cell.
+
+    An integer ``n_z`` spreads uniform cells over the whole stack, so the
+    pad/substrate interface may fall inside a cell (which then counts as
+    copper if its centre lies in the pad). A pair ``(n_pad, n_sub)`` places
+    that many uniform cells in each layer with a face exactly on the
+    interface, and ``dz`` is returned as the array of cell heights.
+    ``growth`` grades the radial cells as in :func:`build_radial_mesh`.
+    """
+
+    table = materials or material_table()
 
-    dr = (r_outer - r_inner) / n_r
-    dz = (pad_th + sub_th) / n_z
+    r_centres, dr = build_radial_mesh(r_inner, r_outer, n_r, growth=growth)
 
-    r_centres = r_inner + (np.arange(n_r) + 0.5) * dr
-    z_centres = (np.arange(n_z) + 0.5) * dz
+    dz: float | NDArray[np.float_]
+    if np.ndim(n_z) == 0:
+        n_z = cast(int, n_z)
+        dz = (pad_th + sub_th) / n_z
+        z_centres = (np.arange(n_z) + 0.5) * dz
+        pad_cells = z_centres < pad_th
+    else:
+        n_pad, n_sub = n_z
+        if n_pad <= 0 or n_sub <= 0:
+            raise ValueError("Each layer needs a positive number of cells")
+        faces = np.concatenate(
+            [
+                np.linspace(0.0, pad_th, n_pad + 1),
+                np.linspace(pad_th, pad_th + sub_th, n_sub + 1)[1:],
+            ]
+        )
+        z_centres, dz = _cells(faces)
+        pad_cells = np.arange(n_pad + n_sub) < n_pad
 
-    mat_idx = np.full((n_z, n_r), "fr4", dtype=object)
-    pad_cells = z_centres < pad_th
-    mat_idx[pad_cells, :] = "copper"
+    mat_idx = np.full((len(z_centres), n_r), table.id("fr4"), dtype=np.uint8)
+    mat_idx[pad_cells, :] = table.id("copper")
 
     return r_centres, dr, z_centres, dz, mat_idx
 
@@ -115,38 +189,158 @@ def load_traces(path: str | bytes | object) -> List[Tuple[float, float]]:
     return [(d["start_angle"], d["end_angle"]) for d in data]
 
 
+@dataclass(frozen=True, eq=False)
+class TraceCoverage:
+    """Angular coverage of the pad rim by copper traces.
+
+    ``intervals`` holds the covered angles as sorted, disjoint half-open
+    ``[start, end)`` ranges within ``[0, 360)`` degrees, so memory scales with
+    the number of traces rather than the angular resolution.
+    """
+
+    intervals: NDArray[np.float_]
+
+    @classmethod
+    def from_traces(cls, trace_defs: Sequence[Tuple[float, float]]) -> TraceCoverage:
+        """Merge ``(start_angle, end_angle)`` traces into disjoint intervals.
+
+        A trace with ``end_angle < start_angle`` wraps through 0°, as in the
+        files read by :func:`load_traces`.
+        """
+
+        defs = np.asarray(trace_defs, dtype=float).reshape(-1, 2)
+        start, end = defs[:, 0], defs[:, 1]
+        wraps = end < start
+        starts = np.concatenate([start, np.zeros(np.count_nonzero(wraps))])
+        ends = np.concatenate([np.where(wraps, 360.0, end), end[wraps]])
+        starts = np.clip(starts, 0.0, 360.0)
+        ends = np.clip(ends, 0.0, 360.0)
+        keep = ends > starts
+        starts, ends = starts[keep], ends[keep]
+        if len(starts) == 0:
+            return cls(np.empty((0, 2)))
+
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+        reach = np.maximum.accumulate(ends)
+        # A new interval begins wherever a start lies beyond all earlier ends.
+        first = np.concatenate([[True], starts[1:] > reach[:-1]])
+        group_end = np.append(np.flatnonzero(first)[1:] - 1, len(starts) - 1)
+        return cls(np.column_stack([starts[first], reach[group_end]]))
+
+    @property
+    def fraction(self) -> float:
+        """Covered fraction of the rim."""
+        return float(np.sum(self.intervals[:, 1] - self.intervals[:, 0]) / 360.0)
+
+    def mask(self, n_theta: int = 360) -> NDArray[np.bool_]:
+        """Return which of ``n_theta`` equally spaced angles lie on a trace."""
+        theta = np.linspace(0.0, 360.0, n_theta, endpoint=False)
+        idx = np.searchsorted(self.intervals[:, 0], theta, side="right") - 1
+        covered = idx >= 0
+        covered[covered] = theta[covered] < self.intervals[idx[covered], 1]
+        return covered
+
+    def cell_fractions(self, n_theta: int = 360) -> NDArray[np.float_]:
+        """Return the covered fraction of each of ``n_theta`` angular cells.
+
+        Cell ``k`` spans ``[k, k+1) * 360/n_theta`` degrees.
+        """
+        edges = np.linspace(0.0, 360.0, n_theta + 1)
+        start, end = self.intervals[:, 0], self.intervals[:, 1]
+        covered = np.clip(edges[:, None] - start, 0.0, end - start).sum(axis=1)
+        return cast(NDArray[np.float_], np.diff(covered) * n_theta / 360.0)
+
+
+@dataclass(frozen=True)
+class SectorSymmetry:
+    """Unique angular sector of a trace layout on ``n_theta`` cells.
+
+    The layout repeats every ``period`` cells. With ``mirror`` it is also
+    symmetric about the cell boundary at ``start`` and only the half sector
+    of ``period // 2`` cells from ``start`` is unique (adiabatic at both
+    ends); otherwise the ``period`` cells from ``start`` are simulated with
+    periodic ends.
+    """
+
+    n_theta: int
+    period: int
+    start: int = 0
+    mirror: bool = False
+
+    @classmethod
+    def detect(cls, pattern: ArrayLike) -> SectorSymmetry:
+        """Return the smallest sector reproducing ``pattern`` (one value per cell)."""
+        values = np.round(np.asarray(pattern, dtype=float), 12)
+        n = len(values)
+        period = next(
+            p
+            for p in range(1, n + 1)
+            if n % p == 0 and np.array_equal(values, np.roll(values, p))
+        )
+        if period % 2 == 0:
+            offsets = np.arange(period)
+            for start in range(period):
+                sector = values[(start + offsets) % n]
+                if np.array_equal(sector, sector[::-1]):
+                    return cls(n, period, start, True)
+        return cls(n, period)
+
+    @property
+    def n_cells(self) -> int:
+        """Number of simulated angular cells."""
+        return self.period // 2 if self.mirror else self.period
+
+    @property
+    def cells(self) -> NDArray[np.int_]:
+        """Full-circle indices of the simulated cells."""
+        return (self.start + np.arange(self.n_cells)) % self.n_theta
+
+    @property
+    def mapping(self) -> NDArray[np.int_]:
+        """Simulated cell that each full-circle cell is a copy of."""
+        j = (np.arange(self.n_theta) - self.start) % self.period
+        if self.mirror:
+            j = np.where(j < self.n_cells, j, self.period - 1 - j)
+        return j
+
+    def expand(self, field: ArrayLike, axis: int = 0) -> NDArray[np.float_]:
+        """Unfold a sector field to the full circle along ``axis``."""
+        return np.take(np.asarray(field), self.mapping, axis=axis)
+
+
 def build_stack_mesh_with_traces(
     r_inner: float,
     r_outer: float,
     n_r: int,
     pad_th: float,
     sub_th: float,
-    n_z: int,
+    n_z: int | tuple[int, int],
     trace_defs: List[Tuple[float, float]],
     n_theta: int = 360,
+    *,
+    materials: MaterialTable | None = None,
+    growth: float = 1.0,
 ) -> tuple[
     NDArray[np.float_],
-    float,
+    float | NDArray[np.float_],
     NDArray[np.float_],
-    float,
-    NDArray[np.str_],
+    float | NDArray[np.float_],
+    NDArray[np.uint8],
     NDArray[np.bool_],
 ]:
-    """Return mesh plus boolean trace mask for each angular cell."""
+    """Return mesh plus boolean trace mask for each angular cell.
+
+    The mesh arguments are those of :func:`build_stack_mesh`. The mask is
+    identical along r; pass :meth:`TraceCoverage.from_traces`
+    of the same ``trace_defs`` to the solver to avoid materializing it.
+    """
 
     r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
-        r_inner, r_outer, n_r, pad_th, sub_th, n_z
+        r_inner, r_outer, n_r, pad_th, sub_th, n_z, materials=materials, growth=growth
     )
 
-    theta_centres = np.linspace(0.0, 360.0, n_theta, endpoint=False)
-    trace_mask = np.zeros((n_theta, n_r), dtype=bool)
-
-    for k, theta in enumerate(theta_centres):
-        for start, end in trace_defs:
-            if start <= theta < end or (
-                end < start and (theta >= start or theta < end)
-            ):
-                trace_mask[k, :] = True
-                break
+    coverage = TraceCoverage.from_traces(trace_defs)
+    trace_mask = np.repeat(coverage.mask(n_theta)[:, None], n_r, axis=1)
 
     return r_centres, dr, z_centres, dz, mat_idx, trace_mask
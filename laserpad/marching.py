@@ -0,0 +1,396 @@
+"""Time-marching drivers shared by the transient solvers.
+
+The solvers build a *stepper* (an object advancing the field by one fixed
+``dt``) for their engine and hand it to :func:`march`, or a factory of
+steppers to :func:`march_adaptive`. The drivers own the field buffers, the
+output schedule, probes and progress reporting.
+
+Steppers advance the temperature rise above a constant ``offset`` (the
+initial temperature), which keeps small increments resolvable in
+single-precision fields; the drivers add the offset back, in double
+precision, to everything they record.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Mapping, Protocol
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .checkpoint import Checkpointer
+from .events import EventMonitor, EventRecord
+from .progress import CancelToken, Cancelled, ProgressCallback
+from .results import TransientResult
+from .store import FrameWriter
+from .waveforms import Waveform
+
+
+class Stepper(Protocol):
+    # Multiplier of the heat input of the next step, set by the drivers
+    # when the laser power follows a waveform.
+    power_scale: float
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None: ...
+
+
+class Recorder:
+    """Collect saved frames and probe samples while a solver marches.
+
+    Buffers grow geometrically, so callers that do not know the number of
+    steps in advance (adaptive runs) pay amortized O(1) per sample. A probe
+    given as an array of flat indices (one per case of a batched run) is
+    sampled at all of them. Recorded values are ``field + offset``.
+    """
+
+    def __init__(
+        self,
+        initial: NDArray[np.float_],
+        probes: Mapping[str, int | NDArray[np.int_]],
+        writer: FrameWriter | None = None,
+        n_samples: int = 16,
+        n_frames: int = 4,
+        offset: float = 0.0,
+    ) -> None:
+        self.offset = offset
+        self.names = list(probes)
+        self._flat = np.array([probes[name] for name in self.names], dtype=int)
+        self._sample_times = np.empty(max(n_samples, 1))
+        self._samples = np.empty(
+            (len(self.names), max(n_samples, 1)) + self._flat.shape[1:], initial.dtype
+        )
+        self._n_samples = 0
+        self._writer = writer
+        self._frame_times: list[float] = []
+        self._frames = np.empty((max(n_frames, 1),) + initial.shape, initial.dtype)
+        self.event: EventRecord | None = None
+
+    def sample(self, t: float, field: NDArray[np.float_]) -> None:
+        """Record the probe values of ``field`` at time ``t``."""
+        n = self._n_samples
+        if n == len(self._sample_times):
+            self._sample_times = np.resize(self._sample_times, 2 * n)
+            grown = np.empty(
+                (len(self.names), 2 * n) + self._flat.shape[1:], self._samples.dtype
+            )
+            grown[:, :n] = self._samples
+            self._samples = grown
+        self._sample_times[n] = t
+        if self.names:
+            np.add(field.reshape(-1)[self._flat], self.offset, out=self._samples[:, n])
+        self._n_samples = n + 1
+
+    def save(self, t: float, field: NDArray[np.float_]) -> None:
+        """Keep ``field`` as the frame at time ``t``."""
+        if self._writer is not None:
+            self._writer.append(t, field + self.offset)
+        else:
+            n = len(self._frame_times)
+            if n == len(self._frames):
+                grown = np.empty((2 * n,) + field.shape, self._frames.dtype)
+                grown[:n] = self._frames
+                self._frames = grown
+            np.add(field, self.offset, out=self._frames[n])
+        self._frame_times.append(t)
+
+    def stop(self, event: EventRecord, t: float, field: NDArray[np.float_]) -> None:
+        """End the run on ``event``, keeping the final field as a frame."""
+        self.event = event
+        if not self._frame_times or self._frame_times[-1] != t:
+            self.save(t, field)
+
+    @property
+    def n_frames(self) -> int:
+        """Number of frames saved so far."""
+        return len(self._frame_times)
+
+    def state(self) -> dict[str, NDArray[np.float_]]:
+        """Return the samples and frames recorded so far, for checkpoints.
+
+        Streamed frames are flushed to the store instead of returned.
+        """
+        n = self._n_samples
+        if self._writer is not None:
+            self._writer.flush()
+            frames = np.empty(0)
+        else:
+            frames = self._frames[: len(self._frame_times)]
+        return {
+            "sample_times": self._sample_times[:n],
+            "samples": self._samples[:, :n],
+            "frame_times": np.asarray(self._frame_times, dtype=float),
+            "frames": frames,
+        }
+
+    def restore(self, state: dict[str, NDArray[np.float_]]) -> None:
+        """Continue recording after the state returned by :meth:`state`.
+
+        The buffers must already be large enough to hold it.
+        """
+        n = len(state["sample_times"])
+        self._sample_times[:n] = state["sample_times"]
+        self._samples[:, :n] = state["samples"]
+        self._n_samples = n
+        self._frame_times = [float(t) for t in state["frame_times"]]
+        if self._writer is None:
+            self._frames[: len(self._frame_times)] = state["frames"]
+
+    def result(self) -> TransientResult:
+        n = self._n_samples
+        return TransientResult(
+            times=np.asarray(self._frame_times, dtype=float),
+            T=(
+                self._writer.close()
+                if self._writer is not None
+                else self._frames[: len(self._frame_times)]
+            ),
+            probe_times=self._sample_times[:n].copy(),
+            probes={
+                name: self._samples[i, :n].copy() for i, name in enumerate(self.names)
+            },
+            event=self.event,
+        )
+
+
+def march(
+    stepper: Stepper,
+    initial: NDArray[np.float_],
+    times: NDArray[np.float_],
+    save_steps: NDArray[np.int_],
+    probes: Mapping[str, int | NDArray[np.int_]],
+    progress_cb: ProgressCallback | None,
+    writer: FrameWriter | None = None,
+    events: EventMonitor | None = None,
+    power: Waveform | None = None,
+    cancel: CancelToken | None = None,
+    checkpoint: Checkpointer | None = None,
+    offset: float = 0.0,
+) -> TransientResult:
+    """Advance ``initial`` over the fixed grid ``times``.
+
+    The field lives in two buffers that swap roles every step; frames are
+    copied out only for ``save_steps`` (into memory, or streamed to
+    ``writer``) and the probe cells (flat indices) are sampled after every
+    step. The march stops early when one of ``events`` fires. With a
+    ``power`` waveform the heat input of every step is scaled by its mean
+    over the step, precomputed for the whole grid. A ``cancel`` token is
+    checked before every step; once set, :class:`~laserpad.progress.Cancelled`
+    is raised with the result recorded so far. With a ``checkpoint`` the
+    state is written there periodically (and on cancellation), and a run
+    whose checkpoint was found continues from it. ``initial`` and the
+    stepper hold temperatures relative to ``offset``.
+    """
+
+    steps = len(times) - 1
+    current = initial.copy()
+    scratch = np.empty_like(current)
+    recorder = Recorder(
+        current, probes, writer, steps + 1, len(save_steps), offset=offset
+    )
+    schedule = power.schedule(times) if power is not None else None
+    resumed = checkpoint.resumed if checkpoint is not None else None
+    if resumed is None:
+        start = 0
+        recorder.sample(times[0], current)
+        if events is not None:
+            events.update(0, times[0], current)
+        saved = 0
+        if save_steps[0] == 0:
+            recorder.save(times[0], current)
+            saved = 1
+    else:
+        start = resumed.step
+        current[...] = resumed.field
+        recorder.restore(resumed.recorder)
+        if events is not None:
+            events.restore(resumed.events)
+        saved = int(np.searchsorted(save_steps, start, side="right"))
+
+    def save_checkpoint(n: int) -> None:
+        assert checkpoint is not None
+        checkpoint.save(
+            n,
+            float(times[n]),
+            current,
+            recorder.state(),
+            events.state() if events is not None else {},
+            recorder.n_frames,
+        )
+
+    for n in range(start, steps):
+        if cancel is not None and cancel.cancelled:
+            if checkpoint is not None and n % checkpoint.stride == 0:
+                save_checkpoint(n)
+            raise Cancelled(recorder.result())
+        if schedule is not None:
+            stepper.power_scale = schedule[n]
+        stepper.step(current, scratch)
+        current, scratch = scratch, current
+        recorder.sample(times[n + 1], current)
+        if saved < len(save_steps) and save_steps[saved] == n + 1:
+            recorder.save(times[n + 1], current)
+            saved += 1
+        if progress_cb is not None:
+            progress_cb(n + 1, steps)
+        if events is not None:
+            fired = events.update(n + 1, times[n + 1], current)
+            if fired is not None:
+                recorder.stop(fired, times[n + 1], current)
+                break
+        if checkpoint is not None and checkpoint.due(n + 1):
+            save_checkpoint(n + 1)
+
+    result = recorder.result()
+    if checkpoint is not None:
+        checkpoint.discard()
+    return result
+
+
+# Resolution of the progress reported by adaptive runs, whose step count is
+# not known in advance: progress is reported in permille of simulated time.
+_ADAPTIVE_PROGRESS_TOTAL = 1000
+
+
+def march_adaptive(
+    make_stepper: Callable[[float], Stepper],
+    order: int,
+    initial: NDArray[np.float_],
+    t_end: float,
+    dt: float,
+    rtol: float,
+    atol: float,
+    probes: Mapping[str, int | NDArray[np.int_]],
+    progress_cb: ProgressCallback | None,
+    writer: FrameWriter | None = None,
+    save_every: int | None = None,
+    save_times: ArrayLike | None = None,
+    dt_max: float | None = None,
+    events: EventMonitor | None = None,
+    power: Waveform | None = None,
+    cancel: CancelToken | None = None,
+    offset: float = 0.0,
+) -> TransientResult:
+    """Advance ``initial`` to ``t_end`` with step-doubling error control.
+
+    Each step is taken once with ``h`` and twice with ``h/2``; the difference
+    estimates the local error of the half-step solution, which is kept when
+    ``|err| <= atol + rtol*|T|`` in every cell. Step sizes move on the ladder
+    ``dt*2**k`` so steppers (and their factorizations) are reused; steps are
+    shortened only to land exactly on ``save_times`` and ``t_end``.
+    ``order`` is the order of accuracy of the stepper. The march stops
+    early when one of ``events`` fires. A ``power`` waveform scales the heat
+    input of every (trial) step by its mean over that step, so the error
+    control also resolves power ramps and pulse edges. ``cancel`` is checked
+    before every trial step and ``offset`` is handled as in :func:`march`.
+    """
+
+    if rtol < 0 or atol < 0 or rtol == atol == 0:
+        raise ValueError("Tolerances must be non-negative and not both zero")
+    if save_every is not None and save_times is not None:
+        raise ValueError("Pass either save_every or save_times, not both")
+    if save_every is not None and save_every < 1:
+        raise ValueError("save_every must be a positive integer")
+
+    targets = [t_end]
+    if save_times is not None:
+        requested = np.unique(np.asarray(save_times, dtype=float))
+        targets = sorted(set(requested[(requested > 0) & (requested < t_end)]))
+        targets.append(t_end)
+        save_initial = bool(np.any(requested <= 0))
+        save_final = bool(np.any(requested >= t_end))
+    else:
+        save_initial = save_final = True
+
+    steppers: dict[float, Stepper] = {}
+
+    def stepper_for(h: float) -> Stepper:
+        if h not in steppers:
+            if len(steppers) >= 8:
+                steppers.pop(next(iter(steppers)))
+            steppers[h] = make_stepper(h)
+        return steppers[h]
+
+    current = initial.copy()
+    big = np.empty_like(current)
+    mid = np.empty_like(current)
+    fine = np.empty_like(current)
+    recorder = Recorder(current, probes, writer, offset=offset)
+    recorder.sample(0.0, current)
+    if events is not None:
+        events.update(0, 0.0, current)
+    if save_initial:
+        recorder.save(0.0, current)
+
+    err_scale = 1.0 / (2.0**order - 1.0)
+    grow_below = 0.5 ** (order + 1)
+    k = 0
+    k_max = np.inf if dt_max is None else np.floor(np.log2(dt_max / dt))
+    t = 0.0
+    accepted = 0
+    target_idx = 0
+    eps = 1e-12 * t_end
+    while t < t_end - eps:
+        if cancel is not None and cancel.cancelled:
+            raise Cancelled(recorder.result())
+        target = targets[target_idx]
+        h = dt * 2.0**k
+        landing = t + h >= target - eps
+        if landing:
+            h = target - t
+        if h < dt * 2.0**-40:
+            raise RuntimeError(f"Adaptive step size underflow at t = {t:.6g} s")
+
+        full = stepper_for(h)
+        half = stepper_for(0.5 * h)
+        if power is not None:
+            full.power_scale = power.mean(t, t + h)
+        full.step(current, big)
+        if power is not None:
+            half.power_scale = power.mean(t, t + 0.5 * h)
+        half.step(current, mid)
+        if power is not None:
+            half.power_scale = power.mean(t + 0.5 * h, t + h)
+        half.step(mid, fine)
+
+        np.subtract(fine, big, out=mid)
+        np.abs(mid, out=mid)
+        mid *= err_scale
+        np.add(fine, offset, out=big)
+        np.abs(big, out=big)
+        big *= rtol
+        big += atol
+        mid /= big
+        err = float(np.max(mid))
+
+        if err > 1.0:
+            k -= 1
+            while landing and dt * 2.0**k >= h:
+                k -= 1
+            continue
+
+        t = target if landing else t + h
+        current, fine = fine, current
+        accepted += 1
+        recorder.sample(t, current)
+        at_end = landing and target_idx == len(targets) - 1
+        if save_times is not None:
+            save = landing and (not at_end or save_final)
+        else:
+            save = at_end or accepted % (save_every or 1) == 0
+        if save:
+            recorder.save(t, current)
+        if landing:
+            target_idx += 1
+        elif err < grow_below and k < k_max:
+            k += 1
+        if progress_cb is not None:
+            progress_cb(
+                int(_ADAPTIVE_PROGRESS_TOTAL * t / t_end), _ADAPTIVE_PROGRESS_TOTAL
+            )
+        if events is not None:
+            fired = events.update(accepted, t, current)
+            if fired is not None:
+                recorder.stop(fired, t, current)
+                break
+
+    return recorder.result()
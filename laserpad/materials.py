@@ -0,0 +1,207 @@
+"""Cached material registry and integer material-id grids.
+
+Material properties live in ``materials.yaml``. :func:`material_table`
+parses the file once into a :class:`MaterialTable` of per-material property
+vectors and re-reads it only when its modification time or size changes.
+Meshes store a compact ``uint8`` grid of material ids, so per-cell
+properties are a single NumPy gather, e.g. ``table.k[mat_idx]``.
+
+``k`` and ``cp`` may also be tabulated against temperature as a list of
+``[T, value]`` pairs (°C), e.g. ``k: [[25, 401], [250, 382]]``;
+:class:`PropertyLookup` resamples such curves onto a uniform grid so the
+solvers can evaluate them for every cell with vectorized interpolation.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import yaml  # type: ignore
+from numpy.typing import ArrayLike, NDArray
+
+MATERIALS_FILE = "materials.yaml"
+# Temperature [°C] at which tabulated properties give the constant vectors.
+REFERENCE_T = 25.0
+
+Curve = Optional[Tuple[NDArray[np.float_], NDArray[np.float_]]]
+
+
+@dataclass(frozen=True, eq=False)
+class MaterialTable:
+    """Material names and property vectors indexed by material id.
+
+    ``k`` [W/m·K], ``rho`` [kg/m³] and ``cp`` [J/kg·K] have one entry per
+    material in file order; the id of a material is its position in
+    ``names``. ``k_curves``/``cp_curves`` hold the ``(T, value)`` tables of
+    temperature-dependent properties (``None`` for constants), in which
+    case ``k``/``cp`` are their values at :data:`REFERENCE_T`.
+    """
+
+    names: tuple[str, ...]
+    k: NDArray[np.float_]
+    rho: NDArray[np.float_]
+    cp: NDArray[np.float_]
+    k_curves: tuple[Curve, ...] = ()
+    cp_curves: tuple[Curve, ...] = ()
+
+    def __post_init__(self) -> None:
+        if len(self.names) > np.iinfo(np.uint8).max + 1:
+            raise ValueError("At most 256 materials fit a uint8 id grid")
+        for vector in (self.k, self.rho, self.cp):
+            vector.setflags(write=False)
+
+    @property
+    def temperature_dependent(self) -> bool:
+        """Whether any material has a tabulated property."""
+        return any(c is not None for c in self.k_curves + self.cp_curves)
+
+    @property
+    def rho_cp(self) -> NDArray[np.float_]:
+        """Volumetric heat capacity [J/m³·K] per material id."""
+        return self.rho * self.cp
+
+    def id(self, name: str) -> int:
+        """Return the id of material ``name``."""
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise ValueError(f"Unknown material {name!r}") from None
+
+    def ids(self, names: ArrayLike) -> NDArray[np.uint8]:
+        """Convert an array of material names to a ``uint8`` id grid."""
+        names_a = np.asarray(names)
+        unique, inverse = np.unique(names_a.astype(str), return_inverse=True)
+        lookup = np.array([self.id(str(name)) for name in unique], dtype=np.uint8)
+        return lookup[inverse].reshape(names_a.shape)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return the properties in the ``materials.yaml`` layout."""
+        return {
+            name: {"k": float(k), "rho": float(rho), "cp": float(cp)}
+            for name, k, rho, cp in zip(self.names, self.k, self.rho, self.cp)
+        }
+
+
+_TABLES: dict[Path, tuple[tuple[int, int], MaterialTable]] = {}
+
+
+def material_table(path: str | os.PathLike[str] = MATERIALS_FILE) -> MaterialTable:
+    """Return the (cached) material table of the YAML file at ``path``.
+
+    The file is parsed again only when its modification time or size has
+    changed since the last call, so repeated solver calls cost one ``stat``.
+    """
+
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _TABLES.get(resolved)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    data = yaml.safe_load(resolved.read_text())
+    names = tuple(data)
+    k = [_property(data[name]["k"], f"{name}.k") for name in names]
+    cp = [_property(data[name]["cp"], f"{name}.cp") for name in names]
+    table = MaterialTable(
+        names=names,
+        k=np.array([value for value, _ in k]),
+        rho=np.array([data[name]["rho"] for name in names], dtype=float),
+        cp=np.array([value for value, _ in cp]),
+        k_curves=tuple(curve for _, curve in k),
+        cp_curves=tuple(curve for _, curve in cp),
+    )
+    _TABLES[resolved] = (stamp, table)
+    return table
+
+
+def _property(value: object, label: str) -> tuple[float, Curve]:
+    """Return the reference value and optional curve of a YAML property."""
+    if isinstance(value, (int, float)):
+        return float(value), None
+    pairs = np.asarray(value, dtype=float)
+    if pairs.ndim != 2 or pairs.shape[1] != 2 or len(pairs) < 2:
+        raise ValueError(f"{label} must be a number or a list of [T, value] pairs")
+    T, values = pairs[:, 0].copy(), pairs[:, 1].copy()
+    if np.any(np.diff(T) <= 0):
+        raise ValueError(f"{label} temperatures must be strictly increasing")
+    return float(np.interp(REFERENCE_T, T, values)), (T, values)
+
+
+class PropertyLookup:
+    """Uniform-grid lookup tables of ``k(T)`` and ``rho*cp(T)`` per material.
+
+    Every curve of ``table`` is resampled onto ``n_points`` temperatures
+    spanning all tabulated data; beyond the ends properties stay constant.
+    :meth:`evaluate` then costs one gather and one multiply-add per cell and
+    property, whatever the number of materials or breakpoints.
+    """
+
+    def __init__(self, table: MaterialTable, n_points: int = 1024) -> None:
+        curves = [c for c in table.k_curves + table.cp_curves if c is not None]
+        T_min = min((c[0][0] for c in curves), default=REFERENCE_T)
+        T_max = max((c[0][-1] for c in curves), default=REFERENCE_T + 1.0)
+        grid = np.linspace(T_min, T_max, n_points)
+        k = _sample(grid, table.k, table.k_curves)
+        rho_cp = table.rho[:, None] * _sample(grid, table.cp, table.cp_curves)
+        self.T_min = T_min
+        self.n_points = n_points
+        self._inv_step = (n_points - 1) / (T_max - T_min)
+        self.k_range = (k.min(axis=1), k.max(axis=1))
+        self.rho_cp_range = (rho_cp.min(axis=1), rho_cp.max(axis=1))
+        self._k, self._dk = _with_slopes(k)
+        self._c, self._dc = _with_slopes(rho_cp)
+
+    def evaluate(
+        self, mat_ids: NDArray[np.uint8], T: NDArray[np.float_]
+    ) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
+        """Return ``k`` and ``rho*cp`` of cells with ids ``mat_ids`` at ``T``."""
+        x = (T - self.T_min) * self._inv_step
+        np.clip(x, 0.0, self.n_points - 1, out=x)
+        i = x.astype(np.intp)
+        x -= i
+        i += mat_ids.astype(np.intp) * self.n_points
+        k = self._k[i] + self._dk[i] * x
+        rho_cp = self._c[i] + self._dc[i] * x
+        return k, rho_cp
+
+
+def _sample(
+    grid: NDArray[np.float_],
+    constants: NDArray[np.float_],
+    curves: tuple[Curve, ...],
+) -> NDArray[np.float_]:
+    """Return ``(n_materials, len(grid))`` samples of a property."""
+    rows = [np.full(len(grid), value) for value in constants]
+    for i, curve in enumerate(curves):
+        if curve is not None:
+            rows[i] = np.interp(grid, *curve)
+    return np.array(rows)
+
+
+def _with_slopes(
+    values: NDArray[np.float_],
+) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
+    """Flatten per-material samples and their per-interval increments."""
+    slopes = np.zeros_like(values)
+    slopes[:, :-1] = np.diff(values, axis=1)
+    return values.ravel(), slopes.ravel()
+
+
+def material_ids(
+    mat_idx: ArrayLike, table: MaterialTable | None = None
+) -> NDArray[np.uint8]:
+    """Return ``mat_idx`` as a ``uint8`` id grid.
+
+    Id grids pass through unchanged; grids of material names (the layout
+    used before id grids) are converted with ``table``.
+    """
+
+    grid = np.asarray(mat_idx)
+    if grid.dtype.kind in "OUS":
+        return (table or material_table()).ids(grid)
+    return grid.astype(np.uint8, copy=False)
@@ -0,0 +1,156 @@
+"""Progress reporting, cancellation and background execution of solver runs.
+
+The transient solvers report progress through a ``progress_cb(i, total)``
+callback after every step and poll an optional :class:`CancelToken`.
+:class:`ThrottledProgress` limits how often an expensive callback (a UI
+update) actually runs, and :class:`BackgroundRun` runs a solver in a worker
+thread so an interactive front end can poll its progress and cancel it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+from .results import TransientResult
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class Cancelled(Exception):
+    """Raised by a solver whose :class:`CancelToken` was cancelled.
+
+    ``result`` holds what the run recorded up to the cancelled step (saved
+    frames and probe samples), or ``None`` if it was cancelled before
+    marching.
+    """
+
+    def __init__(self, result: TransientResult | None = None) -> None:
+        super().__init__("Run cancelled")
+        self.result = result
+
+
+class CancelToken:
+    """Thread-safe flag asking a running solver to stop.
+
+    Solvers check the token once per step and raise :class:`Cancelled` when
+    it is set, so a run stops within one step of :meth:`cancel`.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the run to stop."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether :meth:`cancel` has been called."""
+        return self._event.is_set()
+
+
+class ThrottledProgress:
+    """Forward ``progress_cb(i, total)`` calls at most every ``interval`` s.
+
+    The first call and the final one (``i == total``) are always forwarded,
+    so a progress bar starts and ends at the right place while the cost of
+    the callback no longer scales with the number of steps.
+    """
+
+    def __init__(self, callback: ProgressCallback, interval: float = 0.1) -> None:
+        self.callback = callback
+        self.interval = interval
+        self._last = -float("inf")
+
+    def __call__(self, i: int, total: int) -> None:
+        now = time.perf_counter()
+        if i >= total or now - self._last >= self.interval:
+            self._last = now
+            self.callback(i, total)
+
+
+class BackgroundRun:
+    """Run ``solver(*args, **kwargs)`` in a daemon worker thread.
+
+    The run gets its own ``progress_cb`` and ``cancel`` token; poll
+    :attr:`fraction` or :meth:`status_text` while it is not :attr:`done`,
+    stop it with :meth:`cancel` and collect the outcome with :meth:`result`.
+    """
+
+    def __init__(
+        self, solver: Callable[..., TransientResult], *args: Any, **kwargs: Any
+    ) -> None:
+        self.token = CancelToken()
+        self.progress = (0, 1)
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+        self._result: TransientResult | None = None
+        self._error: BaseException | None = None
+        kwargs["progress_cb"] = self._report
+        kwargs["cancel"] = self.token
+        self._thread = threading.Thread(
+            target=self._run, args=(solver, args, kwargs), daemon=True
+        )
+        self._thread.start()
+
+    def _report(self, i: int, total: int) -> None:
+        # A tuple assignment is atomic, so readers see a consistent pair.
+        self.progress = (i, total)
+
+    def _run(
+        self,
+        solver: Callable[..., TransientResult],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        try:
+            self._result = solver(*args, **kwargs)
+        except BaseException as exc:
+            self._error = exc
+        finally:
+            self.finished = time.perf_counter()
+
+    @property
+    def done(self) -> bool:
+        """Whether the worker has finished (successfully or not)."""
+        return not self._thread.is_alive()
+
+    @property
+    def fraction(self) -> float:
+        """Completed fraction of the run, from 0 to 1."""
+        i, total = self.progress
+        return min(i / total, 1.0) if total else 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time [s] since the run started (until it finished)."""
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    def status_text(self) -> str:
+        """Return a one-line summary of the progress, elapsed time and ETA."""
+        i, total = self.progress
+        frac = self.fraction
+        elapsed = self.elapsed
+        remaining = elapsed / frac - elapsed if frac else 0.0
+        return f"Iteration {i}/{total} — elapsed {elapsed:.1f}s, ETA {remaining:.1f}s"
+
+    def cancel(self) -> None:
+        """Ask the solver to stop; :meth:`result` then raises :class:`Cancelled`."""
+        self.token.cancel()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait up to ``timeout`` seconds for the run; return :attr:`done`."""
+        self._thread.join(timeout)
+        return self.done
+
+    def result(self, timeout: float | None = None) -> TransientResult:
+        """Wait for the run and return its result, re-raising its error."""
+        if not self.wait(timeout):
+            raise TimeoutError("Run still in progress")
+        if self._error is not None:
+            raise self._error
+        assert self._result is not None
+        return self._result
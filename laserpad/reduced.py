@@ -0,0 +1,350 @@
+"""Reduced-order (POD) surrogate of the r-z stack model.
+
+:meth:`ReducedStackModel.build` runs :func:`~laserpad.solver.solve_transient_2d`
+for a few training power waveforms, extracts a proper-orthogonal-decomposition
+basis from the snapshots and projects the conduction operator onto it.
+:meth:`ReducedStackModel.predict` then advances only a few dozen modal
+coefficients for a new :class:`~laserpad.waveforms.Waveform`, with a bound on
+the error against the full model.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .geometry import TraceCoverage
+from .materials import MaterialTable, material_ids, material_table
+from .results import ProbeSpec, TransientResult, output_steps, probe_cells
+from .solver import (
+    HeatSource,
+    _cell_widths,
+    _source_profile,
+    _StackOperator,
+    _trace_fraction,
+    solve_transient_2d,
+)
+from .waveforms import Waveform
+
+
+class ReducedStackModel:
+    """Galerkin projection of the r-z stack onto a POD basis.
+
+    The modes are orthonormal in the heat-capacity inner product and
+    diagonalize the projected conduction operator, so every modal
+    coefficient obeys ``da/dt = -rate*a + s(t)*forcing`` for the power
+    multiplier ``s``. Coefficients are advanced with backward Euler, like the
+    full ``"implicit"`` scheme, which makes the projection the only source of
+    error and lets :meth:`predict` bound it from the residual of the full
+    equations.
+
+    Attributes
+    ----------
+    modes:
+        ``(n_modes, n_z, n_r)`` basis fields [K per unit coefficient].
+    rates:
+        Decay rate of every mode [1/s].
+    singular_values:
+        Capacity-weighted singular values of all training snapshots; the
+        discarded tail measures what the basis cannot represent.
+    training_error:
+        Largest temperature difference [K] from the full model over the
+        training runs.
+    """
+
+    def __init__(
+        self,
+        modes: NDArray[np.float_],
+        rates: NDArray[np.float_],
+        forcing: NDArray[np.float_],
+        initial: NDArray[np.float_],
+        residual_gram: NDArray[np.float_],
+        initial_error: float,
+        capacity: NDArray[np.float_],
+        singular_values: NDArray[np.float_],
+        T_inf: float,
+        n_t: int,
+        dt: float,
+        centres: tuple[NDArray[np.float_], NDArray[np.float_]],
+        full_model: Callable[[Waveform | None, int, float], TransientResult],
+    ) -> None:
+        self.modes = modes
+        self.rates = rates
+        self.forcing = forcing
+        self.initial = initial
+        self.singular_values = singular_values
+        self.T_inf = T_inf
+        self.n_t = n_t
+        self.dt = dt
+        self.training_error = float("nan")
+        self._gram = residual_gram
+        self._initial_error = initial_error
+        self._capacity = capacity
+        self._centres = centres
+        self._full_model = full_model
+        self._last_kernel: (
+            tuple[
+                tuple[int, float],
+                tuple[NDArray[np.float_], NDArray[np.complex_], int],
+            ]
+            | None
+        ) = None
+
+    @property
+    def n_modes(self) -> int:
+        """Number of retained modes."""
+        return len(self.rates)
+
+    @classmethod
+    def build(
+        cls,
+        r_centres: NDArray[np.float_],
+        dr: float | ArrayLike,
+        z_centres: NDArray[np.float_],
+        dz: float | ArrayLike,
+        mat_idx: NDArray[np.uint8],
+        q_flux: float,
+        n_t: int,
+        dt: float,
+        heat_source: HeatSource | None = None,
+        T0: float = 25.0,
+        trace_mask: NDArray[np.bool_] | TraceCoverage | None = None,
+        h_trace: float = 1e3,
+        T_inf: float = 25.0,
+        *,
+        training: Sequence[Waveform] | None = None,
+        n_modes: int | None = None,
+        tol: float = 1e-10,
+        materials: MaterialTable | None = None,
+    ) -> ReducedStackModel:
+        """Build the surrogate of one stack from full-model snapshots.
+
+        Parameters
+        ----------
+        r_centres, dr, z_centres, dz, mat_idx, q_flux, heat_source, T0,
+        trace_mask, h_trace, T_inf:
+            The stack as for :func:`~laserpad.solver.solve_transient_2d`;
+            ``q_flux`` and ``heat_source`` give the heat input at a power
+            multiplier of 1.
+        n_t, dt:
+            Length and step of the training runs and default horizon of
+            :meth:`predict`.
+        training:
+            Power waveforms of the training runs. The default, a single
+            power step, already spans the responses to any waveform of a
+            linear stack up to the resolution of ``dt``. When ``T0`` differs
+            from ``T_inf`` an unpowered run is added.
+        n_modes, tol:
+            Number of modes to keep; by default the fewest whose singular
+            values hold all but ``tol`` of the snapshot energy.
+        materials:
+            Material table the ids refer to (temperature independent).
+        """
+
+        table = materials or material_table()
+        if table.temperature_dependent:
+            raise ValueError("Reduced models need temperature-independent materials")
+        if np.ndim(q_flux) or np.ndim(h_trace):
+            raise ValueError("Reduced models are built for a single case")
+        mat_ids = material_ids(mat_idx, table)
+        shape = mat_ids.shape
+        k = table.k[mat_ids]
+        rho_cp = table.rho_cp[mat_ids]
+        source = _source_profile(heat_source, r_centres) / rho_cp[0, :]
+        # The model works in T - T_inf, so the sink ambient is zero.
+        op = _StackOperator(
+            r_centres,
+            _cell_widths(r_centres, dr, "dr"),
+            _cell_widths(z_centres, dz, "dz"),
+            k,
+            rho_cp,
+            _trace_fraction(trace_mask) * h_trace,
+            0.0,
+            q_flux,
+            source,
+        )
+
+        def full_model(power: Waveform | None, n_t: int, dt: float) -> TransientResult:
+            return solve_transient_2d(
+                r_centres,
+                dr,
+                z_centres,
+                dz,
+                mat_ids,
+                q_flux,
+                n_t,
+                dt,
+                heat_source,
+                T0,
+                trace_mask,
+                h_trace,
+                T_inf,
+                scheme="implicit",
+                materials=table,
+                power=power,
+            )
+
+        waveforms = list(training or [Waveform.constant()])
+        if T0 != T_inf:
+            # Keep the free decay of the initial state separable from the
+            # driven response.
+            waveforms.append(Waveform.constant(0.0))
+        runs = [full_model(power, n_t, dt) for power in waveforms]
+        capacity = op.capacity.ravel()
+        theta0 = np.full(capacity.shape, T0 - T_inf)
+        snapshots = np.concatenate(
+            [theta0[:, None]]
+            + [np.asarray(run.T).reshape(len(run.times), -1).T - T_inf for run in runs],
+            axis=1,
+        )
+        weight = np.sqrt(capacity)
+        U, sigma, _ = np.linalg.svd(weight[:, None] * snapshots, full_matrices=False)
+        rank = int(np.count_nonzero(sigma > 1e-12 * sigma[0]))
+        if n_modes is None:
+            energy = np.cumsum(sigma**2)
+            n_modes = int(np.searchsorted(energy, (1.0 - tol) * energy[-1])) + 1
+        n_modes = min(n_modes, rank)
+        basis = U[:, :n_modes] / weight[:, None]
+
+        applied = np.empty_like(basis)
+        net = np.empty(shape)
+        for i in range(n_modes):
+            net[:] = 0.0
+            mode = basis[:, i].reshape(shape)
+            op.add_radial(mode, net)
+            op.add_axial(mode, net)
+            applied[:, i] = net.ravel()
+        reduced = -basis.T @ applied
+        rates, rotation = np.linalg.eigh(0.5 * (reduced + reduced.T))
+        basis = basis @ rotation
+        applied = applied @ rotation
+
+        power_in = op.power_in.ravel()
+        forcing = basis.T @ power_in
+        initial = basis.T @ (capacity * theta0)
+        # Residual of the full equations for a reduced state (s, a) is
+        # s*(p - C*Phi*f) + (L*Phi + C*Phi*diag(rates))*a; its C^-1 norm is
+        # the quadratic form of this Gram matrix.
+        residual = np.column_stack(
+            [
+                power_in - capacity * (basis @ forcing),
+                applied + capacity[:, None] * basis * rates,
+            ]
+        )
+        gram = residual.T @ (residual / capacity[:, None])
+        missed = theta0 - basis @ initial
+
+        model = cls(
+            basis.T.reshape((n_modes,) + shape),
+            rates,
+            forcing,
+            initial,
+            gram,
+            float(np.sqrt(np.sum(capacity * missed**2))),
+            op.capacity,
+            sigma,
+            T_inf,
+            n_t,
+            dt,
+            (z_centres, r_centres),
+            full_model,
+        )
+        model.training_error = max(
+            float(np.max(np.abs(np.asarray(model.predict(power).T) - run.T)))
+            for power, run in zip(waveforms, runs)
+        )
+        return model
+
+    def predict(
+        self,
+        power: Waveform | None = None,
+        n_t: int | None = None,
+        dt: float | None = None,
+        *,
+        probes: ProbeSpec | None = None,
+        save_every: int | None = None,
+        save_times: ArrayLike | None = None,
+    ) -> TransientResult:
+        """Predict the response to the power multiplier ``power``.
+
+        The coefficients of all steps follow from one FFT convolution of the
+        per-step power schedule with the modal step responses. Saved fields
+        and probes are reconstructed from the modes as for the full solver;
+        ``result.error_estimate`` bounds the capacity-weighted RMS
+        temperature error [K] against the full ``"implicit"`` model at every
+        probe time.
+        """
+
+        n_t = self.n_t if n_t is None else n_t
+        dt = self.dt if dt is None else dt
+        times = np.arange(0.0, (n_t + 1) * dt, dt)[: n_t + 1]
+        schedule = power.schedule(times) if power is not None else np.ones(n_t)
+
+        powers, spectrum, size = self._kernel(n_t, dt)
+        driven = np.fft.irfft(
+            np.fft.rfft(np.append(0.0, schedule), size) * spectrum, size
+        )[:, : n_t + 1]
+        coeffs = (powers * self.initial[:, None] + driven).T
+
+        flat = self.modes.reshape(self.n_modes, -1)
+        shape = self.modes.shape[1:]
+        save = output_steps(times, save_every, save_times)
+        fields = self.T_inf + (coeffs[save] @ flat).reshape((len(save),) + shape)
+        cells = probe_cells(self._centres, probes)
+        sampled = {
+            name: self.T_inf + coeffs @ flat[:, cell] for name, cell in cells.items()
+        }
+
+        state = np.column_stack([np.append(0.0, schedule), coeffs])
+        residual = np.sqrt(np.maximum(np.sum((state @ self._gram) * state, 1), 0.0))
+        residual[0] = 0.0
+        bound = (self._initial_error + dt * np.cumsum(residual)) / np.sqrt(
+            np.sum(self._capacity)
+        )
+        return TransientResult(
+            times=times[save],
+            T=fields,
+            probe_times=times,
+            probes=sampled,
+            error_estimate=bound,
+        )
+
+    def _kernel(
+        self, n_t: int, dt: float
+    ) -> tuple[NDArray[np.float_], NDArray[np.complex_], int]:
+        """Return the modal decay powers and driven-response spectrum.
+
+        Backward Euler advances ``a[n+1] = decay*a[n] + s[n]*gain``, so the
+        driven part of ``a`` is the convolution of the schedule with
+        ``gain*decay**n``. The last kernel is cached, as predictions usually
+        share one time grid.
+        """
+
+        key = (n_t, dt)
+        if self._last_kernel is None or self._last_kernel[0] != key:
+            decay = 1.0 / (1.0 + dt * self.rates)
+            powers = decay[:, None] ** np.arange(n_t + 1)
+            size = 1 << int(2 * (n_t + 1) - 1).bit_length()
+            spectrum = np.fft.rfft(dt * (decay * self.forcing)[:, None] * powers, size)
+            self._last_kernel = (key, (powers, spectrum, size))
+        return self._last_kernel[1]
+
+    def validate(
+        self, power: Waveform | None = None, n_t: int | None = None
+    ) -> tuple[float, float]:
+        """Return the true and estimated final error [K] against a full run.
+
+        The first value is the capacity-weighted RMS difference of the final
+        fields, the second the bound reported by :meth:`predict`.
+        """
+
+        n_t = self.n_t if n_t is None else n_t
+        full = self._full_model(power, n_t, self.dt)
+        reduced = self.predict(power, n_t)
+        error = np.asarray(reduced.T)[-1] - np.asarray(full.T)[-1]
+        capacity = self._capacity
+        rms = float(np.sqrt(np.sum(capacity * error**2) / np.sum(capacity)))
+        assert reduced.error_estimate is not None
+        return rms, float(reduced.error_estimate[-1])
@@ -0,0 +1,139 @@
+"""Step-response superposition for linear transient models.
+
+With constant material properties every solver is linear in the laser
+power. :meth:`StepResponse.compute` records the probe response to a unit
+power step with one solver run; the response to any other power waveform
+is then a discrete convolution of its per-step schedule with the step
+increments, evaluated by FFT for whole batches of waveforms at once.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .results import TransientResult
+from .waveforms import Waveform
+
+
+class StepResponse:
+    """Probe responses of a linear model to a unit power step.
+
+    ``rise[name][n]`` is the temperature rise of probe ``name`` after ``n``
+    steps of ``dt`` at the nominal heat input (power multiplier 1), starting
+    from the equilibrium temperature ``T0``. Responses are exact for the
+    fixed-step solver that produced them: a waveform contributes its mean
+    over every step, as in a direct run with ``power=``.
+    """
+
+    def __init__(
+        self, times: NDArray[np.float_], rise: dict[str, NDArray[np.float_]], T0: float
+    ) -> None:
+        self.times = times
+        self.rise = rise
+        self.T0 = T0
+        self.dt = float(times[1] - times[0])
+        # Response to one step of unit power, per probe.
+        self._impulse = {name: np.diff(values) for name, values in rise.items()}
+
+    @classmethod
+    def compute(
+        cls,
+        solver: Callable[..., TransientResult],
+        *args: Any,
+        probes: Any,
+        **kwargs: Any,
+    ) -> StepResponse:
+        """Run ``solver(*args, probes=probes, **kwargs)`` at constant power.
+
+        ``solver`` is one of the fixed-step transient solvers, e.g.
+        :func:`~laserpad.solver.solve_transient_2d`, and the run must start
+        from equilibrium (``T0`` equal to ``T_inf`` where the model has one).
+        """
+
+        for option in ("power", "adaptive", "events"):
+            if kwargs.get(option):
+                raise ValueError(f"Step responses need runs without {option!r}")
+        if "T0" in kwargs and "T_inf" in kwargs and kwargs["T0"] != kwargs["T_inf"]:
+            raise ValueError("Step responses need a run starting from T0 == T_inf")
+        if not probes:
+            raise ValueError("Step responses need at least one probe")
+        # Only the probe histories are needed, so keep just the first frame.
+        kwargs.setdefault("save_times", [0.0])
+        result = solver(*args, probes=probes, **kwargs)
+        T0 = float(next(iter(result.probes.values()))[0])
+        rise = {name: values - values[0] for name, values in result.probes.items()}
+        if any(values.ndim != 1 for values in rise.values()):
+            raise ValueError("Step responses need a single (unbatched) case")
+        return cls(result.probe_times, rise, T0)
+
+    def schedule(self, power: Waveform, n_t: int | None = None) -> NDArray[np.float_]:
+        """Return the per-step power multipliers of ``power``."""
+        n_t = len(self.times) - 1 if n_t is None else n_t
+        return power.schedule(self.times[: n_t + 1])
+
+    def respond(
+        self, powers: Waveform | Sequence[Waveform] | ArrayLike
+    ) -> dict[str, NDArray[np.float_]]:
+        """Return the probe temperatures for one or many power waveforms.
+
+        ``powers`` is a :class:`~laserpad.waveforms.Waveform`, a sequence of
+        them, or per-step multipliers of shape ``(n_steps,)`` or
+        ``(n_cases, n_steps)``. Each probe gets ``(n_steps + 1,)`` samples at
+        ``times``, or ``(n_steps + 1, n_cases)`` for many waveforms, matching
+        the layout of batched solver runs.
+        """
+
+        if isinstance(powers, Waveform):
+            schedules = self.schedule(powers)
+        elif isinstance(powers, Sequence) and all(
+            isinstance(p, Waveform) for p in powers
+        ):
+            schedules = np.stack([self.schedule(p) for p in powers])
+        else:
+            schedules = np.asarray(powers, dtype=float)
+        n_t = schedules.shape[-1]
+        if n_t > len(self.times) - 1:
+            raise ValueError(
+                f"Schedules of {n_t} steps exceed the {len(self.times) - 1} "
+                "recorded steps"
+            )
+
+        size = 1 << (2 * n_t).bit_length()
+        spectrum = np.fft.rfft(schedules, size)
+        out = {}
+        for name, impulse in self._impulse.items():
+            driven = np.fft.irfft(spectrum * np.fft.rfft(impulse[:n_t], size), size)
+            values = np.empty(schedules.shape[:-1] + (n_t + 1,))
+            values[..., 0] = 0.0
+            values[..., 1:] = driven[..., :n_t]
+            out[name] = self.T0 + np.moveaxis(values, -1, 0)
+        return out
+
+    def process_window(
+        self,
+        probe: str,
+        powers: ArrayLike,
+        dwells: ArrayLike,
+        n_t: int | None = None,
+    ) -> NDArray[np.float_]:
+        """Return the peak temperature of ``probe`` for rectangular pulses.
+
+        Entry ``[i, j]`` is the hottest value over the first ``n_t`` steps
+        (all recorded steps by default) for a pulse of power multiplier
+        ``powers[i]`` lasting ``dwells[j]`` seconds from ``t = 0``. Only one
+        convolution per dwell is needed, as the response scales with power.
+        """
+
+        n_t = len(self.times) - 1 if n_t is None else n_t
+        dwells = np.asarray(dwells, dtype=float)
+        start = self.times[:n_t] / self.dt
+        # Exact per-step mean of a unit pulse of each dwell.
+        schedules = np.clip(dwells[:, None] / self.dt - start, 0.0, 1.0)
+        rise = self.respond(schedules)[probe] - self.T0
+        highest = rise.max(axis=0)
+        lowest = rise.min(axis=0)
+        powers = np.asarray(powers, dtype=float)[:, None]
+        return self.T0 + np.where(powers >= 0, powers * highest, powers * lowest)
@@ -0,0 +1,101 @@
+"""Result containers and output scheduling for the transient solvers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterator, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .events import EventRecord
+from .geometry import SectorSymmetry
+from .store import FrameStore
+
+ProbeSpec = Mapping[str, "float | Sequence[float]"]
+
+
+@dataclass
+class TransientResult:
+    """Saved fields and probe histories of a transient run.
+
+    ``times``/``T`` hold only the frames selected by the output schedule
+    (``T`` is a lazy :class:`~laserpad.store.FrameStore` for runs streamed to
+    disk), while every entry of ``probes`` is sampled at each step in
+    ``probe_times``. ``event`` names the stopping event that ended the run
+    early, if any, and ``sector`` maps the angular cells of a 3-D run reduced
+    by symmetry to the full circle. Surrogate predictions carry an
+    ``error_estimate`` [K] per probe time. Unpacking yields ``(times, T)`` so existing
+    ``times, T = solve_transient(...)`` call sites keep working.
+    """
+
+    times: NDArray[np.float_]
+    T: NDArray[np.float_] | FrameStore
+    probe_times: NDArray[np.float_]
+    probes: dict[str, NDArray[np.float_]] = field(default_factory=dict)
+    event: EventRecord | None = None
+    sector: SectorSymmetry | None = None
+    error_estimate: NDArray[np.float_] | None = None
+
+    def __iter__(self) -> Iterator[NDArray[np.float_] | FrameStore]:
+        return iter((self.times, self.T))
+
+
+def output_steps(
+    times: NDArray[np.float_],
+    save_every: int | None = None,
+    save_times: ArrayLike | None = None,
+) -> NDArray[np.int_]:
+    """Return the sorted step indices whose fields should be kept.
+
+    With neither option every step is saved. ``save_every=N`` keeps the
+    initial state, every ``N``-th step and the final step; ``save_times``
+    keeps the step closest to each requested time.
+    """
+
+    steps = len(times) - 1
+    if save_every is not None and save_times is not None:
+        raise ValueError("Pass either save_every or save_times, not both")
+    if save_times is not None:
+        requested = np.atleast_1d(np.asarray(save_times, dtype=float))
+        right = np.clip(np.searchsorted(times, requested), 0, steps)
+        left = np.clip(right - 1, 0, steps)
+        closer_left = np.abs(times[left] - requested) <= np.abs(
+            times[right] - requested
+        )
+        return np.unique(np.where(closer_left, left, right))
+    if save_every is None:
+        save_every = 1
+    if save_every < 1:
+        raise ValueError("save_every must be a positive integer")
+    return np.unique(np.append(np.arange(0, steps + 1, save_every), steps))
+
+
+def probe_cells(
+    centres: Sequence[NDArray[np.float_]], probes: ProbeSpec | None
+) -> dict[str, int]:
+    """Return the flat index of the cell nearest to each named probe.
+
+    ``centres`` lists the cell-centre coordinates per field axis in field
+    order, e.g. ``(r_centres,)`` for the radial model or
+    ``(z_centres, r_centres)`` for the r-z stack. Probe positions are given
+    in ``(r, z)`` order, matching the solver arguments; a 1-D probe may be a
+    plain radius.
+    """
+
+    if not probes:
+        return {}
+    shape = tuple(len(c) for c in centres)
+    cells: dict[str, int] = {}
+    for name, position in probes.items():
+        coords = np.atleast_1d(np.asarray(position, dtype=float))
+        if len(coords) != len(centres):
+            raise ValueError(
+                f"Probe {name!r} needs {len(centres)} coordinate(s), got {len(coords)}"
+            )
+        # Probes are given as (r, z) while 2-D fields are stored (z, r).
+        index = tuple(
+            int(np.argmin(np.abs(c - x))) for c, x in zip(centres, coords[::-1])
+        )
+        cells[name] = int(np.ravel_multi_index(index, shape))
+    return cells
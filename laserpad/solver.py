@@ -2,235 +2,1783 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+from collections import OrderedDict
+
 import numpy as np
-from numpy.typing import NDArray
-from typing import Callable
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+from typing import Callable, Sequence, cast
 
-ProgressCallback = Callable[[int, int], None]
+from .cache import ResultCache, resolve_cache, stable_hash
+from .checkpoint import Checkpointer
+from .events import Event, EventMonitor
+from .geometry import SectorSymmetry, TraceCoverage
+from .materials import MaterialTable, PropertyLookup, material_ids, material_table
+from .marching import Stepper, march, march_adaptive
+from .progress import CancelToken, ProgressCallback
+from .results import ProbeSpec, TransientResult, output_steps, probe_cells
+from .store import FrameWriter
+from .tridiagonal import BlockTridiagonalSolver, TridiagonalSolver
+from .waveforms import Waveform
 
 
 def solve_heatup(
-    power_W: float,
-    m_kg: float,
-    cp: float,
+    power_W: float | ArrayLike,
+    m_kg: float | ArrayLike,
+    cp: float | ArrayLike,
     t_max: float = 1.0,
     dt: float = 0.01,
-    T0: float = 25.0,
+    T0: float | ArrayLike = 25.0,
     *,
+    h_conv: float | ArrayLike = 0.0,
+    area_m2: float | ArrayLike = 0.0,
+    g_trace: float | ArrayLike = 0.0,
+    T_inf: float = 25.0,
+    power_times: ArrayLike | None = None,
     max_steps: int | None = None,
     progress_cb: ProgressCallback | None = None,
 ) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
-    """Integrate dT/dt = power/(m*cp) with explicit Euler."""
+    """Lumped heat-up ``m*cp*dT/dt = P(t) - G*(T - T_inf)`` in closed form.
+
+    ``G = h_conv*area_m2 + g_trace`` [W/K] lumps convective and trace
+    conduction losses; without losses the temperature rises linearly,
+    otherwise it approaches ``T_inf + P/G`` exponentially. The exact solution
+    is evaluated on the time grid, so the result does not depend on ``dt``.
+
+    Parameters
+    ----------
+    power_W, m_kg, cp, T0, h_conv, area_m2, g_trace:
+        Scalars or arrays broadcasting to the shape of a batch of pads (e.g.
+        the fields of :func:`~laserpad.geometry.get_pad_properties` called
+        with an array of diameters).
+    power_times:
+        Optional start times [s] of piecewise-constant power segments. The
+        last axis of ``power_W`` then holds one power per segment; segment
+        ``k`` lasts until ``power_times[k+1]`` (the last one until the end)
+        and no power is applied before ``power_times[0]``.
+    max_steps:
+        Optional limit on the number of time steps.
+    progress_cb:
+        Called once, with the number of steps, when the solution is ready.
+
+    Returns
+    -------
+    tuple
+        ``times`` of shape ``(n_t,)`` and ``temps`` of shape ``(n_t,)`` plus
+        the batch shape of the inputs.
+    """
+
     times: NDArray[np.float_] = np.arange(0.0, t_max + dt, dt)
     if max_steps is not None:
         times = times[: max_steps + 1]
-    temps: NDArray[np.float_] = np.empty_like(times)
-    temps[0] = T0
-    steps = len(times) - 1
-    for i in range(steps):
-        temps[i + 1] = temps[i] + (power_W / (m_kg * cp)) * dt
-        if progress_cb is not None:
-            progress_cb(i + 1, steps)
+
+    power = np.asarray(power_W, dtype=float)
+    if power_times is None:
+        starts = np.zeros(1)
+        power = power[..., None]
+    else:
+        starts = np.asarray(power_times, dtype=float)
+        if starts.ndim != 1 or power.shape[-1:] != starts.shape:
+            raise ValueError("power_W needs one value per power segment")
+        if np.any(np.diff(starts) < 0):
+            raise ValueError("power_times must be non-decreasing")
+    ends = np.append(starts[1:], np.inf)
+
+    capacity = np.asarray(m_kg, dtype=float) * np.asarray(cp, dtype=float)
+    conductance = np.asarray(h_conv, dtype=float) * np.asarray(area_m2, dtype=float)
+    rate = (conductance + np.asarray(g_trace, dtype=float)) / capacity
+    batch = np.broadcast_shapes(power.shape[:-1], rate.shape, np.shape(T0))
+    t = times.reshape(times.shape + (1,) * len(batch))
+
+    temps = T_inf + (np.asarray(T0, dtype=float) - T_inf) * np.exp(-rate * t)
+    temps = np.broadcast_to(temps, times.shape + batch).copy()
+    for k in range(len(starts)):
+        # Heat added during [starts[k], min(t, ends[k])], decayed until t.
+        since_end = t - np.minimum(t, ends[k])
+        since_start = t - np.minimum(t, starts[k])
+        temps += (
+            power[..., k]
+            / capacity
+            * np.exp(-rate * since_end)
+            * _decay_integral(rate, since_start - since_end)
+        )
+    if progress_cb is not None:
+        progress_cb(len(times) - 1, len(times) - 1)
     return times, temps
 
 
+def _decay_integral(
+    rate: NDArray[np.float_], duration: NDArray[np.float_]
+) -> NDArray[np.float_]:
+    """Return ``∫_0^duration exp(-rate*s) ds``, exact also for ``rate == 0``."""
+    safe = np.where(rate > 0, rate, 1.0)
+    return cast(
+        NDArray[np.float_],
+        np.where(rate > 0, -np.expm1(-safe * duration) / safe, duration),
+    )
+
+
+def _cell_widths(
+    centres: NDArray[np.float_], widths: float | ArrayLike, name: str
+) -> NDArray[np.float_]:
+    """Return the width of every cell from a uniform spacing or per-cell widths."""
+    cells = np.asarray(widths, dtype=float)
+    if cells.ndim > 1 or cells.size not in (1, len(centres)):
+        raise ValueError(f"{name} needs a spacing or one width per cell")
+    if np.any(cells <= 0):
+        raise ValueError(f"{name} must be positive")
+    return np.broadcast_to(cells, np.shape(centres))
+
+
+def _faces(
+    centres: NDArray[np.float_], widths: NDArray[np.float_]
+) -> NDArray[np.float_]:
+    """Return the ``n + 1`` face positions of cells with the given centres."""
+    return np.concatenate([centres[:1] - 0.5 * widths[:1], centres + 0.5 * widths])
+
+
+def _gaps(widths: NDArray[np.float_]) -> NDArray[np.float_]:
+    """Return the distances between neighbouring cell centres."""
+    return 0.5 * (widths[:-1] + widths[1:])
+
+
+def _radial_coefficients(
+    r_centres: NDArray[np.float_],
+    r_faces: NDArray[np.float_],
+    dr: NDArray[np.float_],
+    alpha: float | NDArray[np.float_],
+) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
+    """Return west/east coupling rates ``alpha*r_face/(r*dr*gap)`` per cell.
+
+    ``gap`` is the distance to the neighbouring centre; the ghost cells
+    beyond either end mirror the boundary cell.
+    """
+    scale = alpha / (r_centres * dr)
+    gaps = np.concatenate([dr[:1], _gaps(dr), dr[-1:]])
+    return scale * r_faces[:-1] / gaps[:-1], scale * r_faces[1:] / gaps[1:]
+
+
+def _harmonic_mean(
+    a: NDArray[np.float_],
+    b: NDArray[np.float_],
+    w_a: float | NDArray[np.float_] = 1.0,
+    w_b: float | NDArray[np.float_] = 1.0,
+) -> NDArray[np.float_]:
+    """Return the harmonic mean used for conductivity at cell faces.
+
+    ``w_a`` and ``w_b`` weight the two sides by their cell widths, giving the
+    conductivity of two resistances in series on non-uniform meshes.
+    """
+    return cast(NDArray[np.float_], (w_a + w_b) * a * b / (w_a * b + w_b * a))
+
+
+HeatSource = Callable[[NDArray[np.float_]], NDArray[np.float_]]
+
+
+def _source_profile(
+    heat_source: HeatSource | Sequence[HeatSource] | None,
+    r_centres: NDArray[np.float_],
+) -> NDArray[np.float_]:
+    """Evaluate ``heat_source`` at ``r_centres``; a sequence gives one row per case."""
+    if heat_source is None:
+        return np.zeros_like(r_centres)
+    if callable(heat_source):
+        return np.asarray(heat_source(r_centres), dtype=float)
+    return np.stack(
+        [np.broadcast_to(f(r_centres), r_centres.shape) for f in heat_source]
+    ).astype(float)
+
+
+def _trace_fraction(trace_mask: NDArray[np.bool_] | TraceCoverage | None) -> float:
+    """Return the fraction of the rim covered by traces."""
+    if isinstance(trace_mask, TraceCoverage):
+        return trace_mask.fraction
+    if trace_mask is not None:
+        return float(np.mean(trace_mask[:, -1]))
+    return 0.0
+
+
+def _batch_shape(*shapes: tuple[int, ...]) -> tuple[int, ...]:
+    """Return the shape of the case axis implied by the per-case inputs."""
+    batch = np.broadcast_shapes(*shapes)
+    if len(batch) > 1:
+        raise ValueError(f"Cases must vary along a single axis, got shape {batch}")
+    return batch
+
+
+def _batch_probes(
+    probes: dict[str, int], batch: tuple[int, ...], frame_size: int
+) -> dict[str, int | NDArray[np.int_]]:
+    """Expand frame-local probe cells to one flat index per case."""
+    if not batch:
+        return dict(probes)
+    offsets = frame_size * np.arange(batch[0])
+    return {name: cell + offsets for name, cell in probes.items()}
+
+
+def _cache_entry(
+    cache: ResultCache | bool | None,
+    store: str | os.PathLike[str] | None,
+    kind: str,
+    inputs: dict[str, object],
+) -> tuple[ResultCache, str] | None:
+    """Return the cache and key of a run, or ``None`` if it is not cached.
+
+    Runs streamed to a frame store are never cached.
+    """
+    results = resolve_cache(cache) if store is None else None
+    if results is None:
+        return None
+    return results, stable_hash(kind, inputs)
+
+
+def _cache_hit(
+    entry: tuple[ResultCache, str] | None, progress_cb: ProgressCallback | None
+) -> TransientResult | None:
+    """Return the cached result of a run, reporting it as complete."""
+    if entry is None:
+        return None
+    result = entry[0].get(entry[1])
+    if result is not None and progress_cb is not None:
+        progress_cb(1, 1)
+    return result
+
+
+def _remember(
+    entry: tuple[ResultCache, str] | None, result: TransientResult
+) -> TransientResult:
+    """Store ``result`` in the cache of ``entry`` (if any) and return it."""
+    if entry is not None:
+        entry[0].put(entry[1], result)
+    return result
+
+
+def _checkpointer(
+    path: str | os.PathLike[str] | None,
+    interval: float,
+    kind: str,
+    inputs: dict[str, object],
+    *,
+    adaptive: bool,
+    heat_rate: ArrayLike,
+    power: Waveform | None,
+    stride: int = 1,
+) -> Checkpointer | None:
+    """Return the checkpointer of a run, or ``None`` if it is not checkpointed."""
+    if path is None:
+        return None
+    if adaptive:
+        raise ValueError("Checkpoints are only supported for fixed-step runs")
+    return Checkpointer(
+        path,
+        stable_hash(kind, inputs),
+        interval=interval,
+        stride=stride,
+        heat_rate=heat_rate,
+        power=power,
+    )
+
+
+def _kept_frames(checkpoint: Checkpointer | None) -> int:
+    """Return the number of stored frames a resumed run keeps."""
+    if checkpoint is None or checkpoint.resumed is None:
+        return 0
+    return checkpoint.resumed.n_frames
+
+
+def _field_dtype(dtype: DTypeLike) -> np.dtype[np.floating]:
+    """Return ``dtype`` checked to be a supported field precision."""
+    resolved = np.dtype(dtype)
+    if resolved not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError(f"dtype must be float32 or float64, not {resolved}")
+    return resolved
+
+
+def _optional_array(values: ArrayLike | None) -> NDArray[np.float_] | None:
+    """Return ``values`` as a float array for cache keys (``None`` kept)."""
+    return None if values is None else np.asarray(values, dtype=float)
+
+
+def _waveform_metadata(power: Waveform | None) -> dict[str, NDArray[np.float_]] | None:
+    """Return the knots of ``power`` for frame-store metadata."""
+    if power is None:
+        return None
+    return {"times": power.times, "values": power.values}
+
+
+_THETA = {"implicit": 1.0, "crank-nicolson": 0.5}
+# Order of accuracy of each implicit scheme, used by the adaptive driver.
+_ORDER = {"implicit": 1, "crank-nicolson": 2, "adi": 2}
+
+
+class _RadialExplicit:
+    """Forward-Euler step of the 1-D radial stencil."""
+
+    def __init__(
+        self,
+        coef_w: NDArray[np.float_],
+        coef_e: NDArray[np.float_],
+        ghost_step: float | NDArray[np.float_],
+        source: NDArray[np.float_],
+        dt: float,
+    ) -> None:
+        n_r = len(coef_w)
+        batch = source.shape[:-1]
+        self.coef_w = coef_w
+        self.coef_e = coef_e
+        self.ghost_step = ghost_step
+        self.source = source
+        self.dt = dt
+        self.power_scale = 1.0
+        # Ghost-padded copy of the current profile and two work buffers,
+        # reused across steps so the march allocates nothing per step.
+        self._ext = np.empty(batch + (n_r + 2,), source.dtype)
+        self._flux_e = np.empty(batch + (n_r,), source.dtype)
+        self._flux_w = np.empty(batch + (n_r,), source.dtype)
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None:
+        T_ext, flux_e, flux_w = self._ext, self._flux_e, self._flux_w
+        T_ext[..., 1:-1] = old
+        T_ext[..., 0] = old[..., 0] + self.power_scale * self.ghost_step
+        T_ext[..., -1] = old[..., -1]
+
+        np.subtract(T_ext[..., 2:], old, out=flux_e)
+        flux_e *= self.coef_e
+        np.subtract(old, T_ext[..., :-2], out=flux_w)
+        flux_w *= self.coef_w
+        flux_e -= flux_w
+        np.multiply(self.source, self.power_scale, out=flux_w)
+        flux_e += flux_w
+        flux_e *= self.dt
+        np.add(old, flux_e, out=new)
+
+
+class _RadialTheta:
+    """Theta-method step (backward Euler or Crank-Nicolson) of the 1-D stencil.
+
+    The tridiagonal matrix ``I - theta*dt*L`` is factored once; every step is
+    then a single O(n_r) Thomas solve.
+    """
+
+    def __init__(
+        self,
+        coef_w: NDArray[np.float_],
+        coef_e: NDArray[np.float_],
+        ghost_step: float | NDArray[np.float_],
+        source: NDArray[np.float_],
+        dt: float,
+        theta: float,
+    ) -> None:
+        # Boundary couplings leave the operator: the inner ghost becomes a
+        # constant source and the outer boundary is adiabatic.
+        cw = coef_w.copy()
+        ce = coef_e.copy()
+        rate = source.copy()
+        rate[..., 0] += cw[0] * ghost_step
+        cw[0] = 0.0
+        ce[-1] = 0.0
+
+        self.cw = cw
+        self.ce = ce
+        self.theta = theta
+        self.dt = dt
+        self.power_scale = 1.0
+        self._rhs_const = dt * rate
+        self._solver = TridiagonalSolver(
+            -theta * dt * cw,
+            1.0 + theta * dt * (cw + ce),
+            -theta * dt * ce,
+            dtype=source.dtype,
+        )
+        self._rhs = np.empty(source.shape, source.dtype)
+        self._flux = np.empty(source.shape[:-1] + (len(cw) - 1,), source.dtype)
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None:
+        rhs = self._rhs
+        np.multiply(self._rhs_const, self.power_scale, out=rhs)
+        rhs += old
+        explicit = (1.0 - self.theta) * self.dt
+        if explicit:
+            flux = self._flux
+            np.subtract(old[..., 1:], old[..., :-1], out=flux)
+            rhs[..., :-1] += explicit * self.ce[:-1] * flux
+            rhs[..., 1:] -= explicit * self.cw[1:] * flux
+        self._solver.solve(rhs, axis=-1, out=new)
+
+
 def solve_transient(
     r_centres: NDArray[np.float_],
-    dr: float,
-    q_flux: float,
+    dr: float | ArrayLike,
+    q_flux: float | ArrayLike,
     k: float,
     rho_cp: float,
     t_max: float,
     dt: float,
-    heat_source: Callable[[NDArray[np.float_]], NDArray[np.float_]] | None = None,
+    heat_source: HeatSource | Sequence[HeatSource] | None = None,
     T0: float = 25.0,
     *,
     max_steps: int | None = None,
     allow_unstable: bool = False,
+    scheme: str = "explicit",
+    save_every: int | None = None,
+    save_times: ArrayLike | None = None,
+    probes: ProbeSpec | None = None,
+    store: str | os.PathLike[str] | None = None,
+    adaptive: bool = False,
+    rtol: float = 1e-3,
+    atol: float = 1e-2,
+    dt_max: float | None = None,
+    events: Sequence[Event] | None = None,
+    power: Waveform | None = None,
+    dtype: DTypeLike = np.float64,
+    cache: ResultCache | bool | None = None,
+    cancel: CancelToken | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    checkpoint_interval: float = 600.0,
     progress_cb: ProgressCallback | None = None,
-) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
-    """Explicit transient solver for 1-D cylindrical conduction.
+) -> TransientResult:
+    """Transient solver for 1-D cylindrical conduction.
 
     Parameters
     ----------
+    r_centres, dr:
+        Cell centres [m] and the uniform spacing or per-cell widths [m], as
+        returned by :func:`~laserpad.geometry.build_radial_mesh`.
     q_flux:
         Applied heat flux at the inner radius [W/m²].
     heat_source:
         Optional callable giving the surface heat-flux distribution ``q''(r)``
         [W/m²]. If ``None`` no volumetric heating is applied. The flux profile
         is converted to a volumetric source ``q''/rho_cp`` in each cell.
+
+        Batched runs: ``q_flux`` may be an array of cases, and ``heat_source``
+        a sequence of callables or a callable returning one profile per case
+        (``(n_cases, n_r)``). All cases advance together in one state of shape
+        ``(n_cases, n_r)``.
     T0:
         Initial temperature.
     max_steps:
         Optional limit on the number of time steps.
     allow_unstable:
         If ``True`` run even when ``dt`` violates the stability limit.
+    scheme:
+        ``"explicit"`` (forward Euler, subject to the stability limit),
+        ``"implicit"`` (backward Euler) or ``"crank-nicolson"``. The implicit
+        schemes are unconditionally stable and solve one tridiagonal system
+        per step.
+    save_every, save_times:
+        Output schedule: keep every ``save_every``-th profile (plus the first
+        and last) or the profiles closest to ``save_times``. By default every
+        step is kept.
+    probes:
+        Named radii [m] whose temperature is recorded at every step in
+        ``result.probes``.
+    store:
+        Optional directory; saved profiles are streamed into a chunked
+        on-disk :class:`~laserpad.store.FrameStore` instead of memory.
+    adaptive:
+        If ``True`` (implicit schemes only) choose the step size by
+        step-doubling error control, starting from ``dt``: a step is accepted
+        when its estimated local error is below ``atol + rtol*|T|`` [K] in
+        every cell, and steps never exceed ``dt_max``. ``times`` are then
+        non-uniform and ``save_every`` counts accepted steps, while
+        ``save_times`` are hit exactly.
+    events:
+        Optional :class:`~laserpad.events.Event` objects; the run stops after
+        the first step on which one fires, the final profile is saved and
+        ``result.event`` records the interpolated crossing time.
+    power:
+        Optional :class:`~laserpad.waveforms.Waveform` multiplying ``q_flux``
+        and ``heat_source`` over time (ramps, pulse trains, logged recipes).
+        The source profile is evaluated once and every step is scaled by the
+        mean of the waveform over the step.
+    dtype:
+        Precision of the field, the saved frames and the probes: ``float64``
+        or ``float32``, which halves memory traffic and storage at about
+        1e-7 relative precision. Coefficients and factorizations are formed
+        in double precision and the heat input is tallied in double precision.
+    cache:
+        :class:`~laserpad.cache.ResultCache` to look the run up in and store
+        it to, ``False`` to always recompute, or ``None`` for the default
+        cache installed by :func:`~laserpad.cache.enable_cache` (none by
+        default). Runs are keyed on a hash of all their numeric inputs; a hit
+        is returned with read-only arrays and reports progress as complete.
+    cancel:
+        :class:`~laserpad.progress.CancelToken` polled before every step; once
+        it is cancelled the run raises :class:`~laserpad.progress.Cancelled`
+        carrying the frames and probes recorded so far.
+    checkpoint, checkpoint_interval:
+        File to write the marching state to every ``checkpoint_interval``
+        seconds of wall time (and on cancellation) during fixed-step runs.
+        If the file holds a checkpoint of a run with the same inputs, the run
+        resumes from it and returns what an uninterrupted run would; the file
+        is deleted when the run completes. ``store`` directories are resumed
+        too. See :func:`~laserpad.checkpoint.load_checkpoint`.
+
+    Returns
+    -------
+    TransientResult
+        Unpacks as ``(times, T)`` with ``T`` of shape ``(n_saved, n_r)``
+        (``(n_saved, n_cases, n_r)`` for batched runs, whose probes are
+        ``(n_samples, n_cases)``), or a lazy :class:`~laserpad.store.FrameStore`
+        when ``store`` is given.
     """
 
+    if scheme != "explicit" and scheme not in _THETA:
+        raise ValueError(f"Unknown scheme {scheme!r}")
+    dtype = _field_dtype(dtype)
+    if adaptive and scheme == "explicit":
+        raise ValueError("Adaptive time stepping requires an implicit scheme")
+
+    widths = _cell_widths(r_centres, dr, "dr")
     alpha = k / rho_cp
-    dt_lim = 0.5 * dr**2 / alpha
-    if dt > dt_lim and not allow_unstable:
+    dt_lim = 0.5 * np.min(widths) ** 2 / alpha
+    if scheme == "explicit" and dt > dt_lim and not allow_unstable:
         raise ValueError(
             f"Time step {dt:.6f} exceeds stability limit of {dt_lim:.6f} seconds"
         )
 
+    q_profile = _source_profile(heat_source, r_centres)
+    batch = _batch_shape(np.shape(q_flux), q_profile.shape[:-1])
+    source = np.broadcast_to(
+        (q_profile / rho_cp).astype(dtype), batch + r_centres.shape
+    )
+    if batch and events:
+        raise ValueError("Events are not supported for batched runs")
+
+    probe_idx = probe_cells((r_centres,), probes)
+    monitor = EventMonitor(events, probe_idx, T0) if events else None
+    probe_idx = _batch_probes(probe_idx, batch, len(r_centres))
+
+    r_faces = _faces(r_centres, widths)  # length n_r + 1
+    coef_w, coef_e = (
+        c.astype(dtype) for c in _radial_coefficients(r_centres, r_faces, widths, alpha)
+    )
+    ghost_step = np.asarray(widths[0] * np.asarray(q_flux, dtype=float) / k, dtype)
+
+    def make_stepper(h: float) -> Stepper:
+        if scheme == "explicit":
+            return _RadialExplicit(coef_w, coef_e, ghost_step, source, h)
+        return _RadialTheta(coef_w, coef_e, ghost_step, source, h, _THETA[scheme])
+
+    inputs = {
+        "r_centres": r_centres,
+        "dr": widths,
+        "q_flux": np.asarray(q_flux, dtype=float),
+        "k": k,
+        "rho_cp": rho_cp,
+        "t_max": t_max,
+        "dt": dt,
+        "source": q_profile,
+        "T0": T0,
+        "max_steps": max_steps,
+        "scheme": scheme,
+        "save_every": save_every,
+        "save_times": _optional_array(save_times),
+        "probes": probe_idx,
+        "adaptive": (rtol, atol, dt_max) if adaptive else None,
+        "events": list(events or []),
+        "power": power,
+        "dtype": dtype.str,
+    }
+    entry = _cache_entry(cache, store, "radial", inputs)
+    # Heat input per metre of pad height at a power multiplier of 1 [W/m].
+    heat_rate = (
+        2.0
+        * np.pi
+        * (r_faces[0] * np.asarray(q_flux) + np.sum(q_profile * r_centres * widths, -1))
+    )
+    ckpt = _checkpointer(
+        checkpoint,
+        checkpoint_interval,
+        "radial",
+        inputs,
+        adaptive=adaptive,
+        heat_rate=heat_rate,
+        power=power,
+    )
+    hit = _cache_hit(entry, progress_cb)
+    if hit is not None:
+        return hit
+
+    # Steppers march the rise above T0 (see laserpad.marching).
+    initial = np.zeros(batch + r_centres.shape, dtype=dtype)
+    writer = None
+    if store is not None:
+        writer = FrameWriter(
+            store,
+            initial.shape,
+            dtype=dtype,
+            metadata={
+                "model": "radial",
+                "r_centres": r_centres,
+                "dr": widths,
+                "k": k,
+                "rho_cp": rho_cp,
+                "q_flux": q_flux,
+                "T0": T0,
+                "dt": dt,
+                "scheme": scheme,
+                "power": _waveform_metadata(power),
+            },
+            keep=_kept_frames(ckpt),
+        )
+    if adaptive:
+        t_end = t_max if max_steps is None else min(t_max, max_steps * dt)
+        return _remember(
+            entry,
+            march_adaptive(
+                make_stepper,
+                _ORDER[scheme],
+                initial,
+                t_end,
+                dt,
+                rtol,
+                atol,
+                probe_idx,
+                progress_cb,
+                writer,
+                save_every=save_every,
+                save_times=save_times,
+                dt_max=dt_max,
+                events=monitor,
+                power=power,
+                cancel=cancel,
+                offset=T0,
+            ),
+        )
+
     times = np.arange(0.0, t_max + dt, dt)
     if max_steps is not None:
         times = times[: max_steps + 1]
-    n_t = len(times)
-    steps = n_t - 1
-    n_r = len(r_centres)
-    T = np.zeros((n_t, n_r), dtype=float)
-    T[0, :] = T0
+    save_steps = output_steps(times, save_every, save_times)
+    return _remember(
+        entry,
+        march(
+            make_stepper(dt),
+            initial,
+            times,
+            save_steps,
+            probe_idx,
+            progress_cb,
+            writer,
+            monitor,
+            power,
+            cancel,
+            ckpt,
+            T0,
+        ),
+    )
 
-    if heat_source is None:
-        q_profile = np.zeros_like(r_centres)
+
+class _StackOperator:
+    """Finite-volume conduction operator of an r-z stack.
+
+    All quantities are per radian of the axisymmetric stack. Interior faces
+    use the harmonic mean of the neighbouring conductivities so heat flow
+    across the copper/FR4 interface is continuous. ``g_r`` (``(n_z, n_r-1)``)
+    and ``g_z`` (``(n_z-1, n_r)``) are the interior face conductances,
+    ``g_out`` (``(n_z,)``) couples the outermost cells to ``T_inf`` and
+    ``power_in`` holds the constant heat input of every cell.
+
+    For batched runs ``source`` is ``(n_cases, n_r)``, ``q_flux`` and
+    ``h_out`` may be ``(n_cases,)`` arrays, ``power_in`` gains a leading case
+    axis and so does ``g_out`` when ``h_out`` varies; the fields passed in are
+    ``(n_cases, n_z, n_r)``. The arrays are computed in double precision and
+    stored as ``dtype``, the precision of the fields. ``dr`` (``(n_r,)``) and
+    ``dz`` (``(n_z,)``) hold the cell widths, which may vary.
+    """
+
+    def __init__(
+        self,
+        r_centres: NDArray[np.float_],
+        dr: NDArray[np.float_],
+        dz: NDArray[np.float_],
+        k: NDArray[np.float_],
+        rho_cp: NDArray[np.float_],
+        h_out: float | NDArray[np.float_],
+        T_inf: float,
+        q_flux: float | NDArray[np.float_],
+        source: NDArray[np.float_],
+        dtype: DTypeLike = float,
+    ) -> None:
+        n_z, n_r = k.shape
+        batch = source.shape[:-1]
+        r_faces = _faces(r_centres, dr)
+        dz_col = dz[:, None]
+        g_r = (
+            _harmonic_mean(k[:, :-1], k[:, 1:], dr[:-1], dr[1:])
+            * r_faces[1:-1]
+            * dz_col
+            / _gaps(dr)
+        )
+        g_z = (
+            _harmonic_mean(k[:-1], k[1:], dz_col[:-1], dz_col[1:])
+            * r_centres
+            * dr
+            / _gaps(dz_col)
+        )
+        g_out = np.multiply.outer(h_out, r_faces[-1] * dz)
+        capacity = rho_cp * r_centres * dr * dz_col
+        power_in = capacity * source[..., None, :]
+        power_in[..., 0] += np.multiply.outer(q_flux, r_faces[0] * dz)
+        self.dtype = np.dtype(dtype)
+        self.g_r = g_r.astype(self.dtype)
+        self.g_z = g_z.astype(self.dtype)
+        self.g_out = g_out.astype(self.dtype)
+        self.capacity = capacity.astype(self.dtype)
+        self.power_in = power_in.astype(self.dtype)
+        self.T_inf = T_inf
+
+        self._flux_r = np.empty(batch + (n_z, n_r - 1), self.dtype)
+        self._flux_z = np.empty(batch + (n_z - 1, n_r), self.dtype)
+        self._flux_out = np.empty(batch + (n_z,), self.dtype)
+
+    def add_radial(self, T: NDArray[np.float_], net: NDArray[np.float_]) -> None:
+        """Add radial conduction and the outer heat sink to ``net`` [W/rad]."""
+        flux_r, flux_out = self._flux_r, self._flux_out
+        np.subtract(T[..., 1:], T[..., :-1], out=flux_r)
+        flux_r *= self.g_r
+        net[..., :-1] += flux_r
+        net[..., 1:] -= flux_r
+        np.subtract(T[..., -1], self.T_inf, out=flux_out)
+        flux_out *= self.g_out
+        net[..., -1] -= flux_out
+
+    def add_axial(self, T: NDArray[np.float_], net: NDArray[np.float_]) -> None:
+        """Add axial conduction to ``net`` [W/rad]."""
+        flux_z = self._flux_z
+        np.subtract(T[..., 1:, :], T[..., :-1, :], out=flux_z)
+        flux_z *= self.g_z
+        net[..., :-1, :] += flux_z
+        net[..., 1:, :] -= flux_z
+
+    def radial_matrix(
+        self, scale: NDArray[np.float_], shift: float = 1.0
+    ) -> tuple[NDArray[np.float_], NDArray[np.float_], NDArray[np.float_]]:
+        """Return ``shift*I - scale*R`` as tridiagonals along r, each ``(n_z, n_r)``.
+
+        The arrays gain a leading case axis when ``g_out`` varies per case.
+        """
+        west = np.zeros_like(self.capacity)
+        east = np.zeros_like(self.capacity)
+        west[:, 1:] = self.g_r
+        east[:, :-1] = self.g_r
+        shape = self.g_out.shape + west.shape[-1:]
+        diag = np.broadcast_to(shift + scale * (west + east), shape).copy()
+        diag[..., -1] += scale[:, -1] * self.g_out
+        lower = np.broadcast_to(-scale * west, shape)
+        upper = np.broadcast_to(-scale * east, shape)
+        return lower, diag, upper
+
+    def axial_matrix(
+        self, scale: NDArray[np.float_], shift: float = 1.0
+    ) -> tuple[NDArray[np.float_], NDArray[np.float_], NDArray[np.float_]]:
+        """Return ``shift*I - scale*Z`` as tridiagonals along z, each ``(n_z, n_r)``."""
+        south = np.zeros_like(self.capacity)
+        north = np.zeros_like(self.capacity)
+        south[1:] = self.g_z
+        north[:-1] = self.g_z
+        return -scale * south, shift + scale * (south + north), -scale * north
+
+
+class _StackExplicit:
+    """Forward-Euler step of the r-z stack."""
+
+    def __init__(self, op: _StackOperator, dt: float) -> None:
+        self.op = op
+        self.power_scale = 1.0
+        self._dt_over_c = dt / op.capacity
+        self._net = np.empty_like(op.power_in)
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None:
+        net = self._net
+        np.multiply(self.op.power_in, self.power_scale, out=net)
+        self.op.add_radial(old, net)
+        self.op.add_axial(old, net)
+        net *= self._dt_over_c
+        np.add(old, net, out=new)
+
+
+class _StackADI:
+    """Peaceman-Rachford ADI step of the r-z stack.
+
+    The first half step is implicit along r (including the trace-sink Robin
+    condition) and explicit along z; the second half step swaps the roles.
+    Both line systems are factored once, so a step costs O(n_r*n_z)
+    independent of ``dt``.
+    """
+
+    def __init__(self, op: _StackOperator, dt: float) -> None:
+        self.op = op
+        scale = 0.5 * dt / op.capacity
+        self._scale = scale
+        lower, diag, upper = op.radial_matrix(scale)
+        self._solve_r = TridiagonalSolver(
+            np.moveaxis(lower, -1, 0),
+            np.moveaxis(diag, -1, 0),
+            np.moveaxis(upper, -1, 0),
+            dtype=op.dtype,
+        )
+        self._solve_z = TridiagonalSolver(*op.axial_matrix(scale), dtype=op.dtype)
+        # Ambient side of the Robin sink, treated implicitly in the radial
+        # half step.
+        self._ambient = op.g_out * op.T_inf
+        self.power_scale = 1.0
+        self._rhs = np.empty_like(op.power_in)
+        self._half = np.empty_like(op.power_in)
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None:
+        rhs, half = self._rhs, self._half
+
+        np.multiply(self.op.power_in, self.power_scale, out=rhs)
+        rhs[..., -1] += self._ambient
+        self.op.add_axial(old, rhs)
+        rhs *= self._scale
+        rhs += old
+        self._solve_r.solve(rhs, axis=-1, out=half)
+
+        np.multiply(self.op.power_in, self.power_scale, out=rhs)
+        self.op.add_radial(half, rhs)
+        rhs *= self._scale
+        rhs += half
+        self._solve_z.solve(rhs, axis=-2, out=new)
+
+
+class _RefreshingStepper:
+    """Rebuild a stepper from the current field every ``every`` steps.
+
+    Used for temperature-dependent properties: ``build(T)`` evaluates the
+    properties at ``T`` and returns a stepper with them frozen.
+    """
+
+    def __init__(
+        self, build: Callable[[NDArray[np.float_]], Stepper], every: int
+    ) -> None:
+        self.build = build
+        self.every = every
+        self.power_scale = 1.0
+        self._steps = 0
+        self._stepper: Stepper | None = None
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None:
+        if self._stepper is None or self._steps % self.every == 0:
+            self._stepper = self.build(old)
+        self._steps += 1
+        self._stepper.power_scale = self.power_scale
+        self._stepper.step(old, new)
+
+
+_FACTOR_CACHE: OrderedDict[str, BlockTridiagonalSolver] = OrderedDict()
+_FACTOR_CACHE_SIZE = 4
+
+
+def _factor_stack(
+    lower_r: NDArray[np.float_],
+    diag: NDArray[np.float_],
+    upper_r: NDArray[np.float_],
+    lower_z: NDArray[np.float_],
+    upper_z: NDArray[np.float_],
+    by_rows: bool,
+    dtype: np.dtype[np.floating],
+) -> BlockTridiagonalSolver:
+    """Return the (cached) block-tridiagonal factorization of ``shift*I - scale*L``.
+
+    Lines run along r when ``by_rows``, otherwise along z. The factors are
+    computed in double precision and stored as ``dtype``.
+    """
+    if not by_rows:
+        lower_r, upper_r, lower_z, upper_z = (
+            lower_z.T,
+            upper_z.T,
+            lower_r.T,
+            upper_r.T,
+        )
+        diag = diag.T
+
+    key = hashlib.sha1(
+        b"".join(
+            np.ascontiguousarray(a).tobytes()
+            for a in (lower_r, diag, upper_r, lower_z, upper_z)
+        )
+        + dtype.str.encode()
+    ).hexdigest()
+    solver = _FACTOR_CACHE.get(key)
+    if solver is None:
+        m, b = diag.shape
+        idx = np.arange(b)
+        blocks = np.zeros((m, b, b))
+        blocks[:, idx, idx] = diag
+        blocks[:, idx[1:], idx[:-1]] = lower_r[:, 1:]
+        blocks[:, idx[:-1], idx[1:]] = upper_r[:, :-1]
+        solver = BlockTridiagonalSolver(lower_z, blocks, upper_z, dtype=dtype)
+        _FACTOR_CACHE[key] = solver
+        if len(_FACTOR_CACHE) > _FACTOR_CACHE_SIZE:
+            _FACTOR_CACHE.popitem(last=False)
     else:
-        q_profile = heat_source(r_centres)
-    source = q_profile / rho_cp
-
-    r_faces = np.concatenate(
-        [r_centres[:1] - 0.5 * dr, r_centres + 0.5 * dr]
-    )  # length n_r + 1
-
-    for n in range(steps):
-        old = T[n]
-        new = T[n + 1]
-
-        ghost_left = old[0] + dr * q_flux / k
-        ghost_right = old[-1]
-
-        T_ext = np.empty(n_r + 2)
-        T_ext[0] = ghost_left
-        T_ext[1:-1] = old
-        T_ext[-1] = ghost_right
-
-        for i in range(n_r):
-            r_imh = r_faces[i]
-            r_iph = r_faces[i + 1]
-            new[i] = old[i] + dt * (
-                (alpha / (r_centres[i] * dr**2))
-                * (r_iph * (T_ext[i + 2] - old[i]) - r_imh * (old[i] - T_ext[i]))
-                + source[i]
-            )
-        if progress_cb is not None:
-            progress_cb(n + 1, steps)
+        _FACTOR_CACHE.move_to_end(key)
+    return solver
 
-    return times, T
+
+def _stack_solvers(
+    op: _StackOperator, scale: NDArray[np.float_], shift: float
+) -> tuple[list[BlockTridiagonalSolver], bool]:
+    """Factor ``shift*I - scale*L`` of ``op`` line by line.
+
+    Lines run along the shorter mesh direction; the returned flag is
+    ``True`` when they run along r. There is one (cached) factorization, or
+    one per case when the batched trace sinks differ.
+    """
+    lower_r, diag_r, upper_r = op.radial_matrix(scale, shift)
+    lower_z, diag_z, upper_z = op.axial_matrix(scale, shift)
+    diag = diag_r + diag_z - shift
+
+    by_rows = op.capacity.shape[1] <= op.capacity.shape[0]
+    if diag.ndim == 2:
+        cases = [(lower_r, diag, upper_r)]
+    else:
+        cases = list(zip(lower_r, diag, upper_r))
+    solvers = [
+        _factor_stack(lr, d, ur, lower_z, upper_z, by_rows, op.dtype)
+        for lr, d, ur in cases
+    ]
+    return solvers, by_rows
+
+
+def _solve_stack(
+    solvers: list[BlockTridiagonalSolver],
+    by_rows: bool,
+    rhs: NDArray[np.float_],
+    out: NDArray[np.float_],
+) -> None:
+    """Solve the systems factored by :func:`_stack_solvers` for ``rhs``."""
+    if len(solvers) > 1:
+        for solver, rhs_case, out_case in zip(solvers, rhs, out):
+            _solve_stack([solver], by_rows, rhs_case, out_case)
+    elif by_rows:
+        solvers[0].solve(rhs, out=out)
+    else:
+        solvers[0].solve(np.swapaxes(rhs, -1, -2), out=np.swapaxes(out, -1, -2))
+
+
+class _StackImplicit:
+    """Backward-Euler step of the r-z stack with a factor-once direct solve.
+
+    The 5-point operator ``I - dt*L`` is ordered line by line along the
+    shorter mesh direction and factored as a block-tridiagonal matrix. The
+    factorization is cached per operator and ``dt``, so repeated runs on the
+    same mesh (and every step of a run) only do the triangular sweeps.
+    Batched cases share one factorization unless their trace sinks differ.
+    """
+
+    def __init__(self, op: _StackOperator, dt: float) -> None:
+        self.op = op
+        scale = dt / op.capacity
+        self._solvers, self._by_rows = _stack_solvers(op, scale, 1.0)
+
+        self.power_scale = 1.0
+        self._heat = scale * op.power_in
+        self._ambient = scale[:, -1] * op.g_out * op.T_inf
+        self._rhs = np.empty_like(op.power_in)
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None:
+        rhs = self._rhs
+        np.multiply(self._heat, self.power_scale, out=rhs)
+        rhs += old
+        rhs[..., -1] += self._ambient
+        _solve_stack(self._solvers, self._by_rows, rhs, new)
 
 
 def solve_transient_2d(
     r_centres: NDArray[np.float_],
-    dr: float,
+    dr: float | ArrayLike,
     z_centres: NDArray[np.float_],
-    dz: float,
-    mat_idx: NDArray[np.str_],
-    q_flux: float,
+    dz: float | ArrayLike,
+    mat_idx: NDArray[np.uint8],
+    q_flux: float | ArrayLike,
     n_t: int,
     dt: float,
-    heat_source: Callable[[NDArray[np.float_]], NDArray[np.float_]] | None = None,
+    heat_source: HeatSource | Sequence[HeatSource] | None = None,
     T0: float = 25.0,
-    trace_mask: NDArray[np.bool_] | None = None,
-    h_trace: float = 1e3,
+    trace_mask: NDArray[np.bool_] | TraceCoverage | None = None,
+    h_trace: float | ArrayLike = 1e3,
     T_inf: float = 25.0,
     *,
     max_steps: int | None = None,
     allow_unstable: bool = False,
+    scheme: str = "explicit",
+    save_every: int | None = None,
+    save_times: ArrayLike | None = None,
+    probes: ProbeSpec | None = None,
+    store: str | os.PathLike[str] | None = None,
+    adaptive: bool = False,
+    rtol: float = 1e-3,
+    atol: float = 1e-2,
+    dt_max: float | None = None,
+    events: Sequence[Event] | None = None,
+    materials: MaterialTable | None = None,
+    refresh_every: int = 1,
+    power: Waveform | None = None,
+    dtype: DTypeLike = np.float64,
+    cache: ResultCache | bool | None = None,
+    cancel: CancelToken | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    checkpoint_interval: float = 600.0,
     progress_cb: ProgressCallback | None = None,
-) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
-    """Explicit 2-D transient solver in r-z cylindrical coordinates.
+) -> TransientResult:
+    """2-D transient solver in r-z cylindrical coordinates.
+
+    Face conductances are assembled once (harmonic-mean conductivity across
+    material interfaces) and each step is a whole-array finite-volume update.
 
     Parameters
     ----------
+    r_centres, dr, z_centres, dz:
+        Cell centres and widths [m] as returned by
+        :func:`~laserpad.geometry.build_stack_mesh`; ``dr`` and ``dz`` are
+        uniform spacings or arrays of per-cell widths (graded or
+        layer-aligned meshes).
+    mat_idx:
+        ``uint8`` material-id grid of shape ``(n_z, n_r)`` as returned by
+        :func:`~laserpad.geometry.build_stack_mesh` (a grid of material names
+        is converted).
+    q_flux, heat_source:
+        Heat flux at the inner radius [W/m²] and optional surface heat-flux
+        profile ``q''(r)`` as for :func:`solve_transient`.
     trace_mask:
         Boolean array of shape ``(n_theta, n_r)`` describing which angular cells
-        are connected to copper traces at the outer radius.
+        are connected to copper traces at the outer radius, or the equivalent
+        compact :class:`~laserpad.geometry.TraceCoverage`. Only the covered
+        fraction of the rim enters the model.
     h_trace:
         Heat-transfer coefficient for trace-connected sectors [W/m²·K].
+
+        Batched runs: ``q_flux`` and ``h_trace`` may be arrays of cases and
+        ``heat_source`` a sequence of callables or a callable returning
+        ``(n_cases, n_r)`` profiles; the cases share the mesh and advance
+        together in one state of shape ``(n_cases, n_z, n_r)``.
     T_inf:
         Ambient temperature used for trace heat-sink boundary conditions.
     max_steps:
         Optional limit on the number of time steps.
     allow_unstable:
         If ``True`` run even when ``dt`` violates the stability limit.
+    scheme:
+        ``"explicit"`` (forward Euler, subject to the stability limit),
+        ``"adi"`` (Peaceman-Rachford alternating-direction implicit, with
+        line-implicit sweeps in r then z) or ``"implicit"`` (backward Euler
+        with a direct solve factored once and cached per mesh and ``dt``).
+        The implicit schemes have no stability limit on ``dt``.
+    save_every, save_times:
+        Output schedule: keep every ``save_every``-th field (plus the first
+        and last) or the fields closest to ``save_times``. By default every
+        step is kept.
+    probes:
+        Named ``(r, z)`` positions [m] whose temperature is recorded at every
+        step in ``result.probes``, e.g. ``{"pad": (r_inner, 0.0)}``.
+    store:
+        Optional directory; saved fields are streamed into a chunked on-disk
+        :class:`~laserpad.store.FrameStore` (with the mesh, materials and
+        time step in its metadata) instead of being held in memory.
+    adaptive:
+        If ``True`` (``"adi"`` or ``"implicit"`` only) march to ``n_t*dt``
+        choosing the step size by step-doubling error control, starting from
+        ``dt``: a step is accepted when its estimated local error is below
+        ``atol + rtol*|T|`` [K] in every cell, and steps never exceed
+        ``dt_max``. ``times`` are then non-uniform and ``save_every`` counts
+        accepted steps, while ``save_times`` are hit exactly.
+    events:
+        Optional :class:`~laserpad.events.Event` objects, e.g.
+        ``ProbeThreshold("pad", 217.0)`` or ``SteadyState(0.01)``; the run
+        stops after the first step on which one fires, the final field is
+        saved and ``result.event`` records the interpolated crossing time.
+    materials:
+        Material table the ids refer to; defaults to the cached table of
+        ``materials.yaml``.
+    refresh_every:
+        With temperature-dependent materials, re-evaluate ``k(T)`` and
+        ``rho*cp(T)`` from the current field (and rebuild the scheme) every
+        ``refresh_every`` steps; properties are frozen in between.
+    power, dtype, cache, cancel, checkpoint, checkpoint_interval:
+        Optional :class:`~laserpad.waveforms.Waveform` scaling the heat input
+        over time, field precision, result cache, cancellation token and
+        periodic checkpoints, as for :func:`solve_transient`. With temperature-dependent materials
+        checkpoints are taken on property refreshes.
+
+    Returns
+    -------
+    TransientResult
+        Unpacks as ``(times, T)`` with ``T`` of shape ``(n_saved, n_z, n_r)``
+        (``(n_saved, n_cases, n_z, n_r)`` for batched runs), or a lazy
+        :class:`~laserpad.store.FrameStore` when ``store`` is given.
+    """
+
+    if scheme not in ("explicit", "adi", "implicit"):
+        raise ValueError(f"Unknown scheme {scheme!r}")
+    dtype = _field_dtype(dtype)
+    if adaptive and scheme == "explicit":
+        raise ValueError("Adaptive time stepping requires an implicit scheme")
+
+    table = materials or material_table()
+    mat_ids = material_ids(mat_idx, table)
+    n_z, n_r = mat_ids.shape
+    lookup = PropertyLookup(table) if table.temperature_dependent else None
+    if lookup is None:
+        k = table.k[mat_ids]
+        rho_cp = table.rho_cp[mat_ids]
+        alpha = k / rho_cp
+    else:
+        if adaptive:
+            raise ValueError(
+                "Adaptive time stepping needs temperature-independent materials"
+            )
+        if refresh_every < 1:
+            raise ValueError("refresh_every must be a positive integer")
+        k, rho_cp = lookup.evaluate(mat_ids, np.full((n_z, n_r), float(T0)))
+        alpha = lookup.k_range[1][mat_ids] / lookup.rho_cp_range[0][mat_ids]
+
+    widths_r = _cell_widths(r_centres, dr, "dr")
+    widths_z = _cell_widths(z_centres, dz, "dz")
+    dt_lim = 0.55 * min(np.min(widths_r), np.min(widths_z)) ** 2 / np.max(alpha)
+    if scheme == "explicit" and dt > dt_lim and not allow_unstable:
+        raise ValueError(
+            f"Time step {dt:.6f} exceeds stability limit of {dt_lim:.6f} seconds"
+        )
+
+    h_eff = _trace_fraction(trace_mask) * np.asarray(h_trace, dtype=float)
+
+    q_profile = _source_profile(heat_source, r_centres)
+    batch = _batch_shape(np.shape(q_flux), q_profile.shape[:-1], h_eff.shape)
+    if batch and events:
+        raise ValueError("Events are not supported for batched runs")
+    if batch and lookup is not None:
+        raise ValueError("Batched runs need temperature-independent materials")
+
+    probe_idx = probe_cells((z_centres, r_centres), probes)
+    monitor = EventMonitor(events, probe_idx, T0) if events else None
+    probe_idx = _batch_probes(probe_idx, batch, n_z * n_r)
+
+    def operator(k: NDArray[np.float_], rho_cp: NDArray[np.float_]) -> _StackOperator:
+        source_r = q_profile / rho_cp[0, :]
+        return _StackOperator(
+            r_centres,
+            widths_r,
+            widths_z,
+            k,
+            rho_cp,
+            h_eff,
+            T_inf - T0,
+            np.asarray(q_flux, dtype=float),
+            np.broadcast_to(source_r, batch + r_centres.shape),
+            dtype,
+        )
+
+    def stepper_for(op: _StackOperator, h: float) -> Stepper:
+        if scheme == "explicit":
+            return _StackExplicit(op, h)
+        if scheme == "adi":
+            return _StackADI(op, h)
+        return _StackImplicit(op, h)
+
+    op = operator(k, rho_cp)
+
+    def make_stepper(h: float) -> Stepper:
+        return stepper_for(op, h)
+
+    def properties_at(T: NDArray[np.float_]) -> Stepper:
+        assert lookup is not None
+        return stepper_for(operator(*lookup.evaluate(mat_ids, T + T0)), dt)
+
+    inputs = {
+        "r_centres": r_centres,
+        "dr": widths_r,
+        "z_centres": z_centres,
+        "dz": widths_z,
+        "mat_idx": mat_ids,
+        "materials": table,
+        "q_flux": np.asarray(q_flux, dtype=float),
+        "source": q_profile,
+        "T0": T0,
+        "h_eff": h_eff,
+        "T_inf": T_inf,
+        "n_t": n_t,
+        "dt": dt,
+        "max_steps": max_steps,
+        "scheme": scheme,
+        "save_every": save_every,
+        "save_times": _optional_array(save_times),
+        "probes": probe_idx,
+        "adaptive": (rtol, atol, dt_max) if adaptive else None,
+        "events": list(events or []),
+        "refresh_every": refresh_every if lookup is not None else None,
+        "power": power,
+        "dtype": dtype.str,
+    }
+    entry = _cache_entry(cache, store, "stack", inputs)
+    ckpt = _checkpointer(
+        checkpoint,
+        checkpoint_interval,
+        "stack",
+        inputs,
+        adaptive=adaptive,
+        heat_rate=2.0 * np.pi * np.sum(op.power_in, axis=(-2, -1), dtype=float),
+        power=power,
+        stride=refresh_every if lookup is not None else 1,
+    )
+    hit = _cache_hit(entry, progress_cb)
+    if hit is not None:
+        return hit
+
+    initial = np.zeros(batch + (n_z, n_r), dtype=dtype)
+    writer = None
+    if store is not None:
+        writer = FrameWriter(
+            store,
+            initial.shape,
+            dtype=dtype,
+            metadata={
+                "model": "stack",
+                "r_centres": r_centres,
+                "dr": widths_r,
+                "z_centres": z_centres,
+                "dz": widths_z,
+                "mat_idx": mat_ids,
+                "materials": table.as_dict(),
+                "q_flux": q_flux,
+                "T0": T0,
+                "h_trace": h_eff,
+                "T_inf": T_inf,
+                "dt": dt,
+                "scheme": scheme,
+                "power": _waveform_metadata(power),
+            },
+            keep=_kept_frames(ckpt),
+        )
+    if adaptive:
+        t_end = n_t * dt if max_steps is None else min(n_t, max_steps) * dt
+        return _remember(
+            entry,
+            march_adaptive(
+                make_stepper,
+                _ORDER[scheme],
+                initial,
+                t_end,
+                dt,
+                rtol,
+                atol,
+                probe_idx,
+                progress_cb,
+                writer,
+                save_every=save_every,
+                save_times=save_times,
+                dt_max=dt_max,
+                events=monitor,
+                power=power,
+                cancel=cancel,
+                offset=T0,
+            ),
+        )
+
+    times = np.arange(0.0, (n_t + 1) * dt, dt)
+    if max_steps is not None:
+        times = times[: max_steps + 1]
+    save_steps = output_steps(times, save_every, save_times)
+    stepper = (
+        make_stepper(dt)
+        if lookup is None
+        else _RefreshingStepper(properties_at, refresh_every)
+    )
+    return _remember(
+        entry,
+        march(
+            stepper,
+            initial,
+            times,
+            save_steps,
+            probe_idx,
+            progress_cb,
+            writer,
+            monitor,
+            power,
+            cancel,
+            ckpt,
+            T0,
+        ),
+    )
+
+
+class _SectorOperator:
+    """Finite-volume conduction operator of an r-theta-z sector.
+
+    Fields have shape ``(n_s, n_z, n_r)`` over the ``n_s`` simulated angular
+    cells of width ``dtheta`` [rad]. Quantities are per cell; ``g_t``
+    (``(n_z, n_r)``) couples angular neighbours, which wrap around for a
+    ``periodic`` sector and are adiabatic at the ends otherwise, and
+    ``g_out`` (``(n_s, n_z)``) holds the trace sink of every rim cell.
+    Arrays are stored as ``dtype``, the precision of the fields.
     """
 
-    from .geometry import load_materials
+    def __init__(
+        self,
+        r_centres: NDArray[np.float_],
+        dr: NDArray[np.float_],
+        dz: NDArray[np.float_],
+        dtheta: float,
+        k: NDArray[np.float_],
+        rho_cp: NDArray[np.float_],
+        h_out: NDArray[np.float_],
+        T_inf: float,
+        q_flux: float,
+        source: NDArray[np.float_],
+        periodic: bool,
+        dtype: DTypeLike = float,
+    ) -> None:
+        n_z, n_r = k.shape
+        n_s = len(h_out)
+        r_faces = _faces(r_centres, dr)
+        dz_col = dz[:, None]
+        self.g_r = (
+            _harmonic_mean(k[:, :-1], k[:, 1:], dr[:-1], dr[1:])
+            * r_faces[1:-1]
+            * dtheta
+            * dz_col
+            / _gaps(dr)
+        )
+        self.g_z = (
+            _harmonic_mean(k[:-1], k[1:], dz_col[:-1], dz_col[1:])
+            * r_centres
+            * dtheta
+            * dr
+            / _gaps(dz_col)
+        )
+        self.g_t = k * dr * dz_col / (r_centres * dtheta)
+        self.g_out = np.multiply.outer(h_out, r_faces[-1] * dtheta * dz)
+        self.capacity = rho_cp * r_centres * dtheta * dr * dz_col
+        self.power_in = np.broadcast_to(self.capacity * source, (n_s, n_z, n_r)).copy()
+        self.power_in[..., 0] += q_flux * r_faces[0] * dtheta * dz
+        self.T_inf = T_inf
+        self.periodic = periodic
+        self.dtype = np.dtype(dtype)
+        for name in ("g_r", "g_z", "g_t", "g_out", "capacity", "power_in"):
+            setattr(self, name, getattr(self, name).astype(self.dtype))
+
+        self._flux_r = np.empty((n_s, n_z, n_r - 1), self.dtype)
+        self._flux_z = np.empty((n_s, n_z - 1, n_r), self.dtype)
+        self._flux_t = np.empty((n_s, n_z, n_r), self.dtype)
+        self._flux_out = np.empty((n_s, n_z), self.dtype)
 
-    materials = load_materials()
+    def conductance_sum(self) -> NDArray[np.float_]:
+        """Return an upper bound of the total conductance of every cell."""
+        total = np.zeros_like(self.capacity) + 2.0 * self.g_t
+        total[:, :-1] += self.g_r
+        total[:, 1:] += self.g_r
+        total[:-1] += self.g_z
+        total[1:] += self.g_z
+        total[:, -1] += np.max(self.g_out, axis=0)
+        return total
 
-    n_z, n_r = mat_idx.shape
+    def add_fluxes(self, T: NDArray[np.float_], net: NDArray[np.float_]) -> None:
+        """Add conduction in r, z and theta plus the trace sink to ``net``."""
+        flux_r, flux_z, flux_t = self._flux_r, self._flux_z, self._flux_t
+        np.subtract(T[..., 1:], T[..., :-1], out=flux_r)
+        flux_r *= self.g_r
+        net[..., :-1] += flux_r
+        net[..., 1:] -= flux_r
 
-    k = np.zeros((n_z, n_r), dtype=float)
-    rho_cp = np.zeros((n_z, n_r), dtype=float)
+        np.subtract(T[:, 1:], T[:, :-1], out=flux_z)
+        flux_z *= self.g_z
+        net[:, :-1] += flux_z
+        net[:, 1:] -= flux_z
 
-    for name, props in materials.items():
-        mask = mat_idx == name
-        k[mask] = props["k"]
-        rho_cp[mask] = props["rho"] * props["cp"]
+        # flux_t[s] flows from cell s+1 into cell s.
+        np.subtract(T[1:], T[:-1], out=flux_t[:-1])
+        if self.periodic:
+            np.subtract(T[0], T[-1], out=flux_t[-1])
+        else:
+            flux_t[-1] = 0.0
+        flux_t *= self.g_t
+        net += flux_t
+        net[1:] -= flux_t[:-1]
+        net[0] -= flux_t[-1]
 
-    alpha = k / rho_cp
-    dt_lim = 0.55 * min(dr**2, dz**2) / np.max(alpha)
+        flux_out = self._flux_out
+        np.subtract(T[..., -1], self.T_inf, out=flux_out)
+        flux_out *= self.g_out
+        net[..., -1] -= flux_out
+
+
+class _SectorExplicit:
+    """Forward-Euler step of the r-theta-z sector."""
+
+    def __init__(self, op: _SectorOperator, dt: float) -> None:
+        self.op = op
+        self.power_scale = 1.0
+        self._dt_over_c = dt / op.capacity
+        self._net = np.empty_like(op.power_in)
+
+    def step(self, old: NDArray[np.float_], new: NDArray[np.float_]) -> None:
+        net = self._net
+        np.multiply(self.op.power_in, self.power_scale, out=net)
+        self.op.add_fluxes(old, net)
+        net *= self._dt_over_c
+        np.add(old, net, out=new)
+
+
+def solve_transient_3d(
+    r_centres: NDArray[np.float_],
+    dr: float | ArrayLike,
+    z_centres: NDArray[np.float_],
+    dz: float | ArrayLike,
+    mat_idx: NDArray[np.uint8],
+    q_flux: float,
+    n_t: int,
+    dt: float,
+    heat_source: HeatSource | None = None,
+    T0: float = 25.0,
+    trace_mask: NDArray[np.bool_] | TraceCoverage | None = None,
+    h_trace: float = 1e3,
+    T_inf: float = 25.0,
+    *,
+    n_theta: int = 360,
+    symmetry: bool = True,
+    max_steps: int | None = None,
+    allow_unstable: bool = False,
+    save_every: int | None = None,
+    save_times: ArrayLike | None = None,
+    probes: ProbeSpec | None = None,
+    store: str | os.PathLike[str] | None = None,
+    events: Sequence[Event] | None = None,
+    materials: MaterialTable | None = None,
+    power: Waveform | None = None,
+    dtype: DTypeLike = np.float64,
+    cache: ResultCache | bool | None = None,
+    cancel: CancelToken | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    checkpoint_interval: float = 600.0,
+    progress_cb: ProgressCallback | None = None,
+) -> TransientResult:
+    """3-D transient solver in r-theta-z cylindrical coordinates.
+
+    Unlike :func:`solve_transient_2d`, which smears the trace sink around
+    the rim, every angular cell keeps its own trace coverage, so sectors
+    between traces heat up on their own. The stack is explicit (forward
+    Euler) and fully vectorized; with ``symmetry`` only the unique sector of
+    the trace layout is simulated (e.g. a quarter of the circle for the two
+    opposite traces of ``sample_traces.json``).
+
+    Parameters
+    ----------
+    trace_mask:
+        ``(n_theta, n_r)`` boolean mask from
+        :func:`~laserpad.geometry.build_stack_mesh_with_traces` (its outer
+        column is used), or a :class:`~laserpad.geometry.TraceCoverage`
+        resolved on ``n_theta`` cells, which allows partially covered cells.
+    n_theta:
+        Number of angular cells around the full circle when ``trace_mask``
+        is a coverage or ``None``.
+    symmetry:
+        If ``True`` detect rotational and mirror symmetry of the trace layout
+        and simulate only the unique sector.
+    probes:
+        Named ``(r, z, theta)`` positions ([m], [m], [deg]).
+
+    The other parameters are as for :func:`solve_transient_2d`.
+
+    Returns
+    -------
+    TransientResult
+        ``T`` has shape ``(n_saved, n_s, n_z, n_r)`` over the ``n_s``
+        simulated angular cells; ``result.sector`` maps them to the full
+        circle, e.g. ``result.sector.expand(result.T[-1])``.
+    """
+
+    dtype = _field_dtype(dtype)
+    table = materials or material_table()
+    mat_ids = material_ids(mat_idx, table)
+    n_z, n_r = mat_ids.shape
+    k = table.k[mat_ids]
+    rho_cp = table.rho_cp[mat_ids]
+    widths_r = _cell_widths(r_centres, dr, "dr")
+    widths_z = _cell_widths(z_centres, dz, "dz")
+
+    if isinstance(trace_mask, TraceCoverage):
+        cover = trace_mask.cell_fractions(n_theta)
+    elif trace_mask is not None:
+        cover = np.asarray(trace_mask)[:, -1].astype(float)
+        n_theta = len(cover)
+    else:
+        cover = np.zeros(n_theta)
+    sector = (
+        SectorSymmetry.detect(cover) if symmetry else SectorSymmetry(n_theta, n_theta)
+    )
+    dtheta = 2.0 * np.pi / n_theta
+
+    source = _source_profile(heat_source, r_centres) / rho_cp[0, :]
+    op = _SectorOperator(
+        r_centres,
+        widths_r,
+        widths_z,
+        dtheta,
+        k,
+        rho_cp,
+        h_trace * cover[sector.cells],
+        T_inf - T0,
+        q_flux,
+        source,
+        periodic=not sector.mirror,
+        dtype=dtype,
+    )
+    dt_lim = float(np.min(op.capacity / op.conductance_sum()))
     if dt > dt_lim and not allow_unstable:
         raise ValueError(
             f"Time step {dt:.6f} exceeds stability limit of {dt_lim:.6f} seconds"
         )
 
+    theta_centres = (np.arange(n_theta) + 0.5) * 360.0 / n_theta
+    full_cells = probe_cells((theta_centres, z_centres, r_centres), probes)
+    probe_idx = {}
+    for name, cell in full_cells.items():
+        i_t, i_z, i_r = np.unravel_index(cell, (n_theta, n_z, n_r))
+        probe_idx[name] = int(
+            np.ravel_multi_index(
+                (sector.mapping[i_t], i_z, i_r), (sector.n_cells, n_z, n_r)
+            )
+        )
+    monitor = EventMonitor(events, probe_idx, T0) if events else None
+
+    inputs = {
+        "r_centres": r_centres,
+        "dr": widths_r,
+        "z_centres": z_centres,
+        "dz": widths_z,
+        "mat_idx": mat_ids,
+        "materials": table,
+        "q_flux": q_flux,
+        "source": source,
+        "T0": T0,
+        "cover": cover,
+        "h_trace": h_trace,
+        "T_inf": T_inf,
+        "sector": sector,
+        "n_t": n_t,
+        "dt": dt,
+        "max_steps": max_steps,
+        "save_every": save_every,
+        "save_times": _optional_array(save_times),
+        "probes": probe_idx,
+        "events": list(events or []),
+        "power": power,
+        "dtype": dtype.str,
+    }
+    entry = _cache_entry(cache, store, "sector", inputs)
+    ckpt = _checkpointer(
+        checkpoint,
+        checkpoint_interval,
+        "sector",
+        inputs,
+        adaptive=False,
+        heat_rate=np.sum(op.power_in, dtype=float) * n_theta / sector.n_cells,
+        power=power,
+    )
+    hit = _cache_hit(entry, progress_cb)
+    if hit is not None:
+        return hit
+
+    initial = np.zeros((sector.n_cells, n_z, n_r), dtype=dtype)
+    writer = None
+    if store is not None:
+        writer = FrameWriter(
+            store,
+            initial.shape,
+            dtype=dtype,
+            metadata={
+                "model": "sector",
+                "r_centres": r_centres,
+                "dr": widths_r,
+                "z_centres": z_centres,
+                "dz": widths_z,
+                "n_theta": n_theta,
+                "sector": {
+                    "period": sector.period,
+                    "start": sector.start,
+                    "mirror": sector.mirror,
+                },
+                "mat_idx": mat_ids,
+                "materials": table.as_dict(),
+                "q_flux": q_flux,
+                "T0": T0,
+                "trace_cover": cover,
+                "h_trace": h_trace,
+                "T_inf": T_inf,
+                "dt": dt,
+                "power": _waveform_metadata(power),
+            },
+            keep=_kept_frames(ckpt),
+        )
+
     times = np.arange(0.0, (n_t + 1) * dt, dt)
     if max_steps is not None:
         times = times[: max_steps + 1]
-    steps = len(times) - 1
-    T = np.full((steps + 1, n_z, n_r), T0, dtype=float)
+    save_steps = output_steps(times, save_every, save_times)
+    result = march(
+        _SectorExplicit(op, dt),
+        initial,
+        times,
+        save_steps,
+        probe_idx,
+        progress_cb,
+        writer,
+        monitor,
+        power,
+        cancel,
+        ckpt,
+        T0,
+    )
+    result.sector = sector
+    return _remember(entry, result)
 
-    if heat_source is None:
-        q_profile = np.zeros_like(r_centres)
-    else:
-        q_profile = heat_source(r_centres)
-    source_r = q_profile / rho_cp[0, :]
 
-    r_faces = np.concatenate([r_centres[:1] - 0.5 * dr, r_centres + 0.5 * dr])
+def solve_steady(
+    r_centres: NDArray[np.float_],
+    dr: float | ArrayLike,
+    q_flux: float | ArrayLike,
+    k: float,
+    heat_source: HeatSource | Sequence[HeatSource] | None = None,
+    *,
+    h_out: float,
+    T_inf: float = 25.0,
+) -> NDArray[np.float_]:
+    """Steady-state profile of the 1-D cylindrical model in one solve.
 
-    if trace_mask is not None:
-        frac_trace = np.mean(trace_mask, axis=0)
-    else:
-        frac_trace = np.zeros_like(r_centres)
-
-    for n in range(steps):
-        old = T[n]
-        new = T[n + 1]
-
-        ghost_r_left = old[:, 0] + dr * q_flux / k[:, 0]
-
-        h_eff = frac_trace[-1] * h_trace
-        ghost_r_right = old[:, -1] - dr * h_eff / k[:, -1] * (old[:, -1] - T_inf)
-
-        T_r = np.empty((n_z, n_r + 2))
-        T_r[:, 0] = ghost_r_left
-        T_r[:, 1:-1] = old
-        T_r[:, -1] = ghost_r_right
-
-        T_z = np.empty((n_z + 2, n_r))
-        T_z[0, :] = old[0, :]
-        T_z[1:-1, :] = old
-        T_z[-1, :] = old[-1, :]
-
-        for j in range(n_z):
-            for i in range(n_r):
-                r_imh = r_faces[i]
-                r_iph = r_faces[i + 1]
-                radial = (
-                    alpha[j, i]
-                    / (r_centres[i] * dr**2)
-                    * (
-                        r_iph * (T_r[j, i + 2] - old[j, i])
-                        - r_imh * (old[j, i] - T_r[j, i])
-                    )
-                )
-                axial = (
-                    alpha[j, i] * (T_z[j + 2, i] - 2.0 * old[j, i] + T_z[j, i]) / dz**2
-                )
-                new[j, i] = old[j, i] + dt * (radial + axial + source_r[i])
-        if progress_cb is not None:
-            progress_cb(n + 1, steps)
-
-    return times, T
+    The transient model of :func:`solve_transient` is adiabatic at the outer
+    radius and never reaches equilibrium, so the steady state needs a heat
+    sink there: a heat-transfer coefficient ``h_out`` [W/m²·K] to ``T_inf``.
+    The finite-volume balance of :func:`solve_transient` is then a single
+    tridiagonal system.
+
+    Parameters
+    ----------
+    r_centres, dr, q_flux, k, heat_source:
+        Mesh, inner heat flux [W/m²], conductivity and optional surface
+        heat-flux profile as for :func:`solve_transient`, including batched
+        ``q_flux``/``heat_source`` cases.
+    h_out, T_inf:
+        Outer-radius heat-transfer coefficient (must be positive) and ambient
+        temperature.
+
+    Returns
+    -------
+    numpy.ndarray
+        Temperatures of shape ``(n_r,)`` (``(n_cases, n_r)`` for batched
+        inputs).
+    """
+
+    if h_out <= 0:
+        raise ValueError("A steady state needs a positive outer h_out")
+    widths = _cell_widths(r_centres, dr, "dr")
+    r_faces = _faces(r_centres, widths)
+    # Conductances and heat inputs per radian and metre of pad height.
+    g = k * r_faces[1:-1] / _gaps(widths)
+    g_out = h_out * r_faces[-1]
+    q_profile = _source_profile(heat_source, r_centres)
+    batch = _batch_shape(np.shape(q_flux), q_profile.shape[:-1])
+
+    rhs = np.broadcast_to(q_profile * r_centres * widths, batch + r_centres.shape)
+    rhs = rhs.copy()
+    rhs[..., 0] += np.asarray(q_flux, dtype=float) * r_faces[0]
+    rhs[..., -1] += g_out * T_inf
+    west = np.concatenate([[0.0], g])
+    east = np.concatenate([g, [0.0]])
+    diag = west + east
+    diag[-1] += g_out
+    return TridiagonalSolver(-west, diag, -east).solve(rhs, axis=-1, out=rhs)
+
+
+def solve_steady_2d(
+    r_centres: NDArray[np.float_],
+    dr: float | ArrayLike,
+    z_centres: NDArray[np.float_],
+    dz: float | ArrayLike,
+    mat_idx: NDArray[np.uint8],
+    q_flux: float | ArrayLike,
+    heat_source: HeatSource | Sequence[HeatSource] | None = None,
+    trace_mask: NDArray[np.bool_] | TraceCoverage | None = None,
+    h_trace: float | ArrayLike = 1e3,
+    T_inf: float = 25.0,
+    *,
+    materials: MaterialTable | None = None,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> NDArray[np.float_]:
+    """Equilibrium field of the r-z stack in one call.
+
+    Solves the steady finite-volume balance of :func:`solve_transient_2d`
+    (the limit of its fields for long runs at constant power) with the
+    block-tridiagonal direct solver of its ``"implicit"`` scheme. The trace
+    sink is the stack's only heat loss, so ``trace_mask`` must cover part of
+    the rim and ``h_trace`` must be positive. Temperature-dependent
+    conductivities are handled by fixed-point iteration: properties are
+    evaluated at the previous solution until the field changes by less than
+    ``tol`` [K], at most ``max_iter`` times.
+
+    Parameters
+    ----------
+    r_centres, dr, z_centres, dz, mat_idx, q_flux, heat_source, trace_mask,
+    h_trace, T_inf, materials:
+        The stack, heat input and trace sink as for
+        :func:`solve_transient_2d`, including batched cases.
+    tol, max_iter:
+        Convergence tolerance [K] and iteration limit for
+        temperature-dependent materials.
+
+    Returns
+    -------
+    numpy.ndarray
+        Temperatures of shape ``(n_z, n_r)`` (``(n_cases, n_z, n_r)`` for
+        batched inputs).
+    """
+
+    table = materials or material_table()
+    mat_ids = material_ids(mat_idx, table)
+    widths_r = _cell_widths(r_centres, dr, "dr")
+    widths_z = _cell_widths(z_centres, dz, "dz")
+    h_eff = _trace_fraction(trace_mask) * np.asarray(h_trace, dtype=float)
+    if np.any(h_eff <= 0):
+        raise ValueError(
+            "A steady state needs a trace heat sink (trace_mask and h_trace > 0)"
+        )
+
+    q_profile = _source_profile(heat_source, r_centres)
+    batch = _batch_shape(np.shape(q_flux), q_profile.shape[:-1], h_eff.shape)
+    lookup = PropertyLookup(table) if table.temperature_dependent else None
+    if batch and lookup is not None:
+        raise ValueError("Batched runs need temperature-independent materials")
+
+    def solve(k: NDArray[np.float_], rho_cp: NDArray[np.float_]) -> NDArray[np.float_]:
+        op = _StackOperator(
+            r_centres,
+            widths_r,
+            widths_z,
+            k,
+            rho_cp,
+            h_eff,
+            T_inf,
+            np.asarray(q_flux, dtype=float),
+            np.broadcast_to(q_profile / rho_cp[0, :], batch + r_centres.shape),
+        )
+        solvers, by_rows = _stack_solvers(op, np.ones_like(op.capacity), 0.0)
+        field = op.power_in.copy()
+        field[..., -1] += op.g_out * T_inf
+        _solve_stack(solvers, by_rows, field, field)
+        return field
+
+    if lookup is None:
+        return solve(table.k[mat_ids], table.rho_cp[mat_ids])
+    T = np.full(mat_ids.shape, float(T_inf))
+    for _ in range(max_iter):
+        new = solve(*lookup.evaluate(mat_ids, T))
+        if np.max(np.abs(new - T)) < tol:
+            return new
+        T = new
+    raise RuntimeError(f"Steady state did not converge in {max_iter} iterations")
@@ -0,0 +1,196 @@
+"""Chunked on-disk storage of solver frames for long runs."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+META_FILE = "meta.json"
+TIMES_FILE = "times.npy"
+
+
+def _chunk_name(index: int) -> str:
+    return f"chunk_{index:05d}.npy"
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Mapping):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+class FrameWriter:
+    """Append frames to a chunked ``.npy`` store as a solver marches.
+
+    Frames go into fixed-size ``chunk_NNNNN.npy`` files opened as memory
+    maps, so only the chunk being filled is touched. ``meta.json`` holds the
+    frame layout and the caller's ``metadata`` (mesh, materials, ``dt``...).
+    With ``keep`` the first ``keep`` frames of an existing store at ``path``
+    are kept and appending continues after them (resuming a run).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        frame_shape: Sequence[int],
+        *,
+        chunk_frames: int = 64,
+        dtype: DTypeLike = float,
+        metadata: Mapping[str, Any] | None = None,
+        keep: int = 0,
+    ) -> None:
+        if chunk_frames < 1:
+            raise ValueError("chunk_frames must be positive")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._times: list[float] = []
+        if keep:
+            times = np.load(self.path / TIMES_FILE)
+            if len(times) < keep:
+                raise ValueError(f"Store {self.path} holds fewer than {keep} frames")
+            self._times = [float(t) for t in times[:keep]]
+        # Chunks holding only frames past the kept ones are stale.
+        first_stale = -(-keep // chunk_frames)
+        for old in self.path.glob("chunk_*.npy"):
+            if int(old.stem[len("chunk_") :]) >= first_stale:
+                old.unlink()
+        self.frame_shape = tuple(int(n) for n in frame_shape)
+        self.chunk_frames = chunk_frames
+        self.dtype = np.dtype(dtype)
+        self.metadata = _jsonable(dict(metadata or {}))
+        self._chunk: np.memmap[Any, Any] | None = None
+        if keep % chunk_frames:
+            self._chunk = np.lib.format.open_memmap(
+                self.path / _chunk_name(keep // chunk_frames), mode="r+"
+            )
+        self._write_meta()
+
+    def __enter__(self) -> FrameWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def append(self, time: float, frame: NDArray[np.float_]) -> None:
+        """Write ``frame`` taken at ``time`` as the next frame."""
+        n = len(self._times)
+        slot = n % self.chunk_frames
+        if slot == 0:
+            self.flush()
+            self._chunk = np.lib.format.open_memmap(
+                self.path / _chunk_name(n // self.chunk_frames),
+                mode="w+",
+                dtype=self.dtype,
+                shape=(self.chunk_frames,) + self.frame_shape,
+            )
+        assert self._chunk is not None
+        self._chunk[slot] = frame
+        self._times.append(float(time))
+
+    def close(self) -> FrameStore:
+        """Flush everything to disk and return a reader for the store."""
+        self.flush()
+        self._chunk = None
+        return FrameStore(self.path)
+
+    def flush(self) -> None:
+        """Write the frames appended so far and the index to disk."""
+        if self._chunk is not None:
+            self._chunk.flush()
+        np.save(self.path / TIMES_FILE, np.asarray(self._times, dtype=float))
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        meta = {
+            "frame_shape": list(self.frame_shape),
+            "dtype": self.dtype.str,
+            "chunk_frames": self.chunk_frames,
+            "n_frames": len(self._times),
+            "metadata": self.metadata,
+        }
+        (self.path / META_FILE).write_text(json.dumps(meta, indent=2))
+
+
+class FrameStore:
+    """Lazy reader for a store written by :class:`FrameWriter`.
+
+    Indexing works like a ``(n_frames, *frame_shape)`` array but only the
+    chunks touched by the selection are read, e.g. ``store[-1]`` loads one
+    frame and ``store[:, 0, 0]`` one cell's time series.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        meta = json.loads((self.path / META_FILE).read_text())
+        self.frame_shape: tuple[int, ...] = tuple(meta["frame_shape"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.chunk_frames: int = meta["chunk_frames"]
+        self.metadata: dict[str, Any] = meta["metadata"]
+        self.times: NDArray[np.float_] = np.load(self.path / TIMES_FILE)[
+            : meta["n_frames"]
+        ]
+        self._chunks: dict[int, NDArray[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return (len(self),) + self.frame_shape
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __array__(self, dtype: DTypeLike | None = None) -> NDArray[Any]:
+        data = self[:]
+        return data if dtype is None else data.astype(dtype)
+
+    def __getitem__(self, key: Any) -> Any:
+        if not isinstance(key, tuple):
+            key = (key,)
+        first, rest = key[0], key[1:]
+        if isinstance(first, (int, np.integer)):
+            index = int(first) + len(self) if first < 0 else int(first)
+            if not 0 <= index < len(self):
+                raise IndexError(f"Frame {first} out of range for {len(self)} frames")
+            chunk, slot = divmod(index, self.chunk_frames)
+            return np.array(self._chunk(chunk)[(slot,) + rest])
+
+        frames = np.arange(len(self))[first]
+        parts = []
+        for chunk in np.unique(frames // self.chunk_frames):
+            slots = frames[frames // self.chunk_frames == chunk] % self.chunk_frames
+            parts.append(self._chunk(int(chunk))[(slots,) + rest])
+        if not parts:
+            return np.empty((0,) + np.empty(self.frame_shape)[rest].shape, self.dtype)
+        # Preserve the requested frame order across chunk boundaries.
+        order = np.argsort(np.argsort(frames // self.chunk_frames, kind="stable"))
+        return np.concatenate(parts)[order]
+
+    def frame(self, index: int) -> NDArray[Any]:
+        """Return frame ``index`` as an in-memory array."""
+        return np.asarray(self[index])
+
+    def series(self, *cell: int) -> NDArray[Any]:
+        """Return the time series of one cell, e.g. ``series(iz, ir)``."""
+        return np.asarray(self[(slice(None),) + cell])
+
+    def _chunk(self, index: int) -> NDArray[Any]:
+        if index not in self._chunks:
+            self._chunks[index] = np.load(self.path / _chunk_name(index), mmap_mode="r")
+        return self._chunks[index]
@@ -0,0 +1,302 @@
+"""Parameter sweeps of the multilayer trace model over a process pool.
+
+A sweep is a list of cases, each a dict overriding :data:`DEFAULTS`. Every
+case builds its own r-z stack, runs :func:`~laserpad.solver.solve_transient_2d`
+and is reduced to scalar outcomes; :func:`run_sweep` fans the cases out over
+a :class:`~concurrent.futures.ProcessPoolExecutor` and returns one columnar
+table (a dict of equally long arrays) that :func:`write_table` stores as
+``.csv`` or ``.npz``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+import numpy as np
+import yaml  # type: ignore
+from numpy.typing import NDArray
+
+from .beam_profiles import donut_beam, gaussian_beam
+from .cache import enable_cache
+from .geometry import TraceCoverage, build_stack_mesh
+from .materials import material_table
+from .solver import HeatSource, solve_transient_2d
+
+# Case parameters in SI units. ``traces`` lists (start, end) angles in
+# degrees; ``beam`` is ``None``, ``"gaussian"`` (``beam_q``, ``beam_sigma``)
+# or ``"donut"`` (``beam_q`` between ``beam_inner`` and ``beam_outer``).
+# ``n_z`` may be a pair of per-layer cell counts and ``growth`` grades the
+# radial cells, as for :func:`~laserpad.geometry.build_stack_mesh`.
+DEFAULTS: dict[str, Any] = {
+    "r_inner": 0.5e-3,
+    "r_outer": 1.5e-3,
+    "n_r": 50,
+    "pad_th": 0.035e-3,
+    "sub_th": 0.2e-3,
+    "n_z": 50,
+    "growth": 1.0,
+    "power_W": 10.0,
+    "beam": None,
+    "beam_q": 0.0,
+    "beam_sigma": 0.5e-3,
+    "beam_inner": 0.5e-3,
+    "beam_outer": 1.0e-3,
+    "traces": [],
+    "h_trace": 1e3,
+    "T_inf": 25.0,
+    "T0": 25.0,
+    "n_t": 50,
+    "dt": 1e-4,
+    "scheme": "implicit",
+    "threshold": 217.0,
+}
+
+OUTCOMES = (
+    "peak_T",
+    "pad_T_final",
+    "t_threshold",
+    "energy_in",
+    "energy_stored",
+    "energy_lost",
+    "energy_error",
+)
+
+
+def parameter_grid(
+    base: Mapping[str, Any] | None = None, **axes: Sequence[Any]
+) -> list[dict[str, Any]]:
+    """Return the cases of the Cartesian product of ``axes`` over ``base``.
+
+    For example ``parameter_grid(power_W=[5, 10], h_trace=[1e3, 1e4])`` gives
+    four cases with all other parameters at their defaults.
+    """
+
+    names = list(axes)
+    return [
+        {**(base or {}), **dict(zip(names, values))}
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+def _heat_source(params: Mapping[str, Any]) -> HeatSource | None:
+    beam = params["beam"]
+    if beam is None:
+        return None
+    if beam == "gaussian":
+        return lambda r: gaussian_beam(r, params["beam_q"], params["beam_sigma"])
+    if beam == "donut":
+        return lambda r: donut_beam(
+            r, params["beam_inner"], params["beam_outer"], params["beam_q"]
+        )
+    raise ValueError(f"Unknown beam {beam!r}")
+
+
+def run_case(case: Mapping[str, Any]) -> dict[str, float]:
+    """Run one case and return its scalar outcomes (see :data:`OUTCOMES`).
+
+    ``peak_T`` is the hottest cell over the run, ``t_threshold`` the first
+    time the pad surface (inner radius, top row) reaches ``threshold`` (NaN
+    if it never does) and the energy terms [J] balance heat input against
+    the stored and trace-sink energy; ``energy_error`` is their relative
+    mismatch.
+    """
+
+    unknown = set(case) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameter(s) {sorted(unknown)}")
+    p = {**DEFAULTS, **case}
+    table = material_table()
+    r, dr, z, dz, mat_idx = build_stack_mesh(
+        p["r_inner"],
+        p["r_outer"],
+        p["n_r"],
+        p["pad_th"],
+        p["sub_th"],
+        p["n_z"],
+        materials=table,
+        growth=p["growth"],
+    )
+    dr = np.broadcast_to(dr, r.shape)
+    dz = np.broadcast_to(dz, z.shape)
+    coverage = TraceCoverage.from_traces([tuple(t) for t in p["traces"]])
+    r_inner = r[0] - 0.5 * dr[0]
+    r_outer = r[-1] + 0.5 * dr[-1]
+    height = z[-1] + 0.5 * dz[-1]
+    q_flux = p["power_W"] / (2.0 * np.pi * r_inner * height)
+    result = solve_transient_2d(
+        r,
+        dr,
+        z,
+        dz,
+        mat_idx,
+        q_flux,
+        p["n_t"],
+        p["dt"],
+        _heat_source(p),
+        p["T0"],
+        trace_mask=coverage,
+        h_trace=p["h_trace"],
+        T_inf=p["T_inf"],
+        scheme=p["scheme"],
+        probes={"pad": (r_inner, 0.0)},
+        materials=table,
+    )
+    times = result.times
+    T = np.asarray(result.T)
+    pad = result.probes["pad"]
+
+    crossed = np.flatnonzero(pad >= p["threshold"])
+    if len(crossed) == 0:
+        t_threshold = float("nan")
+    elif crossed[0] == 0:
+        t_threshold = 0.0
+    else:
+        i = crossed[0]
+        t0, t1 = result.probe_times[i - 1], result.probe_times[i]
+        frac = (p["threshold"] - pad[i - 1]) / (pad[i] - pad[i - 1])
+        t_threshold = float(t0 + frac * (t1 - t0))
+
+    rho_cp = table.rho_cp[mat_idx]
+    volumes = 2.0 * np.pi * np.outer(dz, r * dr)
+    energy_in = q_flux * 2.0 * np.pi * r_inner * height * times[-1]
+    if p["beam"] is not None:
+        source = _heat_source(p)(r)  # type: ignore[misc]
+        energy_in += np.sum(source / rho_cp[0, :] * rho_cp * volumes) * times[-1]
+    energy_stored = np.sum(rho_cp * volumes * (T[-1] - p["T0"]))
+    h_eff = coverage.fraction * p["h_trace"]
+    loss_power = np.sum(
+        h_eff * (T[:, :, -1] - p["T_inf"]) * 2.0 * np.pi * r_outer * dz, axis=1
+    )
+    energy_lost = float(
+        np.sum(0.5 * (loss_power[1:] + loss_power[:-1]) * np.diff(times))
+    )
+
+    return {
+        "peak_T": float(np.max(T)),
+        "pad_T_final": float(pad[-1]),
+        "t_threshold": t_threshold,
+        "energy_in": float(energy_in),
+        "energy_stored": float(energy_stored),
+        "energy_lost": energy_lost,
+        "energy_error": float(
+            (energy_in - energy_stored - energy_lost) / energy_in if energy_in else 0.0
+        ),
+    }
+
+
+def _column(values: list[Any]) -> NDArray[Any]:
+    if all(isinstance(v, (bool, int, float, np.number)) for v in values):
+        return np.asarray(values)
+    # Lists (traces) and optional strings (beam) are stored as JSON text.
+    return np.asarray(
+        [v if isinstance(v, str) else json.dumps(v) for v in values], dtype=str
+    )
+
+
+def run_sweep(
+    cases: Iterable[Mapping[str, Any]],
+    *,
+    max_workers: int | None = None,
+    path: str | os.PathLike[str] | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> dict[str, NDArray[Any]]:
+    """Run ``cases`` over a process pool and return a columnar table.
+
+    The table has one column per swept parameter (the keys used by any case)
+    followed by the :data:`OUTCOMES`, with rows in case order. ``max_workers``
+    defaults to all cores; ``max_workers=1`` runs in-process. If ``path`` is
+    given the table is also written with :func:`write_table`. With
+    ``cache_dir`` every worker uses a result cache on that directory, so
+    cases already solved by this or an earlier sweep are not run again.
+    """
+
+    cases = [dict(case) for case in cases]
+    if max_workers == 1 or len(cases) <= 1:
+        if cache_dir is not None:
+            enable_cache(cache_dir)
+        outcomes = [run_case(case) for case in cases]
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(cases))
+        chunksize = max(1, len(cases) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(cache_dir,),
+        ) as pool:
+            outcomes = list(pool.map(run_case, cases, chunksize=chunksize))
+
+    names = list(dict.fromkeys(name for case in cases for name in case))
+    table = {
+        name: _column([case.get(name, DEFAULTS[name]) for case in cases])
+        for name in names
+    }
+    for name in OUTCOMES:
+        table[name] = np.asarray([row[name] for row in outcomes], dtype=float)
+    if path is not None:
+        write_table(table, path)
+    return table
+
+
+def _init_worker(cache_dir: str | os.PathLike[str] | None) -> None:
+    if cache_dir is not None:
+        enable_cache(cache_dir)
+
+
+def write_table(
+    table: Mapping[str, NDArray[Any]], path: str | os.PathLike[str]
+) -> None:
+    """Write a columnar table as CSV (``.csv``) or NumPy ``.npz``."""
+    path = Path(path)
+    if path.suffix == ".csv":
+        with path.open("w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(table))
+            writer.writerows(zip(*(col.tolist() for col in table.values())))
+    elif path.suffix == ".npz":
+        np.savez(path, **table)
+    else:
+        raise ValueError(f"Unsupported table format {path.suffix!r}")
+
+
+def read_table(path: str | os.PathLike[str]) -> dict[str, NDArray[Any]]:
+    """Read a table written by :func:`write_table`."""
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+    with path.open(newline="") as f:
+        rows = list(csv.reader(f))
+    table: dict[str, NDArray[Any]] = {}
+    for name, values in zip(rows[0], zip(*rows[1:])):
+        try:
+            table[name] = np.asarray(values, dtype=float)
+        except ValueError:
+            table[name] = np.asarray(values, dtype=str)
+    return table
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Console entry point: ``laserpad-sweep sweep.yaml -o results.csv``.
+
+    The YAML file has an optional ``base`` mapping of fixed parameters and a
+    ``grid`` mapping of parameter name to the list of values to sweep.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("config", help="YAML file with 'base' and 'grid' sections")
+    parser.add_argument("-o", "--output", default="sweep.csv", help="table path")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker count")
+    parser.add_argument("--cache", default=None, help="result cache directory")
+    args = parser.parse_args(argv)
+
+    config = yaml.safe_load(Path(args.config).read_text()) or {}
+    cases = parameter_grid(config.get("base"), **(config.get("grid") or {}))
+    run_sweep(cases, max_workers=args.jobs, path=args.output, cache_dir=args.cache)
+    print(f"Wrote {len(cases)} cases to {args.output}")
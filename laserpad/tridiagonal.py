@@ -0,0 +1,186 @@
+"""Tridiagonal (Thomas algorithm) solves for the implicit engines."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+
+def _stored(
+    values: NDArray[np.float_], dtype: DTypeLike, axes: tuple[int, ...] | None = None
+) -> NDArray[np.float_]:
+    """Return ``values`` as ``dtype`` with negligible entries set to zero.
+
+    Entries smaller than the precision of ``dtype`` relative to the largest
+    magnitude over ``axes`` (all entries by default) cannot change a sum
+    with that entry; dropping them keeps the sweeps clear of subnormal
+    numbers, whose arithmetic is many times slower.
+    """
+    scale = np.abs(values).max(axis=axes, keepdims=True, initial=0.0)
+    threshold = np.finfo(dtype).eps * scale
+    stored = values.astype(dtype)
+    stored[np.abs(values) < threshold] = 0.0
+    return stored
+
+
+class TridiagonalSolver:
+    """Factor a tridiagonal system once and solve it for many right-hand sides.
+
+    The system runs along the first axis of the coefficient arrays; any
+    trailing axes hold independent systems solved together, which is how the
+    line sweeps of the 2-D engines are vectorized. ``lower[0]`` and
+    ``upper[-1]`` are ignored. The factorization is computed in double
+    precision and stored as ``dtype``, which sets the precision of the sweeps.
+    """
+
+    def __init__(
+        self,
+        lower: ArrayLike,
+        diag: ArrayLike,
+        upper: ArrayLike,
+        *,
+        dtype: DTypeLike = float,
+    ) -> None:
+        lower_a, diag_a, upper_a = np.broadcast_arrays(
+            np.asarray(lower, dtype=float),
+            np.asarray(diag, dtype=float),
+            np.asarray(upper, dtype=float),
+        )
+        n = diag_a.shape[0]
+        if n == 0:
+            raise ValueError("Tridiagonal system must have at least one row")
+
+        inv = np.empty_like(diag_a)
+        upper_scaled = np.empty_like(diag_a)
+        inv[0] = 1.0 / diag_a[0]
+        upper_scaled[0] = upper_a[0] * inv[0]
+        for i in range(1, n):
+            inv[i] = 1.0 / (diag_a[i] - lower_a[i] * upper_scaled[i - 1])
+            upper_scaled[i] = upper_a[i] * inv[i]
+
+        self.n = n
+        self._lower = _stored(lower_a, dtype)
+        self._inv = _stored(inv, dtype)
+        self._upper_scaled = _stored(upper_scaled, dtype)
+        if diag_a.ndim == 1:
+            self._lists: tuple[list[float], list[float], list[float]] | None = (
+                lower_a.tolist(),
+                inv.tolist(),
+                upper_scaled.tolist(),
+            )
+        else:
+            self._lists = None
+
+    def solve(
+        self,
+        rhs: NDArray[np.float_],
+        *,
+        axis: int = 0,
+        out: NDArray[np.float_] | None = None,
+    ) -> NDArray[np.float_]:
+        """Return the solution for ``rhs``, whose system runs along ``axis``.
+
+        ``out`` may alias ``rhs`` to solve in place.
+        """
+
+        if out is None:
+            out = np.empty_like(rhs, dtype=np.result_type(rhs, self._inv))
+        if rhs.shape[axis] != self.n:
+            raise ValueError(
+                f"Right-hand side has {rhs.shape[axis]} rows, expected {self.n}"
+            )
+        if rhs.ndim == 1 and self._lists is not None:
+            out[:] = self._solve_scalar(rhs.tolist())
+            return out
+
+        d = np.moveaxis(rhs, axis, 0)
+        x = np.moveaxis(out, axis, 0)
+        lower, inv, upper_scaled = self._lower, self._inv, self._upper_scaled
+        np.multiply(d[0], inv[0], out=x[0])
+        for i in range(1, self.n):
+            np.subtract(d[i], lower[i] * x[i - 1], out=x[i])
+            x[i] *= inv[i]
+        for i in range(self.n - 2, -1, -1):
+            x[i] -= upper_scaled[i] * x[i + 1]
+        return out
+
+    def _solve_scalar(self, d: list[float]) -> list[float]:
+        # Plain-float sweeps avoid per-element NumPy overhead for single
+        # systems such as the 1-D radial engine.
+        assert self._lists is not None
+        lower, inv, upper_scaled = self._lists
+        x = [0.0] * self.n
+        prev = x[0] = d[0] * inv[0]
+        for i in range(1, self.n):
+            prev = x[i] = (d[i] - lower[i] * prev) * inv[i]
+        for i in range(self.n - 2, -1, -1):
+            prev = x[i] = x[i] - upper_scaled[i] * prev
+        return x
+
+
+class BlockTridiagonalSolver:
+    """Factor a block-tridiagonal system once and solve it for many right-hand sides.
+
+    The matrix has dense ``(b, b)`` diagonal blocks and diagonal off-diagonal
+    blocks, which is the structure of a 5-point stencil ordered line by line.
+    ``diag`` has shape ``(m, b, b)`` and ``lower``/``upper`` have shape
+    ``(m, b)`` holding the couplings to the previous and next line;
+    ``lower[0]`` and ``upper[-1]`` are ignored. The inverse Schur complement of
+    every line is stored, so memory grows as ``m*b*b`` and a solve costs two
+    small matrix-vector products per line. As for :class:`TridiagonalSolver`
+    the factors are computed in double precision and stored as ``dtype``.
+    """
+
+    def __init__(
+        self,
+        lower: ArrayLike,
+        diag: ArrayLike,
+        upper: ArrayLike,
+        *,
+        dtype: DTypeLike = float,
+    ) -> None:
+        diag_a = np.array(diag, dtype=float)
+        lower_a = np.asarray(lower, dtype=float)
+        upper_a = np.asarray(upper, dtype=float)
+        m, b, b2 = diag_a.shape
+        if b != b2 or lower_a.shape != (m, b) or upper_a.shape != (m, b):
+            raise ValueError("Inconsistent block-tridiagonal shapes")
+
+        # Transposed inverse Schur complements so that row vectors can be
+        # multiplied from the left, which broadcasts over leading batch axes.
+        inv_t = np.empty_like(diag_a)
+        inv_t[0] = np.linalg.inv(diag_a[0]).T
+        for j in range(1, m):
+            schur = diag_a[j] - lower_a[j][:, None] * inv_t[j - 1].T * upper_a[j - 1]
+            inv_t[j] = np.linalg.inv(schur).T
+
+        self.m = m
+        self.b = b
+        self._lower = _stored(lower_a, dtype)
+        self._upper = _stored(upper_a, dtype)
+        self._inv_t = _stored(inv_t, dtype, axes=(1,))
+
+    def solve(
+        self, rhs: NDArray[np.float_], *, out: NDArray[np.float_] | None = None
+    ) -> NDArray[np.float_]:
+        """Return the solution for ``rhs`` of shape ``(..., m, b)``.
+
+        ``out`` may alias ``rhs`` to solve in place.
+        """
+
+        if rhs.shape[-2:] != (self.m, self.b):
+            raise ValueError(
+                f"Right-hand side has shape {rhs.shape}, expected (..., {self.m}, "
+                f"{self.b})"
+            )
+        if out is None:
+            out = np.empty_like(rhs, dtype=np.result_type(rhs, self._inv_t))
+        lower, upper, inv_t = self._lower, self._upper, self._inv_t
+
+        np.matmul(rhs[..., 0, :], inv_t[0], out=out[..., 0, :])
+        for j in range(1, self.m):
+            line = rhs[..., j, :] - lower[j] * out[..., j - 1, :]
+            np.matmul(line, inv_t[j], out=out[..., j, :])
+        for j in range(self.m - 2, -1, -1):
+            out[..., j, :] -= np.matmul(upper[j] * out[..., j + 1, :], inv_t[j])
+        return out
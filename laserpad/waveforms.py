@@ -0,0 +1,145 @@
+"""Time-varying laser power waveforms.
+
+A :class:`Waveform` is a piecewise-linear multiplier of the nominal heat
+input of a run (``q_flux`` and ``heat_source`` of the solvers), so a
+recipe keeps one spatial beam profile and only rescales it in time. The
+solvers turn a waveform into one scale factor per step with
+:meth:`Waveform.schedule`, the exact mean of the waveform over the step, so
+pulses shorter than ``dt`` still deliver the right energy.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass(frozen=True, eq=False)
+class Waveform:
+    """Piecewise-linear power multiplier through the knots ``(times, values)``.
+
+    ``times`` [s] are non-decreasing; a repeated time is a jump (e.g. a pulse
+    edge), taking the later value from that time on. Before the first and
+    after the last knot the waveform holds its end values.
+    """
+
+    times: NDArray[np.float_]
+    values: NDArray[np.float_]
+
+    def __post_init__(self) -> None:
+        times = np.asarray(self.times, dtype=float)
+        values = np.asarray(self.values, dtype=float)
+        if times.ndim != 1 or times.shape != values.shape or len(times) == 0:
+            raise ValueError("Waveform needs equally long 1-D times and values")
+        if np.any(np.diff(times) < 0):
+            raise ValueError("Waveform times must be non-decreasing")
+        object.__setattr__(self, "times", times)
+        object.__setattr__(self, "values", values)
+
+    @classmethod
+    def constant(cls, value: float = 1.0) -> Waveform:
+        """Return a waveform holding ``value`` for all time."""
+        return cls(np.zeros(1), np.array([float(value)]))
+
+    @classmethod
+    def pulse_train(
+        cls,
+        period: float,
+        width: float,
+        n_pulses: int,
+        *,
+        delay: float = 0.0,
+        rise: float = 0.0,
+        peak: float = 1.0,
+    ) -> Waveform:
+        """Return ``n_pulses`` pulses of ``width`` [s] every ``period`` [s].
+
+        Each pulse ramps from 0 to ``peak`` over ``rise`` seconds (a sharp
+        edge when 0), holds and ramps back down within ``width``; the first
+        pulse starts at ``delay``.
+        """
+
+        if not 0.0 < width <= period or not 0.0 <= 2.0 * rise <= width:
+            raise ValueError("Pulses need 0 < width <= period and 2*rise <= width")
+        if n_pulses < 1:
+            raise ValueError("n_pulses must be a positive integer")
+        starts = delay + period * np.arange(n_pulses)
+        offsets = np.array([0.0, 0.0, rise, width - rise, width, width])
+        levels = np.array([0.0, 0.0, peak, peak, 0.0, 0.0])
+        # Sharp edges (rise == 0) become repeated knots, i.e. jumps.
+        times = (starts[:, None] + offsets).ravel()
+        return cls(times, np.tile(levels, n_pulses))
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        time_column: int = 0,
+        value_column: int = 1,
+        scale: float = 1.0,
+    ) -> Waveform:
+        """Load a logged waveform from a CSV file of ``time, value`` rows.
+
+        Rows whose columns are not numeric (headers, comments) are skipped.
+        ``scale`` multiplies the values, e.g. ``1/rated_power`` turns a log in
+        watts into a multiplier of the nominal heat input.
+        """
+
+        rows = []
+        with Path(path).open(newline="") as f:
+            for row in csv.reader(f):
+                try:
+                    rows.append((float(row[time_column]), float(row[value_column])))
+                except (ValueError, IndexError):
+                    continue
+        if not rows:
+            raise ValueError(f"No numeric rows in {path}")
+        data = np.array(rows)
+        return cls(data[:, 0], scale * data[:, 1])
+
+    def __call__(self, t: ArrayLike) -> NDArray[np.float_]:
+        """Return the waveform value at times ``t``."""
+        t = np.asarray(t, dtype=float)
+        i, offset, slope = self._locate(t)
+        return self.values[i] + slope * offset
+
+    def integral(self, t: ArrayLike) -> NDArray[np.float_]:
+        """Return the integral of the waveform from ``times[0]`` to ``t``."""
+        t = np.asarray(t, dtype=float)
+        widths = np.diff(self.times)
+        areas = 0.5 * widths * (self.values[1:] + self.values[:-1])
+        cumulative = np.concatenate([[0.0], np.cumsum(areas)])
+        i, offset, slope = self._locate(t)
+        return cumulative[i] + offset * (self.values[i] + 0.5 * slope * offset)
+
+    def schedule(self, times: ArrayLike) -> NDArray[np.float_]:
+        """Return the mean of the waveform over each step of ``times``.
+
+        Entry ``n`` scales the heat input of the step from ``times[n]`` to
+        ``times[n+1]``.
+        """
+        times = np.asarray(times, dtype=float)
+        return np.diff(self.integral(times)) / np.diff(times)
+
+    def mean(self, t0: float, t1: float) -> float:
+        """Return the mean of the waveform over ``[t0, t1]``."""
+        return float(self.schedule(np.array([t0, t1]))[0])
+
+    def _locate(
+        self, t: NDArray[np.float_]
+    ) -> tuple[NDArray[np.intp], NDArray[np.float_], NDArray[np.float_]]:
+        """Return the knot before ``t``, the offset from it and the slope."""
+        i = np.clip(np.searchsorted(self.times, t, side="right") - 1, 0, None)
+        widths = np.diff(self.times)
+        slopes = np.zeros_like(self.values)
+        nonzero = widths > 0
+        slopes[:-1][nonzero] = np.diff(self.values)[nonzero] / widths[nonzero]
+        # Beyond the last knot (and before the first) the value is held.
+        slope = np.where(t < self.times[0], 0.0, slopes[i])
+        return i, t - self.times[i], slope
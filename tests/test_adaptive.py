@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.materials import material_table
+from laserpad.solver import solve_transient, solve_transient_2d
+
+
+def test_adaptive_radial_needs_far_fewer_steps() -> None:
+    r_centres, dr = build_radial_mesh(0.00025, 0.0005, 40)
+    args = (r_centres, dr, 1e6, 401.0, 8960.0 * 385.0, 0.05)
+    reference = solve_transient(*args, 1e-5, scheme="crank-nicolson")
+    result = solve_transient(
+        *args, 1e-6, scheme="implicit", adaptive=True, rtol=1e-4, atol=1e-3
+    )
+    steps = len(result.probe_times) - 1
+    assert steps < 0.1 * (len(reference.times) - 1)
+    assert np.isclose(result.times[-1], 0.05)
+    dts = np.diff(result.times)
+    assert dts[-2] > 10 * dts[0], "Steps should grow as the field settles"
+    rise = np.max(reference.T[-1]) - 25.0
+    assert np.max(np.abs(result.T[-1] - reference.T[-1])) < 0.01 * rise
+
+
+def test_adaptive_hits_save_times_exactly() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    result = solve_transient(
+        r_centres,
+        dr,
+        5e4,
+        200.0,
+        2.0e6,
+        0.02,
+        1e-5,
+        scheme="crank-nicolson",
+        adaptive=True,
+        save_times=[0.0, 0.0037, 0.011, 0.02],
+        probes={"inner": 0.001},
+    )
+    assert np.array_equal(result.times, [0.0, 0.0037, 0.011, 0.02])
+    assert result.T.shape == (4, 20)
+    for t, frame in zip(result.times, result.T):
+        i = np.flatnonzero(result.probe_times == t)[0]
+        assert result.probes["inner"][i] == frame[0]
+
+
+def test_adaptive_stack_conserves_energy() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    q_flux = 1e5
+    for scheme in ("adi", "implicit"):
+        times, T = solve_transient_2d(
+            r_centres,
+            dr,
+            z_centres,
+            dz,
+            mat_idx,
+            q_flux,
+            1000,
+            1e-6,
+            scheme=scheme,
+            adaptive=True,
+        )
+        assert np.isclose(times[-1], 1e-3)
+        assert len(times) < 200
+        rho_cp = material_table().rho_cp[mat_idx]
+        volumes = 2 * np.pi * dr * dz * np.outer(np.ones_like(z_centres), r_centres)
+        energy_stored = np.sum(rho_cp * volumes * (T[-1] - 25.0))
+        r_inner = r_centres[0] - dr / 2
+        energy_in = q_flux * 2 * np.pi * r_inner * (z_centres[-1] + dz / 2) * times[-1]
+        assert np.isclose(energy_in, energy_stored, rtol=1e-9)
+
+
+def test_adaptive_requires_implicit_scheme() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    with pytest.raises(ValueError):
+        solve_transient(r_centres, dr, 5e4, 200.0, 2.0e6, 0.01, 1e-6, adaptive=True)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from laserpad.beam_profiles import donut_beam, gaussian_beam
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.solver import solve_transient, solve_transient_2d
+
+
+@pytest.mark.parametrize("scheme", ["explicit", "crank-nicolson"])
+def test_batched_radial_matches_single_runs(scheme: str) -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    q_fluxes = np.array([1e4, 5e4, 2e5])
+    inner = np.array([0.0012, 0.0014, 0.0016])
+
+    def source(r: np.ndarray) -> np.ndarray:
+        return donut_beam(r, inner[:, None], 0.0018, 2e4)
+
+    args = (200.0, 2.0e6, 0.002, 1e-5)
+    batched = solve_transient(
+        r_centres,
+        dr,
+        q_fluxes,
+        *args,
+        source,
+        scheme=scheme,
+        probes={"inner": 0.001},
+    )
+    assert batched.T.shape == (201, 3, 20)
+    assert batched.probes["inner"].shape == (201, 3)
+    for i, q_flux in enumerate(q_fluxes):
+        single = solve_transient(
+            r_centres,
+            dr,
+            q_flux,
+            *args,
+            lambda r: donut_beam(r, inner[i], 0.0018, 2e4),
+            scheme=scheme,
+            probes={"inner": 0.001},
+        )
+        assert np.allclose(batched.T[:, i], single.T, rtol=1e-12)
+        assert np.allclose(batched.probes["inner"][:, i], single.probes["inner"])
+
+
+@pytest.mark.parametrize("scheme", ["explicit", "adi", "implicit"])
+def test_batched_stack_matches_single_runs(scheme: str) -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    trace_mask = np.zeros((8, len(r_centres)), dtype=bool)
+    trace_mask[:3] = True
+    q_fluxes = np.array([1e5, 3e5])
+    h_traces = np.array([1e3, 5e4])
+    sigmas = np.array([0.0012, 0.0018])
+    args = (r_centres, dr, z_centres, dz, mat_idx)
+    batched = solve_transient_2d(
+        *args,
+        q_fluxes,
+        100,
+        5e-6,
+        lambda r: gaussian_beam(r, 1e5, sigmas[:, None]),
+        trace_mask=trace_mask,
+        h_trace=h_traces,
+        scheme=scheme,
+    )
+    assert batched.T.shape == (101, 2, 6, 10)
+    for i in range(2):
+        single = solve_transient_2d(
+            *args,
+            q_fluxes[i],
+            100,
+            5e-6,
+            lambda r: gaussian_beam(r, 1e5, sigmas[i]),
+            trace_mask=trace_mask,
+            h_trace=h_traces[i],
+            scheme=scheme,
+        )
+        assert np.allclose(batched.T[:, i], single.T, rtol=1e-12)
+
+
+def test_cases_must_share_one_axis() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    with pytest.raises(ValueError):
+        solve_transient(r_centres, dr, np.ones((2, 2)), 200.0, 2.0e6, 0.001, 1e-5)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from laserpad.cache import ResultCache, disable_cache, enable_cache, stable_hash
+from laserpad.geometry import TraceCoverage, build_radial_mesh, build_stack_mesh
+from laserpad.solver import solve_transient, solve_transient_2d, solve_transient_3d
+
+
+def test_stable_hash_tracks_contents() -> None:
+    a = np.linspace(0.0, 1.0, 5)
+    assert stable_hash({"x": a, "n": 3}) == stable_hash({"n": 3, "x": a.copy()})
+    assert stable_hash({"x": a}) != stable_hash({"x": a + 1e-12})
+    assert stable_hash(np.zeros(2)) != stable_hash(np.zeros(2, dtype=np.float32))
+    with pytest.raises(TypeError):
+        stable_hash(lambda r: r)
+
+
+def test_memory_and_disk_tiers(tmp_path) -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    args = (r_centres, dr, z_centres, dz, mat_idx)
+    cache = ResultCache(directory=tmp_path)
+    calls = []
+    first = solve_transient_2d(
+        *args, 1e5, 20, 5e-6, cache=cache, progress_cb=lambda i, n: calls.append(i)
+    )
+    again = solve_transient_2d(
+        *args, 1e5, 20, 5e-6, cache=cache, progress_cb=lambda i, n: calls.append(i)
+    )
+    assert again is first and (cache.hits, cache.misses) == (1, 1)
+    assert calls[-1] == 1 and len(calls) == 21
+    assert not again.T.flags.writeable
+    changed = solve_transient_2d(*args, 2e5, 20, 5e-6, cache=cache)
+    assert cache.misses == 2
+    assert not np.array_equal(changed.T, first.T)
+
+    # A fresh process-level cache on the same directory is served from disk.
+    reloaded = solve_transient_2d(
+        *args, 1e5, 20, 5e-6, cache=ResultCache(directory=tmp_path)
+    )
+    assert np.array_equal(reloaded.T, first.T)
+    assert np.array_equal(reloaded.probe_times, first.probe_times)
+
+
+def test_disk_tier_evicts_least_recent(tmp_path) -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 50)
+    cache = ResultCache(directory=tmp_path, max_disk_bytes=60_000)
+    for q_flux in (1e4, 2e4, 3e4, 4e4):
+        solve_transient(
+            r_centres,
+            dr,
+            q_flux,
+            200.0,
+            2.0e6,
+            0.01,
+            1e-4,
+            scheme="implicit",
+            cache=cache,
+        )
+    files = list(tmp_path.glob("*.npz"))
+    assert sum(f.stat().st_size for f in files) <= 60_000
+    assert 0 < len(files) < 4
+
+
+def test_default_cache_and_sector_roundtrip(tmp_path) -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 6, 0.000035, 0.0002, 4
+    )
+    coverage = TraceCoverage.from_traces([(0.0, 30.0), (180.0, 210.0)])
+    args = (r_centres, dr, z_centres, dz, mat_idx, 1e5, 5, 1e-6)
+    cache = enable_cache(tmp_path)
+    try:
+        assert enable_cache(tmp_path) is cache
+        first = solve_transient_3d(*args, trace_mask=coverage, n_theta=36)
+        assert solve_transient_3d(*args, trace_mask=coverage, n_theta=36) is first
+        assert (
+            solve_transient_3d(*args, trace_mask=coverage, n_theta=36, cache=False)
+            is not first
+        )
+    finally:
+        disable_cache()
+    reloaded = ResultCache(directory=tmp_path).get(next(tmp_path.glob("*.npz")).stem)
+    assert reloaded is not None and reloaded.sector == first.sector
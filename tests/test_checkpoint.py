@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from laserpad.checkpoint import load_checkpoint
+from laserpad.events import MaxTemperature
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.progress import CancelToken, Cancelled
+from laserpad.solver import solve_transient, solve_transient_2d
+from laserpad.waveforms import Waveform
+
+R_IN, R_OUT, PAD, SUB = 0.001, 0.002, 0.000035, 0.0002
+
+
+def stack_args() -> tuple:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        R_IN, R_OUT, 8, PAD, SUB, 6
+    )
+    return (r_centres, dr, z_centres, dz, mat_idx, 5e4, 120, 5e-6)
+
+
+def test_cancelled_run_resumes_exactly(tmp_path: Path) -> None:
+    args = stack_args()
+    options = dict(
+        power=Waveform.pulse_train(2e-4, 1e-4, 3),
+        probes={"pad": (R_IN, 0.0)},
+        events=[MaxTemperature(1e4)],
+        save_every=7,
+        cache=False,
+    )
+    reference = solve_transient_2d(*args, **options)
+
+    path = tmp_path / "run.ckpt"
+    token = CancelToken()
+
+    def cancel_at(i: int, total: int) -> None:
+        if i == 50:
+            token.cancel()
+
+    with pytest.raises(Cancelled):
+        solve_transient_2d(
+            *args, cancel=token, checkpoint=path, progress_cb=cancel_at, **options
+        )
+    state = load_checkpoint(path)
+    assert state.step == 50 and np.isclose(state.time, 50 * 5e-6)
+    delivered = options["power"].integral(state.time)
+    assert np.isclose(state.delivered, delivered)
+    energy_in = 5e4 * 2.0 * np.pi * R_IN * (PAD + SUB) * delivered
+    assert np.isclose(state.energy_in, energy_in)
+
+    calls = []
+    resumed = solve_transient_2d(
+        *args, checkpoint=path, progress_cb=lambda i, n: calls.append(i), **options
+    )
+    assert calls[0] == 51
+    assert np.array_equal(resumed.times, reference.times)
+    assert np.array_equal(resumed.T, reference.T)
+    assert np.array_equal(resumed.probes["pad"], reference.probes["pad"])
+    assert not path.exists()
+
+
+def test_crashed_run_resumes_frame_store(tmp_path: Path) -> None:
+    args = stack_args()
+    reference = solve_transient_2d(*args, save_every=3, cache=False)
+
+    def crash(i: int, total: int) -> None:
+        if i == 100:
+            raise RuntimeError("worker restarted")
+
+    path = tmp_path / "run.ckpt"
+    store = tmp_path / "frames"
+    options = dict(save_every=3, store=store, checkpoint=path, checkpoint_interval=0)
+    with pytest.raises(RuntimeError):
+        solve_transient_2d(*args, progress_cb=crash, **options)
+    assert load_checkpoint(path).step == 99
+
+    times, T = solve_transient_2d(*args, **options)
+    assert np.array_equal(times, reference.times)
+    assert np.array_equal(T[:], reference.T)
+
+
+def test_checkpoint_rejects_other_runs(tmp_path: Path) -> None:
+    r_centres, dr = build_radial_mesh(R_IN, R_OUT, 10)
+    path = tmp_path / "run.ckpt"
+    token = CancelToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        solve_transient(
+            r_centres, dr, 5e4, 200.0, 2e6, 0.001, 1e-5, cancel=token, checkpoint=path
+        )
+    with pytest.raises(ValueError, match="other inputs"):
+        solve_transient(r_centres, dr, 6e4, 200.0, 2e6, 0.001, 1e-5, checkpoint=path)
+    with pytest.raises(ValueError, match="fixed-step"):
+        solve_transient(
+            r_centres,
+            dr,
+            5e4,
+            200.0,
+            2e6,
+            0.001,
+            1e-5,
+            scheme="implicit",
+            adaptive=True,
+            checkpoint=tmp_path / "other.ckpt",
+        )
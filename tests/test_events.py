@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from laserpad.events import MaxTemperature, ProbeThreshold, SteadyState
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.solver import solve_transient, solve_transient_2d
+
+
+def test_probe_threshold_stops_radial_run() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    args = (r_centres, dr, 5e4, 200.0, 2.0e6, 0.02, 1e-5)
+    full = solve_transient(*args, probes={"inner": 0.001})
+    result = solve_transient(
+        *args,
+        probes={"inner": 0.001},
+        events=[ProbeThreshold("inner", 25.2)],
+        save_every=1000,
+    )
+    assert result.event is not None
+    assert result.event.name == "inner >= 25.2"
+    crossed = np.flatnonzero(full.probes["inner"] >= 25.2)[0]
+    assert result.event.step == crossed
+    assert full.times[crossed - 1] < result.event.time <= full.times[crossed]
+    assert np.isclose(result.times[-1], full.times[crossed])
+    assert np.array_equal(result.T[-1], full.T[crossed])
+    assert len(result.probe_times) == crossed + 1
+
+
+def test_max_temperature_stops_stack_run() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    result = solve_transient_2d(
+        r_centres,
+        dr,
+        z_centres,
+        dz,
+        mat_idx,
+        1e6,
+        100,
+        1e-5,
+        scheme="implicit",
+        events=[MaxTemperature(26.0)],
+    )
+    assert result.event is not None
+    assert np.max(result.T[-1]) >= 26.0
+    assert np.max(result.T[-2]) < 26.0
+    assert result.times[-2] < result.event.time <= result.times[-1]
+
+
+def test_steady_state_stops_adaptive_run() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    trace_mask = np.ones((8, len(r_centres)), dtype=bool)
+    result = solve_transient_2d(
+        r_centres,
+        dr,
+        z_centres,
+        dz,
+        mat_idx,
+        1e4,
+        100000,
+        1e-4,
+        trace_mask=trace_mask,
+        h_trace=1e5,
+        scheme="implicit",
+        adaptive=True,
+        events=[SteadyState(0.01)],
+    )
+    assert result.event is not None
+    assert result.event.time < 10.0
+    rate = np.max(np.abs(result.T[-1] - result.T[-2])) / np.diff(result.times)[-1]
+    assert rate < 0.01
+
+
+def test_event_needs_defined_probe() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    with pytest.raises(ValueError):
+        solve_transient(
+            r_centres,
+            dr,
+            5e4,
+            200.0,
+            2.0e6,
+            0.01,
+            1e-4,
+            events=[ProbeThreshold("pad", 217.0)],
+        )
@@ -1,5 +1,15 @@
 import math
-from laserpad.geometry import get_annular_pad_properties
+
+import numpy as np
+
+from laserpad.geometry import (
+    TraceCoverage,
+    build_radial_mesh,
+    build_stack_mesh,
+    build_stack_mesh_with_traces,
+    get_annular_pad_properties,
+)
+from laserpad.solver import solve_transient_2d
 
 
 def test_annular_mass_and_heat_capacity() -> None:
@@ -19,3 +29,68 @@ def test_annular_mass_and_heat_capacity() -> None:
     assert math.isclose(props["volume_m3"], volume, rel_tol=1e-9)
     assert math.isclose(props["mass_kg"], mass, rel_tol=1e-9)
     assert math.isclose(props["heat_capacity_J_per_K"], heat_capacity, rel_tol=1e-9)
+
+
+def _loop_mask(trace_defs, n_theta):
+    theta_centres = np.linspace(0.0, 360.0, n_theta, endpoint=False)
+    mask = np.zeros(n_theta, dtype=bool)
+    for k, theta in enumerate(theta_centres):
+        for start, end in trace_defs:
+            if start <= theta < end or (
+                end < start and (theta >= start or theta < end)
+            ):
+                mask[k] = True
+                break
+    return mask
+
+
+def test_trace_coverage_matches_angle_loop() -> None:
+    rng = np.random.default_rng(1)
+    trace_defs = [
+        (float(a), float(b)) for a, b in rng.uniform(-20.0, 380.0, size=(40, 2))
+    ]
+    trace_defs += [(350.0, 10.0), (90.0, 90.0), (100.0, 120.0), (110.0, 130.0)]
+    coverage = TraceCoverage.from_traces(trace_defs)
+    starts, ends = coverage.intervals.T
+    assert np.all(ends > starts) and np.all(starts[1:] > ends[:-1])
+    for n_theta in (360, 3600, 37):
+        assert np.array_equal(coverage.mask(n_theta), _loop_mask(trace_defs, n_theta))
+
+    *_, mask = build_stack_mesh_with_traces(
+        0.001, 0.002, 5, 0.000035, 0.0002, 4, [(300, 30)], 3600
+    )
+    assert mask.shape == (3600, 5)
+    assert np.array_equal(mask[:, 0], _loop_mask([(300, 30)], 3600))
+    assert math.isclose(TraceCoverage.from_traces([(300, 30)]).fraction, 90 / 360)
+    assert TraceCoverage.from_traces([]).fraction == 0.0
+
+
+def test_solver_accepts_trace_coverage() -> None:
+    traces = [(0.0, 90.0), (180.0, 270.0), (330.0, 30.0)]
+    r, dr, z, dz, mat_idx, mask = build_stack_mesh_with_traces(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6, traces
+    )
+    args = (r, dr, z, dz, mat_idx, 1e6, 50, 5e-6)
+    _, T_mask = solve_transient_2d(*args, trace_mask=mask, h_trace=1e5)
+    _, T_cov = solve_transient_2d(
+        *args, trace_mask=TraceCoverage.from_traces(traces), h_trace=1e5
+    )
+    assert np.allclose(T_mask, T_cov, rtol=1e-13)
+
+
+def test_graded_and_layer_aligned_meshes() -> None:
+    r, dr = build_radial_mesh(0.001, 0.003, 12, growth=1.2)
+    assert np.allclose(dr[1:] / dr[:-1], 1.2)
+    assert math.isclose(np.sum(dr), 0.002, rel_tol=1e-12)
+    assert np.allclose(r, 0.001 + np.cumsum(dr) - dr / 2)
+
+    r, dr, z, dz, mat_idx = build_stack_mesh(
+        0.001, 0.003, 12, 0.000035, 0.0002, (4, 10), growth=1.2
+    )
+    assert z.shape == dz.shape == (14,) and mat_idx.shape == (14, 12)
+    assert np.allclose(dz[:4], 0.000035 / 4) and np.allclose(dz[4:], 0.0002 / 10)
+    assert math.isclose(np.sum(dz[:4]), 0.000035, rel_tol=1e-12)
+    assert np.all(mat_idx[:4] == mat_idx[0, 0]) and np.all(mat_idx[4:] != mat_idx[0, 0])
+
+    _, dr_uniform = build_radial_mesh(0.001, 0.003, 12)
+    assert isinstance(dr_uniform, float)
@@ -31,3 +31,29 @@ def test_energy_balance() -> None:
     assert abs(temps[-1] - expected) < 0.01 * abs(
         expected
     ), f"Energy mismatch: got {temps[-1]:.3f}, expected ~{expected:.3f}"
+
+
+def test_losses_approach_equilibrium() -> None:
+    m, cp, P, G = 1e-6, 385.0, 0.5, 2e-3
+    times, temps = solve_heatup(P, m, cp, 2.0, 0.5, 25.0, g_trace=G, T_inf=20.0)
+    tau = m * cp / G
+    expected = 20.0 + P / G + (25.0 - 20.0 - P / G) * np.exp(-times / tau)
+    assert np.allclose(temps, expected)
+
+    # Explicit Euler with a tiny step converges to the closed form.
+    T = 25.0
+    for _ in range(20000):
+        T += 1e-4 * (P - G * (T - 20.0)) / (m * cp)
+    assert abs(T - temps[-1]) < 0.01
+
+
+def test_batched_pads_with_piecewise_power() -> None:
+    props = get_pad_properties(np.linspace(0.5, 2.0, 1000))
+    m = props["mass_kg"]
+    cp = 385.0
+    power = np.array([2.0, 0.5, 0.0])
+    times, temps = solve_heatup(power, m, cp, 0.3, 0.05, power_times=[0.0, 0.1, 0.2])
+    assert temps.shape == (len(times), 1000)
+    # Without losses the stored energy equals the delivered energy.
+    assert np.allclose((temps[-1] - 25.0) * m * cp, 2.0 * 0.1 + 0.5 * 0.1)
+    assert np.allclose(temps[-1], temps[-2])
@@ -18,6 +18,18 @@ def test_energy_conservation() -> None:
     assert np.isclose(energy_in, energy_stored, rtol=0.01)
 
 
+def test_energy_conservation_graded_mesh() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20, growth=1.1)
+    q = 5e4
+    rho_cp = 2.0e6
+    t_max = 0.01
+    times, T = solve_transient(r_centres, dr, q, 200.0, rho_cp, t_max, 1e-6)
+    r_inner = r_centres[0] - dr[0] / 2
+    energy_in = q * 2 * np.pi * r_inner * times[-1]
+    energy_stored = rho_cp * 2 * np.pi * np.sum((T[-1] - 25.0) * r_centres * dr)
+    assert np.isclose(energy_in, energy_stored, rtol=1e-9)
+
+
 def test_near_uniform_long_time() -> None:
     r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
     q = 5e4
@@ -44,3 +56,58 @@ def test_cfl_violation() -> None:
         pass
     else:
         raise AssertionError("Expected ValueError for unstable dt")
+
+
+def _reference_transient(
+    r_centres: np.ndarray,
+    dr: float,
+    q: float,
+    k: float,
+    rho_cp: float,
+    steps: int,
+    dt: float,
+) -> np.ndarray:
+    alpha = k / rho_cp
+    r_faces = np.concatenate([r_centres[:1] - 0.5 * dr, r_centres + 0.5 * dr])
+    T = np.full(len(r_centres), 25.0)
+    for _ in range(steps):
+        ext = np.concatenate([[T[0] + dr * q / k], T, [T[-1]]])
+        new = T.copy()
+        for i in range(len(r_centres)):
+            new[i] = T[i] + dt * (
+                (alpha / (r_centres[i] * dr**2))
+                * (r_faces[i + 1] * (ext[i + 2] - T[i]) - r_faces[i] * (T[i] - ext[i]))
+            )
+        T = new
+    return T
+
+
+def test_matches_reference_loop() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    q, k, rho_cp, dt = 5e4, 200.0, 2.0e6, 1e-5
+    times, T = solve_transient(r_centres, dr, q, k, rho_cp, 0.002, dt)
+    expected = _reference_transient(r_centres, dr, q, k, rho_cp, len(times) - 1, dt)
+    np.testing.assert_allclose(T[-1], expected, rtol=1e-12, atol=0.0)
+
+
+def test_implicit_large_step_matches_explicit() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    q, k, rho_cp = 5e4, 200.0, 2.0e6
+    dt = 1e-3  # 80x the explicit stability limit
+    _, T_ref = solve_transient(r_centres, dr, q, k, rho_cp, 0.02, 1e-5)
+    for scheme in ("implicit", "crank-nicolson"):
+        times, T = solve_transient(r_centres, dr, q, k, rho_cp, 0.02, dt, scheme=scheme)
+        assert np.isclose(times[-1], 0.02)
+        assert np.allclose(T[-1] - 25.0, T_ref[-1] - 25.0, rtol=0.02)
+
+
+def test_implicit_energy_conservation() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    q, k, rho_cp, t_max = 5e4, 200.0, 2.0e6, 0.01
+    times, T = solve_transient(
+        r_centres, dr, q, k, rho_cp, t_max, 1e-3, scheme="implicit"
+    )
+    r_inner = r_centres[0] - dr / 2
+    energy_in = q * 2 * np.pi * r_inner * times[-1]
+    energy_stored = rho_cp * 2 * np.pi * np.sum((T[-1] - 25.0) * r_centres * dr)
+    assert np.isclose(energy_in, energy_stored, rtol=1e-9)
@@ -54,3 +54,33 @@ def test_energy_balance() -> None:
     energy_in = np.sum(src(r_centres) * 2 * np.pi * r_centres * dr) * t_max
     energy_stored = rho_cp * 2 * np.pi * np.sum((final - T0) * r_centres * dr)
     assert np.isclose(energy_in, energy_stored, rtol=0.01)
+
+
+def test_energy_balance_single_precision() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    rho_cp = 2.0e6
+    t_max = 0.01
+
+    def src(r: NDArray[np.float_]) -> NDArray[np.float_]:
+        return uniform_beam(r, 5e4)
+
+    energy_in = np.sum(src(r_centres) * 2 * np.pi * r_centres * dr) * t_max
+    for scheme, dt in (("explicit", 1e-5), ("implicit", 1e-4)):
+        times, T = solve_transient(
+            r_centres,
+            dr,
+            0.0,
+            200.0,
+            rho_cp,
+            t_max,
+            dt,
+            src,
+            25.0,
+            scheme=scheme,
+            dtype=np.float32,
+            cache=False,
+        )
+        assert T.dtype == np.float32
+        final = T[-1].astype(float)
+        energy_stored = rho_cp * 2 * np.pi * np.sum((final - 25.0) * r_centres * dr)
+        assert np.isclose(energy_in, energy_stored, rtol=0.01)
@@ -1,6 +1,7 @@
 import numpy as np
 
 from laserpad.geometry import build_stack_mesh, load_materials
+from laserpad.materials import material_table
 from laserpad.solver import solve_transient_2d
 
 
@@ -16,11 +17,7 @@ def test_energy_conservation() -> None:
     )
     t_max = times[-1]
 
-    mats = load_materials()
-    rho_cp = np.zeros_like(mat_idx, dtype=float)
-    for name, props in mats.items():
-        mask = mat_idx == name
-        rho_cp[mask] = props["rho"] * props["cp"]
+    rho_cp = material_table().rho_cp[mat_idx]
 
     final = T[-1]
     volumes = 2 * np.pi * dr * dz * np.outer(np.ones_like(z_centres), r_centres)
@@ -59,3 +56,114 @@ def test_cfl_enforced() -> None:
         pass
     else:
         raise AssertionError("Expected ValueError for unstable dt")
+
+
+def test_interface_flux_conserves_energy() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 12, 0.000035, 0.0002, 8
+    )
+    q_flux = 1e5
+    times, T = solve_transient_2d(
+        r_centres, dr, z_centres, dz, mat_idx, q_flux, 50, 2e-6
+    )
+
+    rho_cp = material_table().rho_cp[mat_idx]
+
+    volumes = 2 * np.pi * dr * dz * np.outer(np.ones_like(z_centres), r_centres)
+    energy_stored = np.sum(rho_cp * volumes * (T[-1] - 25.0))
+    r_inner = r_centres[0] - dr / 2
+    energy_in = q_flux * 2 * np.pi * r_inner * (z_centres[-1] + dz / 2) * times[-1]
+    assert np.isclose(energy_in, energy_stored, rtol=1e-9)
+
+
+def test_adi_large_step_matches_explicit() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    _, T_ref = solve_transient_2d(
+        r_centres, dr, z_centres, dz, mat_idx, 1e5, 2000, 1e-6
+    )
+    times, T = solve_transient_2d(
+        r_centres, dr, z_centres, dz, mat_idx, 1e5, 16, 1.25e-4, scheme="adi"
+    )
+    assert np.isclose(times[-1], 2e-3)
+    rise = np.max(T_ref[-1]) - 25.0
+    assert np.max(np.abs(T[-1] - T_ref[-1])) < 1e-3 * rise
+
+    rho_cp = material_table().rho_cp[mat_idx]
+    volumes = 2 * np.pi * dr * dz * np.outer(np.ones_like(z_centres), r_centres)
+    energy_stored = np.sum(rho_cp * volumes * (T[-1] - 25.0))
+    r_inner = r_centres[0] - dr / 2
+    energy_in = 1e5 * 2 * np.pi * r_inner * (z_centres[-1] + dz / 2) * times[-1]
+    assert np.isclose(energy_in, energy_stored, rtol=1e-9)
+
+
+def test_single_precision_conserves_energy() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 12, 0.000035, 0.0002, 8
+    )
+    rho_cp = material_table().rho_cp[mat_idx]
+    volumes = 2 * np.pi * dr * dz * np.outer(np.ones_like(z_centres), r_centres)
+    r_inner = r_centres[0] - dr / 2
+    height = z_centres[-1] + dz / 2
+    for scheme, n_t, dt in (
+        ("explicit", 200, 2e-6),
+        ("adi", 8, 5e-5),
+        ("implicit", 8, 5e-5),
+    ):
+        times, T = solve_transient_2d(
+            r_centres,
+            dr,
+            z_centres,
+            dz,
+            mat_idx,
+            1e5,
+            n_t,
+            dt,
+            scheme=scheme,
+            dtype=np.float32,
+            cache=False,
+        )
+        assert T.dtype == np.float32
+        energy_stored = np.sum(rho_cp * volumes * (T[-1] - 25.0))
+        energy_in = 1e5 * 2 * np.pi * r_inner * height * times[-1]
+        assert np.isclose(energy_in, energy_stored, rtol=1e-3)
+
+    try:
+        solve_transient_2d(
+            r_centres, dr, z_centres, dz, mat_idx, 1e5, 8, 5e-5, dtype=np.float16
+        )
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for float16 fields")
+
+
+def test_graded_layered_mesh_conserves_energy_and_converges() -> None:
+    def pad_temperature(n_r: int, n_z, growth: float = 1.0) -> float:
+        mesh = build_stack_mesh(0.001, 0.003, n_r, 0.000035, 0.0002, n_z, growth=growth)
+        result = solve_transient_2d(
+            *mesh,
+            1e6,
+            50,
+            2e-5,
+            scheme="implicit",
+            probes={"pad": (0.001, 0.0)},
+            save_every=50,
+        )
+        return float(result.probes["pad"][-1])
+
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, (3, 6), growth=1.15
+    )
+    times, T = solve_transient_2d(r_centres, dr, z_centres, dz, mat_idx, 1e5, 50, 2e-7)
+    rho_cp = material_table().rho_cp[mat_idx]
+    volumes = 2 * np.pi * np.outer(dz, r_centres * dr)
+    energy_stored = np.sum(rho_cp * volumes * (T[-1] - 25.0))
+    energy_in = 1e5 * 2 * np.pi * (r_centres[0] - dr[0] / 2) * np.sum(dz) * times[-1]
+    assert np.isclose(energy_in, energy_stored, rtol=1e-9)
+
+    reference = pad_temperature(200, (20, 100))
+    graded = abs(pad_temperature(40, (6, 16), growth=1.05) - reference)
+    uniform = abs(pad_temperature(40, 22) - reference)
+    assert graded < 0.6 * uniform
@@ -1,6 +1,7 @@
 import json
 import numpy as np
-from laserpad.geometry import build_stack_mesh_with_traces, load_materials
+from laserpad.geometry import build_stack_mesh_with_traces
+from laserpad.materials import material_table
 from laserpad.solver import solve_transient_2d
 
 
@@ -8,7 +9,9 @@ TRACE_HALF = json.dumps([{"start_angle": 0, "end_angle": 180}])
 TRACE_FULL = json.dumps([{"start_angle": 0, "end_angle": 360}])
 
 
-def run_case(trace_json: str, h: float = 1e3) -> tuple[float, float, float]:
+def run_case(
+    trace_json: str, h: float = 1e3, scheme: str = "explicit"
+) -> tuple[float, float, float]:
     traces = json.loads(trace_json)
     r, dr, z, dz, mat_idx, mask = build_stack_mesh_with_traces(
         0.001,
@@ -34,13 +37,10 @@ def run_case(trace_json: str, h: float = 1e3) -> tuple[float, float, float]:
         trace_mask=mask,
         h_trace=h,
         T_inf=25.0,
+        scheme=scheme,
     )
     t_max = times[-1]
-    mats = load_materials()
-    rho_cp = np.zeros_like(mat_idx, dtype=float)
-    for name, props in mats.items():
-        mask_mat = mat_idx == name
-        rho_cp[mask_mat] = props["rho"] * props["cp"]
+    rho_cp = material_table().rho_cp[mat_idx]
     final = T[-1]
     volumes = 2 * np.pi * dr * dz * np.outer(np.ones_like(z), r)
     energy_stored = np.sum(rho_cp * volumes * (final - 25.0))
@@ -74,3 +74,29 @@ def test_no_traces_is_adiabatic() -> None:
     ein, stored, loss = run_case(empty)
     assert np.isclose(ein, stored, rtol=0.1)
     assert loss < 1e-6
+
+
+def test_adi_energy_balance_with_traces() -> None:
+    ein, stored, loss = run_case(TRACE_HALF, scheme="adi")
+    assert np.isclose(ein, stored + loss, rtol=0.1)
+    ein_ref, stored_ref, _ = run_case(TRACE_HALF)
+    assert np.isclose(stored, stored_ref, rtol=1e-3)
+
+
+def test_implicit_matches_explicit_with_traces() -> None:
+    r, dr, z, dz, mat_idx, mask = build_stack_mesh_with_traces(
+        0.001, 0.003, 12, 0.000035, 0.0002, 7, [(0.0, 90.0), (180.0, 270.0)]
+    )
+    kwargs = dict(trace_mask=mask, h_trace=1e5, T_inf=25.0)
+    _, T_ref = solve_transient_2d(r, dr, z, dz, mat_idx, 1e6, 4000, 5e-7, **kwargs)
+    times, T = solve_transient_2d(
+        r, dr, z, dz, mat_idx, 1e6, 80, 2.5e-5, scheme="implicit", **kwargs
+    )
+    # A second run on the same mesh reuses the cached factorization.
+    _, T_again = solve_transient_2d(
+        r, dr, z, dz, mat_idx, 1e6, 80, 2.5e-5, scheme="implicit", **kwargs
+    )
+    assert np.array_equal(T, T_again)
+    assert np.isclose(times[-1], 2e-3)
+    rise = np.max(T_ref[-1]) - 25.0
+    assert np.max(np.abs(T[-1] - T_ref[-1])) < 0.01 * rise
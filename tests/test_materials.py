@@ -0,0 +1,99 @@
+import os
+
+import numpy as np
+import pytest
+
+from laserpad.geometry import build_stack_mesh
+from laserpad.materials import PropertyLookup, material_ids, material_table
+from laserpad.solver import solve_transient_2d
+
+TABULATED = (
+    "copper: {k: [[0, 410.0], [200, 380.0], [600, 330.0]], rho: 8960.0,"
+    " cp: [[0, 380.0], [600, 440.0]]}\n"
+    "fr4: {k: 0.3, rho: 1900.0, cp: 1200.0}\n"
+)
+MATERIALS = "copper: {k: 400.0, rho: 8960.0, cp: 385.0}\nfr4: {k: 0.3, rho: 1900.0, cp: 1200.0}\n"
+
+
+def test_table_is_cached_until_file_changes(tmp_path) -> None:
+    path = tmp_path / "materials.yaml"
+    path.write_text(MATERIALS)
+    table = material_table(path)
+    assert material_table(path) is table
+    assert table.names == ("copper", "fr4")
+    assert np.allclose(table.rho_cp, [8960.0 * 385.0, 1900.0 * 1200.0])
+
+    path.write_text(MATERIALS.replace("k: 0.3", "k: 0.35"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    updated = material_table(path)
+    assert updated is not table
+    assert updated.k[updated.id("fr4")] == 0.35
+
+
+def test_mesh_uses_uint8_ids() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    table = material_table()
+    assert mat_idx.dtype == np.uint8
+    assert np.all(mat_idx[z_centres < 0.000035] == table.id("copper"))
+    assert table.k[mat_idx].shape == mat_idx.shape
+    with pytest.raises(ValueError):
+        table.id("unobtainium")
+
+
+def test_name_grids_are_still_accepted() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    names = np.array(material_table().names, dtype=object)[mat_idx]
+    assert np.array_equal(material_ids(names), mat_idx)
+    args = (r_centres, dr, z_centres, dz)
+    _, T_ids = solve_transient_2d(*args, mat_idx, 1e5, 20, 5e-6)
+    _, T_names = solve_transient_2d(*args, names, 1e5, 20, 5e-6)
+    assert np.array_equal(T_ids, T_names)
+
+
+def test_lookup_interpolates_tabulated_curves(tmp_path) -> None:
+    path = tmp_path / "materials.yaml"
+    path.write_text(TABULATED)
+    table = material_table(path)
+    assert table.temperature_dependent
+    assert np.isclose(table.k[0], np.interp(25.0, [0, 200, 600], [410, 380, 330]))
+
+    lookup = PropertyLookup(table)
+    T = np.array([[-50.0, 0.0, 137.5, 450.0, 900.0]] * 2)
+    mat_ids = np.array([[0] * 5, [1] * 5], dtype=np.uint8)
+    k, rho_cp = lookup.evaluate(mat_ids, T)
+    expected_k = np.interp(T[0], [0, 200, 600], [410, 380, 330])
+    expected_cp = np.interp(T[0], [0, 600], [380, 440])
+    assert np.allclose(k[0], expected_k, rtol=1e-3)
+    assert np.allclose(rho_cp[0], 8960.0 * expected_cp, rtol=1e-6)
+    assert np.all(k[1] == 0.3)
+    assert np.all(rho_cp[1] == 1900.0 * 1200.0)
+
+
+def test_temperature_dependent_run(tmp_path) -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    args = (r_centres, dr, z_centres, dz, mat_idx, 2e7, 50, 1e-4, None, 25.0)
+    flat = tmp_path / "flat.yaml"
+    flat.write_text(MATERIALS.replace("k: 400.0", "k: [[0, 400.0], [900, 400.0]]"))
+    constant = tmp_path / "constant.yaml"
+    constant.write_text(MATERIALS)
+    options = {"scheme": "implicit"}
+    _, T_const = solve_transient_2d(
+        *args, materials=material_table(constant), **options
+    )
+    _, T_flat = solve_transient_2d(*args, materials=material_table(flat), **options)
+    assert np.allclose(T_flat, T_const, rtol=1e-12)
+
+    falling = tmp_path / "falling.yaml"
+    falling.write_text(MATERIALS.replace("k: 400.0", "k: [[25, 400.0], [125, 100.0]]"))
+    table = material_table(falling)
+    _, T_every = solve_transient_2d(*args, materials=table, **options)
+    _, T_tenth = solve_transient_2d(*args, materials=table, refresh_every=10, **options)
+    assert T_every[-1, 0, 0] > T_const[-1, 0, 0] + 1.0
+    assert np.allclose(T_tenth[-1] - 25.0, T_every[-1] - 25.0, rtol=0.05, atol=0.1)
@@ -0,0 +1,85 @@
+import time
+
+import numpy as np
+import pytest
+
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.progress import BackgroundRun, CancelToken, Cancelled, ThrottledProgress
+from laserpad.solver import solve_transient, solve_transient_2d
+
+
+def test_throttled_progress_forwards_first_and_last() -> None:
+    calls = []
+    throttled = ThrottledProgress(lambda i, n: calls.append(i), interval=60.0)
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 10)
+    solve_transient(
+        r_centres, dr, 5e4, 200.0, 2e6, 0.002, 1e-5, cache=False, progress_cb=throttled
+    )
+    assert calls == [1, 200]
+
+    every = ThrottledProgress(lambda i, n: calls.append(i), interval=0.0)
+    for i in range(1, 4):
+        every(i, 3)
+    assert calls[-3:] == [1, 2, 3]
+
+
+def test_cancel_token_stops_run_with_partial_result() -> None:
+    token = CancelToken()
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 10)
+
+    def cancel_at(i: int, total: int) -> None:
+        if i == 50:
+            token.cancel()
+
+    with pytest.raises(Cancelled) as info:
+        solve_transient(
+            r_centres,
+            dr,
+            5e4,
+            200.0,
+            2e6,
+            0.01,
+            1e-5,
+            probes={"inner": r_centres[0]},
+            cache=False,
+            cancel=token,
+            progress_cb=cancel_at,
+        )
+    partial = info.value.result
+    assert partial is not None
+    assert len(partial.probe_times) == 51
+    assert np.isclose(partial.probe_times[-1], 50 * 1e-5)
+
+    with pytest.raises(Cancelled):
+        solve_transient(
+            r_centres,
+            dr,
+            5e4,
+            200.0,
+            2e6,
+            0.01,
+            1e-5,
+            scheme="implicit",
+            adaptive=True,
+            cache=False,
+            cancel=token,
+        )
+
+
+def test_background_run_completes_and_cancels() -> None:
+    mesh = build_stack_mesh(0.001, 0.002, 10, 0.000035, 0.0002, 6)
+    job = BackgroundRun(solve_transient_2d, *mesh, 1e5, 40, 5e-6, cache=False)
+    result = job.result(timeout=30.0)
+    assert job.done and job.fraction == 1.0
+    assert result.T.shape[0] == 41
+    assert job.status_text().startswith("Iteration 40/40")
+
+    slow = BackgroundRun(
+        solve_transient_2d, *mesh, 1e5, 10**6, 5e-6, cache=False, save_times=[0.0]
+    )
+    while slow.progress[0] == 0:
+        time.sleep(0.001)
+    slow.cancel()
+    with pytest.raises(Cancelled):
+        slow.result(timeout=30.0)
+    assert slow.fraction < 1.0
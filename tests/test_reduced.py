@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from laserpad.beam_profiles import gaussian_beam
+from laserpad.geometry import build_stack_mesh
+from laserpad.reduced import ReducedStackModel
+from laserpad.solver import solve_transient_2d
+from laserpad.waveforms import Waveform
+
+
+@pytest.fixture(scope="module")
+def stack():
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.0005, 0.0015, 30, 0.000035, 0.0002, 20
+    )
+    trace_mask = np.ones((8, len(r_centres)), dtype=bool)
+    args = (r_centres, dr, z_centres, dz, mat_idx, 2e7, 300, 2e-5)
+    options = dict(
+        heat_source=lambda r: gaussian_beam(r, 5e5, 0.0008),
+        T0=40.0,
+        trace_mask=trace_mask,
+        h_trace=1e4,
+    )
+    return args, options, ReducedStackModel.build(*args, **options)
+
+
+def test_surrogate_tracks_full_model_for_new_waveform(stack) -> None:
+    args, options, model = stack
+    assert model.n_modes < 40
+    assert model.training_error < 0.05
+    pulses = Waveform.pulse_train(1.5e-3, 4e-4, 4, rise=1e-4)
+    probes = {"pad": (0.0005, 0.0)}
+    reduced = model.predict(pulses, probes=probes, save_every=100)
+    full = solve_transient_2d(
+        *args, **options, scheme="implicit", power=pulses, probes=probes
+    )
+    assert reduced.T.shape == (4,) + full.T.shape[1:]
+    assert np.allclose(reduced.probes["pad"], full.probes["pad"], atol=0.05)
+    assert np.allclose(reduced.T[-1], full.T[-1], atol=0.05)
+
+
+def test_error_estimate_bounds_true_error(stack) -> None:
+    _, _, model = stack
+    ramp = Waveform(np.array([0.0, 3e-3, 6e-3]), np.array([0.0, 1.5, 0.0]))
+    error, bound = model.validate(ramp)
+    assert error <= bound
+    estimate = model.predict(ramp).error_estimate
+    assert estimate is not None and np.all(np.diff(estimate) >= 0)
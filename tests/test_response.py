@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.response import StepResponse
+from laserpad.solver import solve_transient, solve_transient_2d
+from laserpad.waveforms import Waveform
+
+
+def test_superposition_matches_direct_stack_runs() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.0005, 0.0015, 20, 0.000035, 0.0002, 10
+    )
+    args = (r_centres, dr, z_centres, dz, mat_idx, 2e7, 300, 2e-5)
+    options = dict(
+        trace_mask=np.ones((8, len(r_centres)), dtype=bool),
+        h_trace=1e4,
+        scheme="implicit",
+    )
+    probes = {"pad": (0.0005, 0.0), "rim": (0.0015, 0.0002)}
+    response = StepResponse.compute(solve_transient_2d, *args, probes=probes, **options)
+
+    recipes = [
+        Waveform.pulse_train(1.5e-3, 4e-4, 3, rise=1e-4, peak=1.3),
+        Waveform(np.array([0.0, 2e-3, 6e-3]), np.array([0.0, 2.0, 0.5])),
+    ]
+    predicted = response.respond(recipes)
+    assert predicted["pad"].shape == (301, 2)
+    for i, power in enumerate(recipes):
+        direct = solve_transient_2d(*args, probes=probes, power=power, **options)
+        for name in probes:
+            assert np.allclose(predicted[name][:, i], direct.probes[name], atol=1e-9)
+
+    window = response.process_window("pad", [0.5, 1.5], [1e-3, 1.7e-3])
+    pulse = Waveform(np.array([0.0, 1.7e-3, 1.7e-3]), np.array([1.5, 1.5, 0.0]))
+    direct = solve_transient_2d(*args, probes=probes, power=pulse, **options)
+    assert np.isclose(window[1, 1], np.max(direct.probes["pad"]))
+    assert window[0, 0] < window[1, 0] < window[1, 1]
+
+
+def test_radial_step_response() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    args = (r_centres, dr, 5e4, 200.0, 2.0e6, 0.01, 1e-4)
+    response = StepResponse.compute(
+        solve_transient, *args, probes={"inner": 0.001}, scheme="crank-nicolson"
+    )
+    ramp = Waveform(np.array([0.0, 0.01]), np.array([0.0, 1.0]))
+    direct = solve_transient(
+        *args, probes={"inner": 0.001}, scheme="crank-nicolson", power=ramp
+    )
+    assert np.allclose(response.respond(ramp)["inner"], direct.probes["inner"])
+    with pytest.raises(ValueError):
+        StepResponse.compute(
+            solve_transient, *args, probes={"inner": 0.001}, T0=30.0, T_inf=25.0
+        )
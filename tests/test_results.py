@@ -0,0 +1,51 @@
+import numpy as np
+
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.results import output_steps
+from laserpad.solver import solve_transient, solve_transient_2d
+
+
+def test_output_steps_schedule() -> None:
+    times = np.arange(0.0, 1.05, 0.1)
+    assert list(output_steps(times)) == list(range(11))
+    assert list(output_steps(times, save_every=4)) == [0, 4, 8, 10]
+    assert list(output_steps(times, save_times=[0.0, 0.32, 0.36, 5.0])) == [
+        0,
+        3,
+        4,
+        10,
+    ]
+
+
+def test_decimated_1d_matches_full_history() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    args = (r_centres, dr, 5e4, 200.0, 2.0e6, 0.01, 1e-5)
+    full = solve_transient(*args)
+    sparse = solve_transient(
+        *args, save_every=250, probes={"inner": 0.001, "outer": 0.002}
+    )
+    assert sparse.T.shape == (5, len(r_centres))
+    assert np.allclose(sparse.times, full.times[[0, 250, 500, 750, 1000]])
+    assert np.array_equal(sparse.T[-1], full.T[-1])
+    assert np.array_equal(sparse.probe_times, full.times)
+    assert np.array_equal(sparse.probes["inner"], full.T[:, 0])
+    assert np.array_equal(sparse.probes["outer"], full.T[:, -1])
+
+
+def test_2d_probes_and_save_times() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 8, 0.000035, 0.0002, 6
+    )
+    args = (r_centres, dr, z_centres, dz, mat_idx, 5e4, 40, 5e-6)
+    full = solve_transient_2d(*args)
+    result = solve_transient_2d(
+        *args,
+        save_times=[1e-4, 2e-4],
+        probes={"pad": (0.001, 0.0), "fr4_underside": (0.001, 0.000235)},
+    )
+    times, T = result
+    assert T.shape == (2, 6, 8)
+    assert np.allclose(times, [1e-4, 2e-4])
+    assert np.array_equal(T[-1], full.T[-1])
+    assert np.array_equal(result.probes["pad"], full.T[:, 0, 0])
+    assert np.array_equal(result.probes["fr4_underside"], full.T[:, -1, 0])
@@ -0,0 +1,66 @@
+import numpy as np
+
+from laserpad.geometry import (
+    SectorSymmetry,
+    TraceCoverage,
+    build_stack_mesh,
+    build_stack_mesh_with_traces,
+    load_traces,
+)
+from laserpad.materials import material_table
+from laserpad.solver import solve_transient_2d, solve_transient_3d
+
+MESH = (0.001, 0.002, 10, 0.000035, 0.0002, 6)
+
+
+def test_symmetry_detection() -> None:
+    coverage = TraceCoverage.from_traces(load_traces("sample_traces.json"))
+    sector = SectorSymmetry.detect(coverage.cell_fractions(360))
+    assert (sector.period, sector.mirror, sector.n_cells) == (180, True, 90)
+    fractions = coverage.cell_fractions(360)
+    assert np.array_equal(sector.expand(fractions[sector.cells]), fractions)
+
+    lopsided = TraceCoverage.from_traces([(0, 30), (100, 110)])
+    assert SectorSymmetry.detect(lopsided.cell_fractions(36)).n_cells == 36
+    assert SectorSymmetry.detect(np.zeros(36)).n_cells == 1
+
+
+def test_axisymmetric_case_matches_2d() -> None:
+    r, dr, z, dz, mat_idx = build_stack_mesh(*MESH)
+    args = (r, dr, z, dz, mat_idx, 1e6, 40, 5e-6)
+    _, T_2d = solve_transient_2d(*args)
+    result = solve_transient_3d(*args, n_theta=36)
+    assert result.T.shape == (41, 1, 6, 10)
+    assert np.allclose(result.T[:, 0], T_2d, rtol=1e-12)
+    full = solve_transient_3d(*args, n_theta=36, symmetry=False)
+    assert np.allclose(full.T, result.sector.expand(result.T, axis=1), rtol=1e-12)
+
+
+def test_trace_sectors_reduce_and_conserve_energy() -> None:
+    traces = load_traces("sample_traces.json")
+    r, dr, z, dz, mat_idx, mask = build_stack_mesh_with_traces(*MESH, traces, 72)
+    q_flux, h_trace, n_t, dt = 1e6, 2e5, 200, 5e-6
+    args = (r, dr, z, dz, mat_idx, q_flux, n_t, dt)
+    probes = {"under": (r[-1], 0.0, 45.0), "between": (r[-1], 0.0, 135.0)}
+    reduced = solve_transient_3d(*args, trace_mask=mask, h_trace=h_trace, probes=probes)
+    full = solve_transient_3d(
+        *args, trace_mask=mask, h_trace=h_trace, symmetry=False, probes=probes
+    )
+    assert reduced.T.shape[1] == 18 and full.T.shape[1] == 72
+    assert np.allclose(
+        reduced.sector.expand(reduced.T[-1]), full.T[-1], rtol=1e-12, atol=1e-12
+    )
+    for name in probes:
+        assert np.allclose(reduced.probes[name], full.probes[name])
+    assert reduced.probes["between"][-1] > reduced.probes["under"][-1]
+
+    dtheta = 2 * np.pi / 72
+    rho_cp = material_table().rho_cp[mat_idx]
+    capacity = rho_cp * r * dr * dz * dtheta
+    T = full.T
+    energy_stored = np.sum(capacity * (T[-1] - 25.0))
+    r_inner, r_outer = r[0] - dr / 2, r[-1] + dr / 2
+    energy_in = q_flux * 2 * np.pi * r_inner * (z[-1] + dz / 2) * full.times[-1]
+    rim = mask[:, -1][:, None] * h_trace * r_outer * dtheta * dz
+    energy_lost = sum(np.sum(rim * (T[n, :, :, -1] - 25.0)) * dt for n in range(n_t))
+    assert np.isclose(energy_in, energy_stored + energy_lost, rtol=1e-9)
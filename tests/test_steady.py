@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from laserpad.geometry import TraceCoverage, build_radial_mesh, build_stack_mesh
+from laserpad.materials import material_table
+from laserpad.solver import solve_steady, solve_steady_2d, solve_transient_2d
+
+TRACES = TraceCoverage.from_traces([(0.0, 90.0)])
+FALLING = (
+    "copper: {k: [[25, 400.0], [125, 100.0]], rho: 8960.0, cp: 385.0}\n"
+    "fr4: {k: 0.3, rho: 1900.0, cp: 1200.0}\n"
+)
+
+
+def test_radial_steady_state_matches_analytic_profile() -> None:
+    r_in, r_out, q, k, h = 0.001, 0.003, 5e4, 200.0, 1e4
+    r_centres, dr = build_radial_mesh(r_in, r_out, 50, growth=1.03)
+    T = solve_steady(r_centres, dr, [q, 2 * q], k, h_out=h)
+    exact = 25.0 + q * r_in / (h * r_out) + q * r_in / k * np.log(r_out / r_centres)
+    assert T.shape == (2, 50)
+    assert np.allclose(T[0], exact, atol=2e-3 * np.max(exact - 25.0))
+    assert np.allclose(T[1] - 25.0, 2 * (T[0] - 25.0))
+
+    with pytest.raises(ValueError, match="h_out"):
+        solve_steady(r_centres, dr, q, k, h_out=0.0)
+
+
+def test_stack_steady_state_matches_long_transient() -> None:
+    mesh = build_stack_mesh(0.001, 0.002, 20, 0.000035, 0.0002, (4, 10), growth=1.05)
+    T = solve_steady_2d(*mesh, 1e5, trace_mask=TRACES, h_trace=1e5)
+    result = solve_transient_2d(
+        *mesh,
+        1e5,
+        60,
+        100.0,
+        trace_mask=TRACES,
+        h_trace=1e5,
+        scheme="implicit",
+        save_every=60,
+    )
+    assert np.allclose(T, result.T[-1], rtol=0.0, atol=1e-8)
+
+    r_centres, dr, _, dz, _ = mesh
+    r_outer = r_centres[-1] + dr[-1] / 2
+    sink = 2 * np.pi * 0.25 * 1e5 * np.sum((T[:, -1] - 25.0) * r_outer * dz)
+    heat_in = 1e5 * 2 * np.pi * (r_centres[0] - dr[0] / 2) * np.sum(dz)
+    assert np.isclose(sink, heat_in, rtol=1e-9)
+
+    batch = solve_steady_2d(*mesh, 1e5, trace_mask=TRACES, h_trace=[1e5, 2e5])
+    assert batch.shape == (2,) + T.shape and np.allclose(batch[0], T)
+    with pytest.raises(ValueError, match="heat sink"):
+        solve_steady_2d(*mesh, 1e5)
+
+
+def test_stack_steady_state_iterates_temperature_dependent_k(tmp_path) -> None:
+    path = tmp_path / "materials.yaml"
+    path.write_text(FALLING)
+    table = material_table(path)
+    mesh = build_stack_mesh(0.001, 0.002, 10, 0.000035, 0.0002, (3, 6))
+    options = dict(trace_mask=TRACES, h_trace=1e5)
+    T = solve_steady_2d(*mesh, 2e5, materials=table, **options)
+    result = solve_transient_2d(
+        *mesh, 2e5, 100, 100.0, materials=table, scheme="implicit", **options
+    )
+    assert np.allclose(T, result.T[-1], rtol=0.0, atol=1e-6)
+    assert T[0, 0] > solve_steady_2d(*mesh, 2e5, **options)[0, 0]
+
+    with pytest.raises(RuntimeError, match="converge"):
+        solve_steady_2d(*mesh, 2e5, materials=table, max_iter=1, **options)
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import numpy as np
+
+from laserpad.geometry import build_stack_mesh
+from laserpad.solver import solve_transient_2d
+from laserpad.store import FrameStore, FrameWriter
+
+
+def test_writer_reader_round_trip(tmp_path: Path) -> None:
+    frames = np.arange(7 * 2 * 3, dtype=float).reshape(7, 2, 3)
+    with FrameWriter(tmp_path / "run", (2, 3), chunk_frames=3) as writer:
+        for n, frame in enumerate(frames):
+            writer.append(0.1 * n, frame)
+
+    store = FrameStore(tmp_path / "run")
+    assert store.shape == (7, 2, 3)
+    assert np.allclose(store.times, 0.1 * np.arange(7))
+    assert np.array_equal(store[4], frames[4])
+    assert np.array_equal(store[-1], frames[-1])
+    assert np.array_equal(store[1:6], frames[1:6])
+    assert np.array_equal(store[[5, 0, 3]], frames[[5, 0, 3]])
+    assert np.array_equal(store.series(1, 2), frames[:, 1, 2])
+    assert np.array_equal(np.asarray(store), frames)
+
+
+def test_solver_streams_frames_to_disk(tmp_path: Path) -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 8, 0.000035, 0.0002, 6
+    )
+    args = (r_centres, dr, z_centres, dz, mat_idx, 5e4, 150, 5e-6)
+    in_memory = solve_transient_2d(*args)
+    times, T = solve_transient_2d(*args, store=tmp_path / "stack")
+
+    assert isinstance(T, FrameStore)
+    assert T.shape == in_memory.T.shape
+    assert np.array_equal(times, T.times)
+    assert np.array_equal(T[-1], in_memory.T[-1])
+    assert np.array_equal(T[:, 0, 0], in_memory.T[:, 0, 0])
+    assert T.metadata["dt"] == 5e-6
+    assert T.metadata["materials"]["copper"]["k"] == 400.0
+    assert np.allclose(T.metadata["z_centres"], z_centres)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from laserpad.sweep import (
+    OUTCOMES,
+    main,
+    parameter_grid,
+    read_table,
+    run_case,
+    run_sweep,
+)
+
+SMALL = {"n_r": 10, "n_z": 6, "n_t": 40, "dt": 1e-4, "threshold": 60.0}
+
+
+def test_sweep_over_process_pool_matches_single_cases(tmp_path) -> None:
+    cases = parameter_grid(
+        SMALL, power_W=[5.0, 20.0], traces=[[], [(0, 180)]], beam=[None, "gaussian"]
+    )
+    for case in cases:
+        case["beam_q"] = 1e5
+    table = run_sweep(cases, max_workers=2, path=tmp_path / "sweep.csv")
+    assert list(table)[-len(OUTCOMES) :] == list(OUTCOMES)
+    assert len(table["peak_T"]) == 8
+    for i, case in enumerate(cases):
+        expected = run_case(case)
+        for name in OUTCOMES:
+            assert np.isclose(table[name][i], expected[name], equal_nan=True)
+
+    # More power runs hotter and melts sooner; only traces remove energy.
+    assert np.all(table["peak_T"][4:] > table["peak_T"][:4])
+    assert np.all(~(table["t_threshold"][4:] >= table["t_threshold"][:4]))
+    assert np.all(table["energy_lost"][table["traces"] == "[]"] == 0.0)
+    assert np.all(np.abs(table["energy_error"]) < 0.05)
+
+    on_disk = read_table(tmp_path / "sweep.csv")
+    assert np.allclose(on_disk["peak_T"], table["peak_T"])
+    assert np.array_equal(on_disk["beam"], table["beam"])
+
+
+def test_closed_stack_conserves_energy() -> None:
+    outcome = run_case({**SMALL, "beam": "donut", "beam_q": 1e5})
+    assert outcome["energy_lost"] == 0.0
+    assert abs(outcome["energy_error"]) < 1e-9
+
+
+def test_unknown_parameter_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        run_case({"laser_power": 10.0})
+
+
+def test_console_script_writes_npz(tmp_path) -> None:
+    config = tmp_path / "sweep.yaml"
+    config.write_text(
+        "base: {n_r: 10, n_z: 6, n_t: 20}\ngrid:\n  h_trace: [1000.0, 50000.0]\n"
+        "  traces: [[[0, 90]]]\n"
+    )
+    main([str(config), "-o", str(tmp_path / "out.npz"), "-j", "1"])
+    table = read_table(tmp_path / "out.npz")
+    assert np.array_equal(table["h_trace"], [1000.0, 50000.0])
+    assert table["energy_lost"][1] > table["energy_lost"][0]
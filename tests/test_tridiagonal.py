@@ -0,0 +1,49 @@
+import numpy as np
+from laserpad.tridiagonal import BlockTridiagonalSolver, TridiagonalSolver
+
+
+def _dense(lower: np.ndarray, diag: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    return np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+
+
+def test_single_system_matches_dense() -> None:
+    rng = np.random.default_rng(0)
+    n = 12
+    lower = -rng.random(n)
+    upper = -rng.random(n)
+    diag = 2.5 + rng.random(n)
+    rhs = rng.random(n)
+    x = TridiagonalSolver(lower, diag, upper).solve(rhs)
+    assert np.allclose(_dense(lower, diag, upper) @ x, rhs)
+
+
+def test_batched_systems_along_axis() -> None:
+    rng = np.random.default_rng(1)
+    n, m = 9, 4
+    lower = -rng.random((n, m))
+    upper = -rng.random((n, m))
+    diag = 2.5 + rng.random((n, m))
+    rhs = rng.random((m, n))
+    x = TridiagonalSolver(lower, diag, upper).solve(rhs, axis=1)
+    for j in range(m):
+        A = _dense(lower[:, j], diag[:, j], upper[:, j])
+        assert np.allclose(A @ x[j], rhs[j])
+
+
+def test_block_system_matches_dense() -> None:
+    rng = np.random.default_rng(2)
+    m, b = 5, 4
+    lower = -rng.random((m, b))
+    upper = -rng.random((m, b))
+    blocks = -0.1 * rng.random((m, b, b)) + 4.0 * np.eye(b)
+    A = np.zeros((m * b, m * b))
+    for j in range(m):
+        A[j * b : (j + 1) * b, j * b : (j + 1) * b] = blocks[j]
+        if j > 0:
+            A[j * b : (j + 1) * b, (j - 1) * b : j * b] = np.diag(lower[j])
+        if j < m - 1:
+            A[j * b : (j + 1) * b, (j + 1) * b : (j + 2) * b] = np.diag(upper[j])
+    rhs = rng.random((3, m, b))
+    x = BlockTridiagonalSolver(lower, blocks, upper).solve(rhs)
+    for n in range(3):
+        assert np.allclose(A @ x[n].ravel(), rhs[n].ravel())
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from laserpad.beam_profiles import gaussian_beam
+from laserpad.geometry import build_radial_mesh, build_stack_mesh
+from laserpad.solver import solve_transient, solve_transient_2d
+from laserpad.waveforms import Waveform
+
+
+def test_pulse_train_schedule_conserves_energy() -> None:
+    pulses = Waveform.pulse_train(1e-3, 2e-4, 3, delay=1e-4, rise=5e-5, peak=2.0)
+    assert pulses(0.0) == 0.0
+    assert pulses(2e-4) == 2.0
+    assert np.isclose(pulses(1.25e-4), 1.0)
+    # Steps far longer than a pulse still deliver every pulse's energy.
+    times = np.linspace(0.0, 4e-3, 3)
+    energy = np.sum(pulses.schedule(times) * np.diff(times))
+    assert np.isclose(energy, 3 * 2.0 * (2e-4 - 5e-5))
+    with pytest.raises(ValueError):
+        Waveform.pulse_train(1e-3, 2e-3, 3)
+
+
+def test_waveform_from_csv(tmp_path) -> None:
+    path = tmp_path / "recipe.csv"
+    path.write_text("time_s,power_W\n0,0\n0.01,20\n0.03,20\n0.04,0\n")
+    recipe = Waveform.from_csv(path, scale=1 / 20)
+    assert np.allclose(recipe([0.005, 0.02, 0.05]), [0.5, 1.0, 0.0])
+    assert np.isclose(recipe.integral(0.04), 0.03)
+
+
+def test_constant_waveform_scales_heat_input() -> None:
+    r_centres, dr = build_radial_mesh(0.001, 0.002, 20)
+    args = (r_centres, dr, 5e4, 200.0, 2.0e6, 0.01, 1e-4)
+
+    def source(r: np.ndarray) -> np.ndarray:
+        return gaussian_beam(r, 1e5, 0.0015)
+
+    _, T_full = solve_transient(*args, source, scheme="implicit")
+    _, T_half = solve_transient(
+        *args, source, scheme="implicit", power=Waveform.constant(0.5)
+    )
+    assert np.allclose(T_half - 25.0, 0.5 * (T_full - 25.0))
+
+
+@pytest.mark.parametrize("scheme", ["explicit", "adi", "implicit"])
+def test_ramp_on_stack_matches_stepped_runs(scheme: str) -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    args = (r_centres, dr, z_centres, dz, mat_idx)
+    off_after = Waveform(np.array([0.0, 5e-4, 5e-4]), np.array([1.0, 1.0, 0.0]))
+    result = solve_transient_2d(*args, 1e6, 200, 5e-6, scheme=scheme, power=off_after)
+    _, T_on = solve_transient_2d(*args, 1e6, 100, 5e-6, scheme=scheme)
+    assert np.allclose(result.T[100], T_on[-1])
+    # With the laser off the stack only redistributes heat: no further rise
+    # at the heated inner rim.
+    assert np.all(np.diff(result.T[100:, :, 0], axis=0) <= 1e-12)
+
+
+def test_adaptive_run_resolves_pulses() -> None:
+    r_centres, dr, z_centres, dz, mat_idx = build_stack_mesh(
+        0.001, 0.002, 10, 0.000035, 0.0002, 6
+    )
+    args = (r_centres, dr, z_centres, dz, mat_idx, 1e6, 400, 1e-5)
+    pulses = Waveform.pulse_train(1e-3, 3e-4, 4)
+    fixed = solve_transient_2d(*args, scheme="implicit", power=pulses)
+    adaptive = solve_transient_2d(
+        *args, scheme="implicit", power=pulses, adaptive=True, atol=1e-3
+    )
+    assert np.allclose(adaptive.T[-1], fixed.T[-1], atol=0.05)